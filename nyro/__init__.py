@@ -16,6 +16,10 @@ __author__ = "Jerry ⚡ G.Music Assembly Team"
 from .core.client import RedisClient
 from .core.profiles import ProfileManager
 from .core.operations import RedisOperations
+from .core.aio import AsyncRedisClient, AsyncRedisOperations
 from .cli.interactive import InteractiveCLI
 
-__all__ = ["RedisClient", "ProfileManager", "RedisOperations", "InteractiveCLI"]
\ No newline at end of file
+__all__ = [
+    "RedisClient", "ProfileManager", "RedisOperations", "InteractiveCLI",
+    "AsyncRedisClient", "AsyncRedisOperations",
+]
\ No newline at end of file
@@ -14,7 +14,7 @@ from typing import Optional, Dict, Any
 import json
 from pathlib import Path
 
-from ..core.client import RedisClient  
+from ..core.client import RedisClient, RedisConnectionError
 from ..core.profiles import ProfileManager
 from ..core.operations import RedisOperations
 from ..musical.ledger import MusicalLedger
@@ -274,12 +274,18 @@ class InteractiveCLI:
             
             if choice == '1':
                 pattern = input("Enter pattern (default *): ").strip() or "*"
-                keys = self.client.scan_keys(pattern)
-                print(f"\\n🔑 Found {len(keys)} keys matching '{pattern}':")
-                for key in keys[:20]:  # Limit display
-                    print(f"  - {key}")
-                if len(keys) > 20:
-                    print(f"  ... and {len(keys) - 20} more")
+                print(f"\\n🔑 Keys matching '{pattern}':")
+                total = 0
+                try:
+                    for key in self.client.scan_iter(pattern):
+                        if total < 20:  # Limit display, keep counting
+                            print(f"  - {key}")
+                        total += 1
+                except RedisConnectionError as e:
+                    print(f"❌ Scan interrupted: {e}")
+                if total > 20:
+                    print(f"  ... and {total - 20} more")
+                print(f"🔑 Found {total} keys")
                 self.musical_ledger.add_team_activity("♠️", "scan_keys", f"Scanned pattern: {pattern}")
                 
             elif choice == '2':
@@ -307,22 +313,33 @@ class InteractiveCLI:
                 print("Pattern examples: user:*, *:config, temp:*")
                 pattern = input("Enter search pattern: ").strip()
                 if pattern:
-                    keys = self.client.scan_keys(pattern)
-                    print(f"\\n🎯 Pattern '{pattern}' matches {len(keys)} keys:")
-                    for key in keys:
-                        value_preview = ""
-                        value = self.client.get_key(key)
-                        if value and len(str(value)) > 50:
-                            value_preview = f" = {str(value)[:50]}..."
-                        elif value:
-                            value_preview = f" = {value}"
-                        print(f"  🔑 {key}{value_preview}")
+                    print(f"\\n🎯 Keys matching '{pattern}':")
+                    total = 0
+                    try:
+                        for page in self.operations.preview_pages(pattern, page_size=20):
+                            for entry in page:
+                                print(f"  🔑 {entry['key']}{self._format_preview(entry)}")
+                            total += len(page)
+                            if len(page) < 20 or input("Enter for more, q to stop: ").strip().lower() == 'q':
+                                break
+                    except RedisConnectionError as e:
+                        print(f"❌ Search interrupted: {e}")
+                    print(f"🎯 Shown {total} keys")
                     
             elif choice == 'b':
                 break
             else:
                 print("❌ Invalid option")
     
+    def _format_preview(self, entry: Dict[str, Any]) -> str:
+        """Render one preview_keys entry as ' = value...' or ' (type)'."""
+        if entry['preview'] is None:
+            return f" ({entry['type']})" if entry['type'] else ""
+        text = entry['preview'].replace('\n', ' ')
+        if entry['truncated']:
+            return f" = {text}... ({entry['size']} bytes)"
+        return f" = {text}" if text else ""
+    
     def handle_profile_management(self) -> None:
         """Handle profile management."""
         while True:
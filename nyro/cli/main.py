@@ -14,7 +14,7 @@ import argparse
 from typing import Optional
 
 from .interactive import InteractiveCLI
-from ..core.client import RedisClient
+from ..core.client import RedisClient, RedisConnectionError
 from ..core.profiles import ProfileManager
 from ..core.operations import RedisOperations
 from ..musical.ledger import MusicalLedger
@@ -44,8 +44,8 @@ def create_parser() -> argparse.ArgumentParser:
     set_parser.add_argument('key', help='Key name')
     set_parser.add_argument('value', help='Key value')
     
-    get_parser = subparsers.add_parser('get', help='Get Redis key')
-    get_parser.add_argument('key', help='Key name')
+    get_parser = subparsers.add_parser('get', help='Get Redis key(s)')
+    get_parser.add_argument('key', nargs='+', help='Key name(s); several keys are fetched in one MGET')
     
     del_parser = subparsers.add_parser('del', help='Delete Redis key')
     del_parser.add_argument('key', help='Key name')
@@ -54,6 +54,8 @@ def create_parser() -> argparse.ArgumentParser:
     scan_parser = subparsers.add_parser('scan', help='Scan Redis keys')
     scan_parser.add_argument('pattern', nargs='?', default='*', help='Search pattern')
     scan_parser.add_argument('--garden', '-g', action='store_true', help='Garden scan with categories')
+    scan_parser.add_argument('--count', '-c', type=int, default=100, help='Keys per SCAN page')
+    scan_parser.add_argument('--type', '-t', help='Only keys of this type (string, list, stream...)')
     
     # List operations
     list_parser = subparsers.add_parser('list', help='List operations')
@@ -80,6 +82,26 @@ def create_parser() -> argparse.ArgumentParser:
     diary_parser.add_argument('--mood', '-m', help='Mood (for add)')
     diary_parser.add_argument('--count', '-c', type=int, default=10, help='Entries to read')
     
+    tail_parser = stream_subparsers.add_parser('tail', help='Print new stream entries as they arrive')
+    tail_parser.add_argument('streams', nargs='+', help='Streams to follow')
+    tail_parser.add_argument('--from', dest='from_id', default='$',
+                             help='Start after this id ($ = only new entries, 0 = from the beginning)')
+    tail_parser.add_argument('--count', '-c', type=int, default=100, help='Entries per read')
+    tail_parser.add_argument('--block', '-b', type=float, default=5.0, help='Seconds each read waits for entries')
+    
+    # Massive payloads (streamed, replaces redis-rest.sh set-massive)
+    payload_parser = subparsers.add_parser('payload', help='Stream massive payloads to and from Redis')
+    payload_subparsers = payload_parser.add_subparsers(dest='payload_command')
+    
+    payload_put_parser = payload_subparsers.add_parser('put', help='Store stdin (or --file) under a key')
+    payload_put_parser.add_argument('key', help='Payload key')
+    payload_put_parser.add_argument('--file', '-f', help='Read from this file instead of stdin')
+    payload_put_parser.add_argument('--chunk-size', '-c', type=int, default=1024*1024, help='Chunk size in bytes')
+    
+    payload_get_parser = payload_subparsers.add_parser('get', help='Write a stored payload to stdout (or --file)')
+    payload_get_parser.add_argument('key', help='Payload key')
+    payload_get_parser.add_argument('--file', '-f', help='Write to this file instead of stdout')
+    
     # Profile management
     profile_parser = subparsers.add_parser('profiles', help='Profile management')
     profile_parser.add_argument('action', choices=['list', 'switch', 'current'], help='Profile action')
@@ -111,18 +133,38 @@ def handle_basic_operations(args, client: RedisClient, musical_ledger: Optional[
                 data_size = len(str(args.value))
                 musical_ledger.add_redis_operation('SET', args.key, data_size)
         else:
-            print(f"❌ Failed to set {args.key}")
+            print(f"❌ Failed to set {args.key}" + (f": {client.last_error}" if client.last_error else ""))
             sys.exit(1)
             
     elif args.command == 'get':
-        value = client.get_key(args.key)
+        if len(args.key) > 1:
+            values = client.get_many(args.key)
+            if client.last_error:
+                print(f"❌ Could not read keys: {client.last_error}", file=sys.stderr)
+                sys.exit(1)
+            for key, value in zip(args.key, values):
+                if value is None:
+                    print(f"❌ Key '{key}' not found", file=sys.stderr)
+                    continue
+                print(f"{key} = {value}")
+                if musical_ledger:
+                    musical_ledger.add_redis_operation('GET', key, len(value))
+            if None in values:
+                sys.exit(1)
+            return
+        
+        key = args.key[0]
+        value = client.get_key(key)
         if value is not None:
             print(value)
             if musical_ledger:
                 data_size = len(str(value)) if value else 0
-                musical_ledger.add_redis_operation('GET', args.key, data_size)
+                musical_ledger.add_redis_operation('GET', key, data_size)
+        elif client.last_error:
+            print(f"❌ Could not read '{key}': {client.last_error}", file=sys.stderr)
+            sys.exit(1)
         else:
-            print(f"❌ Key '{args.key}' not found", file=sys.stderr)
+            print(f"❌ Key '{key}' not found", file=sys.stderr)
             sys.exit(1)
             
     elif args.command == 'del':
@@ -132,14 +174,14 @@ def handle_basic_operations(args, client: RedisClient, musical_ledger: Optional[
             if musical_ledger:
                 musical_ledger.add_redis_operation('DEL', args.key, 0)
         else:
-            print(f"❌ Failed to delete {args.key}")
+            print(f"❌ Failed to delete {args.key}" + (f": {client.last_error}" if client.last_error else ""))
             sys.exit(1)
 
 
 def handle_scanning(args, client: RedisClient, operations: RedisOperations, musical_ledger: Optional[MusicalLedger]) -> None:
     """Handle scanning operations."""
     if args.garden:
-        result = operations.scan_garden(args.pattern)
+        result = operations.scan_garden(args.pattern, args.count)
         print(f"🌿 Garden Scan Results for '{args.pattern}':")
         print(f"Total keys: {result['total_keys']}")
         
@@ -155,10 +197,12 @@ def handle_scanning(args, client: RedisClient, operations: RedisOperations, musi
         if musical_ledger:
             musical_ledger.add_team_activity("♠️", "garden_scan", f"CLI garden scan: {args.pattern}")
     else:
-        keys = client.scan_keys(args.pattern)
-        print(f"🔑 Found {len(keys)} keys matching '{args.pattern}':")
-        for key in keys:
-            print(key)
+        # Stream keys as SCAN pages arrive instead of collecting the whole keyspace
+        total = 0
+        for key in client.scan_iter(args.pattern, args.count, type=args.type):
+            print(key, flush=True)
+            total += 1
+        print(f"🔑 Found {total} keys matching '{args.pattern}'", file=sys.stderr)
             
         if musical_ledger:
             musical_ledger.add_team_activity("♠️", "scan_keys", f"CLI scan: {args.pattern}")
@@ -224,6 +268,55 @@ def handle_stream_operations(args, operations: RedisOperations, musical_ledger:
                     musical_ledger.add_team_activity("🌿", "diary_read", f"CLI read: {args.name}")
             else:
                 print(f"📭 No entries found in {args.name}")
+                
+    elif args.stream_command == 'tail':
+        mode = 'blocking reads' if operations.client.supports_blocking() else 'polling over REST'
+        print(f"👀 Tailing {', '.join(args.streams)} ({mode}), Ctrl+C to stop")
+        if musical_ledger:
+            musical_ledger.add_team_activity("🌊", "stream_tail", f"CLI tail: {', '.join(args.streams)[:30]}")
+        last_ids = {name: args.from_id for name in args.streams}
+        try:
+            for entry in operations.tail(args.streams, last_ids, block=args.block, count=args.count):
+                fields = ' '.join(f"{field}={value}" for field, value in entry['fields'].items())
+                print(f"🌊 {entry['stream']} {entry['id']} {fields}", flush=True)
+        except KeyboardInterrupt:
+            print("\n🛑 Stopped tailing")
+
+
+def handle_payload_operations(args, operations: RedisOperations, musical_ledger: Optional[MusicalLedger]) -> None:
+    """Handle streamed payload transfer; status goes to stderr so stdout carries only data."""
+    if args.payload_command == 'put':
+        try:
+            if args.file:
+                with open(args.file, 'rb') as f:
+                    size = operations.store_stream(args.key, f, args.chunk_size)
+            else:
+                size = operations.store_stream(args.key, sys.stdin.buffer, args.chunk_size)
+        except (RedisConnectionError, OSError) as e:
+            print(f"❌ Failed to store payload {args.key}: {e}", file=sys.stderr)
+            sys.exit(1)
+        stats = operations.get_transfer_stats()
+        print(f"📦 Stored {size} bytes in {stats['chunks']} chunks under {args.key} "
+              f"({stats['mb_per_s']:.1f} MB/s)", file=sys.stderr)
+        if musical_ledger:
+            musical_ledger.add_redis_operation('SET', args.key, size)
+            
+    elif args.payload_command == 'get':
+        try:
+            if args.file:
+                with open(args.file, 'wb') as f:
+                    size = operations.load_stream(args.key, f)
+            else:
+                size = operations.load_stream(args.key, sys.stdout.buffer)
+                sys.stdout.buffer.flush()
+        except (RedisConnectionError, ValueError, OSError) as e:
+            print(f"❌ Failed to load payload {args.key}: {e}", file=sys.stderr)
+            sys.exit(1)
+        if size is None:
+            print(f"❌ Payload '{args.key}' not found", file=sys.stderr)
+            sys.exit(1)
+        if musical_ledger:
+            musical_ledger.add_redis_operation('GET', args.key, size)
 
 
 def handle_init_command(args) -> None:
@@ -261,6 +354,21 @@ KV_REST_API_TOKEN=your_redis_token_here
 
 # Nyro Configuration
 TEMP_DIR=/tmp/nyro-temp
+# NYRO_POOL_SIZE=10              # Keep-alive connections per profile
+# NYRO_TRANSPORT=auto            # redis:// URLs: auto (native RESP) or cli (redis-cli)
+# NYRO_RESP_PROTOCOL=2           # 3 negotiates RESP3 via HELLO
+# NYRO_CACHE_SIZE=0              # get_key client-side cache entries (0 = off)
+# NYRO_CACHE_TTL=30              # Seconds a cached value stays fresh (0 = until invalidated)
+# NYRO_CACHE_TRACKING=false      # redis:// only: server-assisted invalidation (CLIENT TRACKING)
+# NYRO_RETRIES=2                 # Extra attempts for idempotent commands on timeouts/5xx
+# NYRO_RETRY_BACKOFF=0.1         # First backoff in seconds (doubles, with jitter)
+# NYRO_RETRY_MAX_BACKOFF=2.0     # Backoff ceiling in seconds
+# NYRO_BREAKER_THRESHOLD=5       # Consecutive failures before failing fast (0 = off)
+# NYRO_BREAKER_RESET=30          # Seconds before a probe request is let through
+# NYRO_TIMEOUT=30                # Per-command timeout in seconds (REST, RESP and redis-cli)
+# NYRO_HEDGE_AFTER=0             # Duplicate reads slower than this many seconds (0 = off)
+# NYRO_COMPRESSION=none          # zlib, or zstd/lz4 with pip install nyro[compression]
+# NYRO_COMPRESSION_THRESHOLD=1024  # Values smaller than this many bytes stay uncompressed
 """
     
     with open(env_file, 'w') as f:
@@ -371,6 +479,9 @@ def main():
         elif args.command == 'stream':
             handle_stream_operations(args, operations, musical_ledger)
             
+        elif args.command == 'payload':
+            handle_payload_operations(args, operations, musical_ledger)
+            
         elif args.command == 'profiles':
             handle_profile_management(args, profile_manager, musical_ledger)
             
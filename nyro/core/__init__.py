@@ -5,5 +5,10 @@ Core Nyro modules for Redis operations and profile management.
 from .client import RedisClient
 from .profiles import ProfileManager  
 from .operations import RedisOperations
+from .pipeline import Pipeline
+from .aio import AsyncRedisClient, AsyncRedisOperations
 
-__all__ = ["RedisClient", "ProfileManager", "RedisOperations"]
\ No newline at end of file
+__all__ = [
+    "RedisClient", "ProfileManager", "RedisOperations", "Pipeline",
+    "AsyncRedisClient", "AsyncRedisOperations",
+]
\ No newline at end of file
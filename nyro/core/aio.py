@@ -0,0 +1,737 @@
+"""
+Asyncio Redis Client Module
+🧵 Synth: Non-blocking twins of RedisClient and RedisOperations
+
+For services running nyro inside an event loop:
+- AsyncRedisClient: set/get/delete/scan over REST or native RESP
+- AsyncRedisOperations: lists, streams and massive payloads
+- Keep-alive connection pools that serve many in-flight requests at once
+
+Profiles come from the same ProfileManager as the blocking client.
+"""
+
+import asyncio
+import json
+import ssl
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from urllib.parse import urlparse, quote
+
+from .profiles import ProfileManager, ProfileConfig
+from .errors import RedisConnectionError, RedisCommandError
+from .transport import encode_rest_args, decode_base64_result
+from .pipeline import Pipeline
+from .resp import (
+    RespError, RespProtocolError, SimpleString,
+    encode_command, decode_reply, parse_redis_url
+)
+from .codec import ValueCodec
+from .transfer import PAYLOAD_BATCH_BYTES, CHUNK_REFETCH_ATTEMPTS, chunk_batches, chunk_checksum
+from .operations import build_payload_chunks, assemble_payload_chunks, decode_cas_chunk, decode_payload_body
+from .dedup import CHUNK_REFS_KEY, DEDUP_AVG_CHUNK, chunk_key
+from .versions import RETIRED_VERSIONS_KEY, chunk_prefix, payload_version, retired_member, swap_pointer_command
+
+
+class AsyncHTTPPool:
+    """Minimal HTTP/1.1 keep-alive client for the Upstash REST API."""
+
+    def __init__(self, url: str, max_connections: int = 10, timeout: float = 30.0):
+        """Initialize pool for an http:// or https:// base URL."""
+        parsed = urlparse(url)
+        self.use_tls = parsed.scheme == 'https'
+        self.host = parsed.hostname or 'localhost'
+        self.port = parsed.port or (443 if self.use_tls else 80)
+        self.base_path = parsed.path.rstrip('/')
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self._idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.stats = {'requests': 0, 'hits': 0, 'misses': 0}
+
+    async def _acquire(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter, bool]:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_connections)
+        await self._semaphore.acquire()
+        self.stats['requests'] += 1
+        while self._idle:
+            reader, writer = self._idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                self.stats['hits'] += 1
+                return reader, writer, True
+            writer.close()
+
+        self.stats['misses'] += 1
+        try:
+            context = ssl.create_default_context() if self.use_tls else None
+            reader, writer = await asyncio.open_connection(
+                self.host, self.port, ssl=context,
+                server_hostname=self.host if self.use_tls else None
+            )
+        except Exception:
+            self._semaphore.release()
+            raise
+        return reader, writer, False
+
+    def _release(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, reusable: bool) -> None:
+        if reusable:
+            self._idle.append((reader, writer))
+        else:
+            writer.close()
+        self._semaphore.release()
+
+    async def _read_response(self, reader: asyncio.StreamReader) -> Tuple[int, Dict[str, str], bytes]:
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionError("Connection closed by server")
+        status = int(status_line.split()[1])
+
+        headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            parts = []
+            while True:
+                size = int((await reader.readline()).split(b';')[0], 16)
+                if size == 0:
+                    await reader.readline()
+                    break
+                parts.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            body = b''.join(parts)
+        else:
+            body = await reader.readexactly(int(headers.get('content-length', 0)))
+        return status, headers, body
+
+    async def post(self, path: str, headers: Dict[str, str], body: bytes) -> Tuple[int, Dict[str, str], bytes]:
+        """POST to path on a pooled connection and return (status, headers, body)."""
+        target = f"{self.base_path}{path}" or '/'
+        request_head = [
+            f"POST {target} HTTP/1.1",
+            f"Host: {self.host}",
+            f"Content-Length: {len(body)}",
+            "Connection: keep-alive",
+        ]
+        request_head.extend(f"{name}: {value}" for name, value in headers.items())
+        request = ('\r\n'.join(request_head) + '\r\n\r\n').encode('latin-1') + body
+
+        for attempt in range(2):
+            reader, writer, reused = await self._acquire()
+            reusable = False
+            try:
+                writer.write(request)
+                await writer.drain()
+                status, response_headers, response_body = await asyncio.wait_for(
+                    self._read_response(reader), self.timeout
+                )
+                reusable = response_headers.get('connection', '').lower() != 'close'
+                return status, response_headers, response_body
+            except (ConnectionError, asyncio.IncompleteReadError):
+                # Server closed an idle keep-alive connection - retry once on a fresh one
+                if attempt or not reused:
+                    raise
+            finally:
+                self._release(reader, writer, reusable)
+        raise ConnectionError("Unreachable")
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get connection reuse counters."""
+        stats = dict(self.stats)
+        stats['pool_size'] = self.max_connections
+        return stats
+
+    async def close(self) -> None:
+        """Close idle connections."""
+        for _, writer in self._idle:
+            writer.close()
+        self._idle.clear()
+
+
+class AsyncRespConnection:
+    """Single asyncio stream connection speaking RESP."""
+
+    def __init__(self, host: str, port: int = 6379, username: Optional[str] = None,
+                 password: Optional[str] = None, db: int = 0, use_tls: bool = False,
+                 protocol: int = 2, timeout: Optional[float] = 30.0):
+        """Store connection parameters; the stream opens on connect()."""
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.db = db
+        self.use_tls = use_tls
+        self.protocol = protocol
+        self.timeout = timeout
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.reused = False
+
+    async def connect(self) -> None:
+        """Open the stream, then authenticate and select db."""
+        context = ssl.create_default_context() if self.use_tls else None
+        self.reader, self.writer = await asyncio.wait_for(
+            asyncio.open_connection(
+                self.host, self.port, ssl=context,
+                server_hostname=self.host if self.use_tls else None
+            ),
+            self.timeout
+        )
+        try:
+            if self.protocol == 3:
+                hello = ['HELLO', '3']
+                if self.password:
+                    hello.extend(['AUTH', self.username or 'default', self.password])
+                if isinstance(await self.execute(*hello, raise_errors=False), RespError):
+                    self.protocol = 2
+            if self.protocol == 2 and self.password:
+                auth = [self.username, self.password] if self.username else [self.password]
+                await self.execute('AUTH', *auth)
+            if self.db:
+                await self.execute('SELECT', str(self.db))
+        except Exception:
+            self.disconnect()
+            raise
+
+    def disconnect(self) -> None:
+        """Close the stream."""
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = None
+        self.writer = None
+
+    @property
+    def is_connected(self) -> bool:
+        """True while the stream is open."""
+        return self.writer is not None and not self.writer.is_closing()
+
+    async def _read_line(self) -> bytes:
+        line = await self.reader.readline()
+        if not line:
+            raise ConnectionError("Connection closed by server")
+        if not line.endswith(b'\r\n'):
+            raise RespProtocolError(f"Unterminated line: {line!r}")
+        return line[:-2]
+
+    async def _read_exact(self, length: int) -> bytes:
+        return (await self.reader.readexactly(length + 2))[:-2]
+
+    async def _read_reply(self) -> Any:
+        """Async mirror of RespReader.read_reply()."""
+        line = await self._read_line()
+        prefix, body = line[:1], line[1:]
+        if prefix == b'+':
+            return SimpleString(body.decode('utf-8', errors='replace'))
+        if prefix == b'-':
+            return RespError(body.decode('utf-8', errors='replace'))
+        if prefix in (b':', b'('):
+            return int(body)
+        if prefix == b'$':
+            length = int(body)
+            return None if length < 0 else await self._read_exact(length)
+        if prefix in (b'*', b'~', b'>'):
+            length = int(body)
+            return None if length < 0 else [await self._read_reply() for _ in range(length)]
+        if prefix == b'%':
+            result = {}
+            for _ in range(int(body)):
+                key = await self._read_reply()
+                result[key] = await self._read_reply()
+            return result
+        if prefix == b'_':
+            return None
+        if prefix == b'#':
+            return body == b't'
+        if prefix == b',':
+            return float(body)
+        if prefix == b'!':
+            return RespError((await self._read_exact(int(body))).decode('utf-8', errors='replace'))
+        if prefix == b'=':
+            return (await self._read_exact(int(body)))[4:]
+        if prefix == b'|':
+            for _ in range(int(body) * 2):
+                await self._read_reply()
+            return await self._read_reply()
+        raise RespProtocolError(f"Unknown reply type: {prefix!r}")
+
+    async def read_reply(self, raise_errors: bool = True) -> Any:
+        """Read one reply, raising RespError for error replies by default."""
+        reply = await asyncio.wait_for(self._read_reply(), self.timeout)
+        if raise_errors and isinstance(reply, RespError):
+            raise reply
+        return reply
+
+    async def execute(self, *args: Any, raise_errors: bool = True) -> Any:
+        """Send a command and wait for its reply."""
+        self.writer.write(encode_command(args))
+        await self.writer.drain()
+        return await self.read_reply(raise_errors)
+
+
+class AsyncRespPool:
+    """Pool of asyncio RESP connections for one profile."""
+
+    def __init__(self, url: str, max_connections: int = 10, protocol: int = 2,
+                 timeout: Optional[float] = 30.0):
+        """Initialize pool for a redis:// or rediss:// URL."""
+        self.connection_kwargs = parse_redis_url(url)
+        self.connection_kwargs.update({'protocol': protocol, 'timeout': timeout})
+        self.max_connections = max_connections
+        self._idle: List[AsyncRespConnection] = []
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.stats = {'requests': 0, 'hits': 0, 'misses': 0}
+
+    async def _acquire(self) -> AsyncRespConnection:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_connections)
+        await self._semaphore.acquire()
+        self.stats['requests'] += 1
+        while self._idle:
+            connection = self._idle.pop()
+            if connection.is_connected:
+                self.stats['hits'] += 1
+                connection.reused = True
+                return connection
+        self.stats['misses'] += 1
+        connection = AsyncRespConnection(**self.connection_kwargs)
+        try:
+            await connection.connect()
+        except Exception:
+            self._semaphore.release()
+            raise
+        return connection
+
+    def _release(self, connection: AsyncRespConnection) -> None:
+        if connection.is_connected:
+            self._idle.append(connection)
+        self._semaphore.release()
+
+    async def execute_many(self, commands: List[List[Any]]) -> List[Any]:
+        """Pipeline commands on one connection; error replies come back in place."""
+        for attempt in range(2):
+            connection = await self._acquire()
+            try:
+                connection.writer.write(b''.join(encode_command(tuple(cmd)) for cmd in commands))
+                await connection.writer.drain()
+                return [await connection.read_reply(raise_errors=False) for _ in commands]
+            except asyncio.TimeoutError:
+                # Reply may still arrive later; never resend it. (TimeoutError is
+                # an OSError from 3.11, so this must come before the retry below.)
+                connection.disconnect()
+                raise
+            except (OSError, ConnectionError, asyncio.IncompleteReadError, RespProtocolError):
+                connection.disconnect()
+                if attempt or not connection.reused:
+                    raise
+            finally:
+                self._release(connection)
+        raise ConnectionError("Unreachable")
+
+    async def execute(self, *args: Any) -> Any:
+        """Run one command on a pooled connection."""
+        reply = (await self.execute_many([list(args)]))[0]
+        if isinstance(reply, RespError):
+            raise reply
+        return reply
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get connection reuse counters."""
+        stats = dict(self.stats)
+        stats['pool_size'] = self.max_connections
+        return stats
+
+    async def close(self) -> None:
+        """Close idle connections."""
+        for connection in self._idle:
+            connection.disconnect()
+        self._idle.clear()
+
+
+class AsyncPipeline(Pipeline):
+    """Pipeline whose execute() is awaited; use with `async with`."""
+
+    async def __aenter__(self) -> 'AsyncPipeline':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None and self.commands:
+            await self.execute()
+        self.commands = []
+
+    async def execute(self, raise_on_error: bool = False) -> List[Any]:
+        """Send all queued commands and return their results in order."""
+        commands, self.commands = self.commands, []
+        if not commands:
+            self.results = []
+            return self.results
+
+        self.results = await self.client._execute_pipeline(commands, transaction=self.transaction)
+        if raise_on_error:
+            for result in self.results:
+                if isinstance(result, Exception):
+                    raise result
+        return self.results
+
+
+class AsyncRedisClient:
+    """Asyncio Redis client with the same surface as RedisClient."""
+
+    def __init__(self, profile_manager: Optional[ProfileManager] = None):
+        """Initialize async client with profile manager."""
+        self.profile_manager = profile_manager or ProfileManager()
+        self._pools: Dict[str, Any] = {}
+        self._pool_signatures: Dict[str, tuple] = {}
+        # Reads detect compressed values by their header, whatever wrote them
+        self.codec = ValueCodec()
+
+    def _get_current_config(self) -> ProfileConfig:
+        """Get current profile configuration."""
+        config = self.profile_manager.get_current_profile()
+        if not config:
+            raise RedisConnectionError("No active profile. Use switch_profile() first.")
+        return config
+
+    def _is_rest_url(self, url: str) -> bool:
+        """Check if URL is REST API endpoint."""
+        return urlparse(url).scheme in ('http', 'https')
+
+    def _get_pool(self, config: ProfileConfig) -> Any:
+        """Get the connection pool for a profile, creating it on first use.
+
+        Pools are bound to the running event loop, so a new loop gets new pools.
+        """
+        loop = asyncio.get_running_loop()
+        signature = (config.url, config.pool_size, config.resp_protocol, config.timeout, id(loop))
+        pool = self._pools.get(config.name)
+        if pool is not None and self._pool_signatures.get(config.name) == signature:
+            return pool
+
+        if self._is_rest_url(config.url):
+            pool = AsyncHTTPPool(config.url, max_connections=config.pool_size, timeout=config.timeout)
+        elif config.transport == 'cli':
+            raise RedisConnectionError("AsyncRedisClient needs the REST or native RESP transport, not redis-cli.")
+        else:
+            try:
+                pool = AsyncRespPool(config.url, max_connections=config.pool_size,
+                                     protocol=config.resp_protocol, timeout=config.timeout)
+            except ValueError as e:
+                raise RedisConnectionError(f"Invalid Redis URL: {e}")
+        self._pools[config.name] = pool
+        self._pool_signatures[config.name] = signature
+        return pool
+
+    async def _rest_post(self, config: ProfileConfig, path: str, body: Any,
+                         raw_body: Optional[bytes] = None, base64_results: bool = False) -> Tuple[int, Any]:
+        pool = self._get_pool(config)
+        token_cleaned = config.token.strip('\'"').strip()
+        headers = {
+            'Authorization': f'Bearer {token_cleaned}',
+            'Content-Type': 'application/octet-stream' if raw_body is not None else 'application/json'
+        }
+        if base64_results:
+            headers['Upstash-Encoding'] = 'base64'
+        data = raw_body if raw_body is not None else json.dumps(body).encode('utf-8')
+        try:
+            status, _, raw = await pool.post(path, headers, data)
+            reply = json.loads(raw) if raw else None
+        except (OSError, ConnectionError, asyncio.IncompleteReadError, asyncio.TimeoutError, ValueError) as e:
+            raise RedisConnectionError(f"REST API error: {e}")
+        if status >= 500 or status in (401, 403):
+            raise RedisConnectionError(f"REST API error: HTTP {status}")
+        return status, reply
+
+    async def execute_command(self, *args: Any, raw: bool = False) -> Any:
+        """Execute any command; raw=True returns string results as bytes."""
+        config = self._get_current_config()
+
+        if self._is_rest_url(config.url):
+            try:
+                status, reply = await self._rest_post(config, '', encode_rest_args(args), base64_results=raw)
+            except UnicodeDecodeError:
+                # Binary final argument goes in the request body (POST /SET/key)
+                *head, tail = args
+                try:
+                    path = '/' + '/'.join(quote(part, safe='') for part in encode_rest_args(head))
+                except UnicodeDecodeError:
+                    raise RedisConnectionError("Only the last argument may be binary on REST profiles.")
+                status, reply = await self._rest_post(config, path, None, raw_body=bytes(tail),
+                                                      base64_results=raw)
+            if status != 200 or (isinstance(reply, dict) and 'error' in reply):
+                raise RedisCommandError(reply.get('error') if isinstance(reply, dict) else f"HTTP {status}")
+            result = reply.get('result')
+            return decode_base64_result(result) if raw else result
+
+        pool = self._get_pool(config)
+        try:
+            reply = await pool.execute(*args)
+            return reply if raw else decode_reply(reply)
+        except RespError as e:
+            raise RedisCommandError(str(e))
+        except (OSError, ConnectionError, asyncio.IncompleteReadError,
+                asyncio.TimeoutError, RespProtocolError) as e:
+            raise RedisConnectionError(f"Redis connection error: {e}")
+
+    async def _execute_pipeline(self, commands: List[List[Any]], transaction: bool = False) -> List[Any]:
+        """Execute a batch of commands in one round trip."""
+        config = self._get_current_config()
+
+        if self._is_rest_url(config.url):
+            endpoint = '/multi-exec' if transaction else '/pipeline'
+            try:
+                body = [encode_rest_args(command) for command in commands]
+            except UnicodeDecodeError:
+                raise RedisConnectionError("Binary values cannot be batched over REST; use execute_command() per value.")
+            status, replies = await self._rest_post(config, endpoint, body)
+            if status == 400 or isinstance(replies, dict):
+                raise RedisCommandError((replies or {}).get('error', 'Batch rejected'))
+            return [
+                RedisCommandError(reply['error']) if 'error' in reply else reply.get('result')
+                for reply in replies
+            ]
+
+        pool = self._get_pool(config)
+        batch = [['MULTI']] + commands + [['EXEC']] if transaction else commands
+        try:
+            replies = await pool.execute_many(batch)
+        except (OSError, ConnectionError, asyncio.IncompleteReadError,
+                asyncio.TimeoutError, RespProtocolError) as e:
+            raise RedisConnectionError(f"Redis connection error: {e}")
+
+        if transaction:
+            exec_reply = replies[-1]
+            if isinstance(exec_reply, RespError) or exec_reply is None:
+                queue_errors = [r for r in replies[:-1] if isinstance(r, RespError)]
+                raise RedisCommandError(str(queue_errors[0] if queue_errors else exec_reply or 'Transaction aborted'))
+            replies = exec_reply
+
+        return [
+            RedisCommandError(str(reply)) if isinstance(reply, RespError) else decode_reply(reply)
+            for reply in replies
+        ]
+
+    def pipeline(self) -> AsyncPipeline:
+        """Create a command pipeline; use with `async with` to send on exit."""
+        return AsyncPipeline(self)
+
+    def transaction(self) -> AsyncPipeline:
+        """Create an atomic MULTI/EXEC batch; use with `async with` to commit on exit."""
+        return AsyncPipeline(self, transaction=True)
+
+    def switch_profile(self, profile_name: str) -> bool:
+        """Switch to specified profile."""
+        return self.profile_manager.switch_profile(profile_name)
+
+    def get_current_profile_name(self) -> Optional[str]:
+        """Get current profile name."""
+        return self.profile_manager.current_profile
+
+    def get_pool_stats(self) -> Dict[str, int]:
+        """Get connection reuse counters for the current profile."""
+        pool = self._pools.get(self._get_current_config().name)
+        return pool.get_stats() if pool else {'requests': 0, 'hits': 0, 'misses': 0, 'pool_size': 0}
+
+    async def close(self) -> None:
+        """Close all pooled connections held by this client."""
+        for pool in self._pools.values():
+            await pool.close()
+        self._pools.clear()
+        self._pool_signatures.clear()
+
+    async def test_connection(self) -> bool:
+        """Test connection to current Redis instance."""
+        try:
+            return await self.execute_command('PING') == 'PONG'
+        except RedisConnectionError:
+            return False
+
+    async def set_key(self, key: str, value: str) -> bool:
+        """Set a Redis key-value pair."""
+        try:
+            return await self.execute_command('SET', key, value) == 'OK'
+        except RedisConnectionError:
+            return False
+
+    async def get_key(self, key: str) -> Optional[str]:
+        """Get value for Redis key, decompressing values stored with compression on."""
+        try:
+            value = await self.execute_command('GET', key, raw=True)
+            return None if value is None else decode_reply(self.codec.decode(value))
+        except (RedisConnectionError, ValueError):
+            return None
+
+    async def delete_key(self, key: str) -> bool:
+        """Delete a Redis key."""
+        try:
+            return await self.execute_command('DEL', key) > 0
+        except RedisConnectionError:
+            return False
+
+    async def scan_iter(self, pattern: str = '*', count: int = 100,
+                        type: Optional[str] = None) -> AsyncIterator[str]:
+        """Asynchronously iterate over every key matching pattern, page by page."""
+        cursor = '0'
+        while True:
+            command = ['SCAN', cursor, 'MATCH', pattern, 'COUNT', str(count)]
+            if type:
+                command.extend(['TYPE', type])
+            cursor, keys = await self.execute_command(*command)
+            cursor = str(cursor)
+            for key in keys or []:
+                yield key
+            if cursor == '0':
+                break
+
+    async def scan_keys(self, pattern: str = '*', count: int = 100) -> List[str]:
+        """Scan Redis keys with pattern (first cursor page only; see scan_iter)."""
+        try:
+            cursor, keys = await self.execute_command('SCAN', '0', 'MATCH', pattern, 'COUNT', str(count))
+            return keys
+        except RedisConnectionError:
+            return []
+
+
+class AsyncRedisOperations:
+    """Asyncio twin of RedisOperations for lists, streams and massive payloads."""
+
+    def __init__(self, client: AsyncRedisClient):
+        """Initialize with async Redis client."""
+        self.client = client
+
+    async def push_list(self, list_name: str, element: str, direction: str = "left") -> bool:
+        """Push element to Redis list (LPUSH/RPUSH)."""
+        try:
+            command = 'LPUSH' if direction == "left" else 'RPUSH'
+            return await self.client.execute_command(command, list_name, element) > 0
+        except Exception:
+            return False
+
+    async def read_list(self, list_name: str, start: int = 0, stop: int = -1) -> List[str]:
+        """Read from Redis list (LRANGE)."""
+        try:
+            return await self.client.execute_command('LRANGE', list_name, str(start), str(stop)) or []
+        except Exception:
+            return []
+
+    async def stream_add(self, stream_name: str, fields: Dict[str, str], stream_id: str = "*") -> Optional[str]:
+        """Add entry to Redis stream (XADD)."""
+        if 'timestamp' not in fields:
+            fields['timestamp'] = datetime.now().isoformat()
+
+        command = ['XADD', stream_name, stream_id]
+        for field, value in fields.items():
+            command.extend([field, str(value)])
+        try:
+            return await self.client.execute_command(*command)
+        except Exception:
+            return None
+
+    async def stream_read(self, stream_name: str, count: int = 10, start_id: str = "-") -> List[Dict[str, Any]]:
+        """Read from Redis stream (XRANGE) as entry dicts."""
+        try:
+            raw = await self.client.execute_command('XRANGE', stream_name, start_id, '+', 'COUNT', str(count))
+        except Exception:
+            return []
+        entries = []
+        for stream_id, flat_fields in raw or []:
+            flat_fields = flat_fields or []
+            fields = {flat_fields[j]: flat_fields[j + 1] for j in range(0, len(flat_fields) - 1, 2)}
+            entries.append({'id': stream_id, 'fields': fields})
+        return entries
+
+    async def store_massive_payload(self, key: str, payload: Dict[str, Any], chunk_size: int = 1024*1024) -> bool:
+        """Store massive payload, committing a new chunk version and the pointer swap in one transaction."""
+        try:
+            payload_json, chunks, metadata = build_payload_chunks(payload, chunk_size)
+            if not chunks:
+                if not await self.client.set_key(key, payload_json):
+                    return False
+                previous = await self.client.execute_command(*swap_pointer_command(key, None))
+                await self._release_manifest(previous)
+                return True
+
+            version = metadata['version'] = payload_version(metadata['checksums'])
+            prefix = chunk_prefix(key, version)
+            async with self.client.transaction() as tx:
+                tx.command('ZREM', RETIRED_VERSIONS_KEY, retired_member(key, version, len(chunks)))
+                for i, chunk in enumerate(chunks):
+                    tx.set_key(f"{prefix}{i}", chunk)
+                tx.command(*swap_pointer_command(key, metadata))
+            if not all(result == 'OK' for result in tx.results[1:-1]):
+                return False
+            await self._release_manifest(tx.results[-1])
+            return True
+        except Exception:
+            return False
+
+    async def _release_manifest(self, metadata_json: Any) -> None:
+        """Drop the chunk references of a replaced content-addressed manifest."""
+        try:
+            manifest = json.loads(metadata_json) if metadata_json else None
+        except ValueError:
+            return
+        if manifest and manifest.get('type') == 'cas_payload':
+            async with self.client.pipeline() as pipe:
+                for digest in dict.fromkeys(manifest['chunks']):
+                    pipe.command('HINCRBY', CHUNK_REFS_KEY, digest, -1)
+
+    async def load_massive_payload(self, key: str) -> Optional[Dict[str, Any]]:
+        """Load a chunked or content-addressed payload, fetching chunks as raw bytes in concurrent MGET batches.
+
+        Chunks that fail their checksum are re-read like the blocking loader does.
+        """
+        try:
+            direct_data = await self.client.get_key(key)
+            if direct_data:
+                return json.loads(direct_data)
+
+            metadata_json = await self.client.get_key(f"{key}:metadata")
+            if not metadata_json:
+                return None
+            metadata = json.loads(metadata_json)
+            if metadata.get('type') == 'cas_payload':
+                return await self._load_deduplicated(metadata)
+            if metadata.get('type') != 'chunked_payload':
+                return None
+
+            prefix = chunk_prefix(key, metadata.get('version', ''))
+            names = [f"{prefix}{i}" for i in range(metadata['total_chunks'])]
+            chunks = await self._fetch_raw(names, metadata.get('chunk_size', 1024 * 1024))
+            checksums = metadata.get('checksums')
+            for i, chunk in enumerate(chunks):
+                if checksums and (not chunk or chunk_checksum(chunk) != checksums[i]):
+                    chunks[i] = await self._refetch_chunk(names[i], checksums[i])
+                elif not chunk:
+                    return None
+            return assemble_payload_chunks(chunks, metadata)
+        except Exception:
+            return None
+
+    async def _refetch_chunk(self, name: str, checksum: str) -> bytes:
+        """Re-read a chunk that failed verification until it matches its checksum."""
+        for _ in range(CHUNK_REFETCH_ATTEMPTS):
+            value = await self.client.execute_command('GET', name, raw=True)
+            if value and chunk_checksum(value) == checksum:
+                return value
+        raise ValueError(f"Chunk {name} failed checksum verification")
+
+    async def _load_deduplicated(self, manifest: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch a manifest's chunks by hash into one preallocated buffer."""
+        digests = manifest['chunks']
+        values = await self._fetch_raw([chunk_key(digest) for digest in digests], DEDUP_AVG_CHUNK)
+        buffer = bytearray(manifest['total_size'])
+        offset = 0
+        for digest, size, value in zip(digests, manifest['sizes'], values):
+            buffer[offset:offset + size] = decode_cas_chunk(value, digest, size, self.client.codec)
+            offset += size
+        return decode_payload_body(buffer, self.client.codec)
+
+    async def _fetch_raw(self, names: List[str], chunk_size: int) -> List[Optional[bytes]]:
+        """MGET chunks as raw bytes (binary chunks survive), about PAYLOAD_BATCH_BYTES per request, all in flight."""
+        batches = chunk_batches(len(names), chunk_size, PAYLOAD_BATCH_BYTES)
+        replies = await asyncio.gather(*(
+            self.client.execute_command('MGET', *names[batch.start:batch.stop], raw=True) for batch in batches
+        ))
+        return [value for reply in replies for value in reply]
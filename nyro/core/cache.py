@@ -0,0 +1,208 @@
+"""
+Client-side Read Cache Module
+🧵 Synth: Serving repeated get_key reads without a round trip
+
+Provides:
+- KeyCache: bounded LRU cache with per-entry TTL and hit/eviction counters
+- TrackingListener: RESP connection receiving CLIENT TRACKING invalidations
+  so values changed by other clients are dropped as soon as Redis reports them
+"""
+
+import socket
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from .resp import RespConnection, RespConnectionPool, RespError
+
+
+INVALIDATE_CHANNEL = b'__redis__:invalidate'
+
+# Writes that change a value get_key may have cached
+SINGLE_KEY_WRITES = {
+    'SET', 'SETEX', 'PSETEX', 'SETNX', 'GETSET', 'GETDEL', 'GETEX', 'APPEND', 'SETRANGE',
+    'INCR', 'INCRBY', 'INCRBYFLOAT', 'DECR', 'DECRBY', 'EXPIRE', 'PEXPIRE', 'EXPIREAT',
+    'PEXPIREAT', 'PERSIST',
+}
+MULTI_KEY_WRITES = {'DEL', 'UNLINK'}
+FLUSH_COMMANDS = {'FLUSHDB', 'FLUSHALL'}
+
+
+def _text(arg: Any) -> str:
+    if isinstance(arg, (bytes, bytearray, memoryview)):
+        return bytes(arg).decode('utf-8', errors='replace')
+    return str(arg)
+
+
+def invalidate_written(cache: 'KeyCache', args: Sequence[Any]) -> None:
+    """Drop cached values for any keys the command is about to write."""
+    name = _text(args[0]).upper()
+    if name in SINGLE_KEY_WRITES:
+        keys = args[1:2]
+    elif name in MULTI_KEY_WRITES:
+        keys = args[1:]
+    elif name in ('MSET', 'MSETNX'):
+        keys = args[1::2]
+    elif name in ('RENAME', 'RENAMENX'):
+        keys = args[1:3]
+    elif name in ('EVAL', 'EVALSHA'):
+        # Scripts may write any key they declare
+        keys = args[3:3 + int(_text(args[2]))]
+    elif name in FLUSH_COMMANDS:
+        cache.clear()
+        return
+    else:
+        return
+    cache.invalidate(*(_text(key) for key in keys))
+
+
+class KeyCache:
+    """Thread-safe LRU cache of key values with TTL expiry."""
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 30.0):
+        """Initialize an empty cache; ttl <= 0 keeps entries until evicted."""
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.enabled = True
+        # Bumped by every invalidation so a read racing a write is not cached
+        self.version = 0
+        self._entries: 'OrderedDict[str, Tuple[Any, float]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0, 'invalidations': 0}
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Look up a key, returning (hit, value); a cached None means the key is absent."""
+        with self._lock:
+            entry = self._entries.get(key) if self.enabled else None
+            if entry is None:
+                self.stats['misses'] += 1
+                return False, None
+            value, expires_at = entry
+            if expires_at and expires_at <= time.monotonic():
+                del self._entries[key]
+                self.stats['expirations'] += 1
+                self.stats['misses'] += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.stats['hits'] += 1
+            return True, value
+
+    def set(self, key: str, value: Any, version: Optional[int] = None) -> None:
+        """Store a value, evicting the least recently used entry when full.
+
+        Pass the version seen before fetching the value; if an invalidation
+        arrived in between, the possibly stale value is not stored.
+        """
+        if not self.enabled or self.max_entries <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl if self.ttl > 0 else 0.0
+        with self._lock:
+            if version is not None and version != self.version:
+                return
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats['evictions'] += 1
+
+    def invalidate(self, *keys: str) -> None:
+        """Drop cached values for keys written by this or another client."""
+        with self._lock:
+            self.version += 1
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    self.stats['invalidations'] += 1
+
+    def clear(self) -> None:
+        """Drop every cached value."""
+        with self._lock:
+            self.version += 1
+            self.stats['invalidations'] += len(self._entries)
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit-rate and eviction counters."""
+        with self._lock:
+            stats: Dict[str, Any] = dict(self.stats)
+            stats['size'] = len(self._entries)
+        lookups = stats['hits'] + stats['misses']
+        stats['max_entries'] = self.max_entries
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        return stats
+
+
+class TrackingListener:
+    """Server-assisted invalidation for a KeyCache via CLIENT TRACKING.
+
+    A dedicated connection subscribes to the invalidation channel and every
+    pooled connection enables tracking with REDIRECT to it. If the listener
+    connection drops, the cache is cleared and disabled rather than risk
+    serving values that changed while invalidations were lost.
+    """
+
+    def __init__(self, pool: RespConnectionPool, cache: KeyCache):
+        """Bind the listener to a pool and the cache it keeps fresh."""
+        self.pool = pool
+        self.cache = cache
+        self.client_id: Optional[int] = None
+        self.connection: Optional[RespConnection] = None
+        self.error: Optional[str] = None
+        self._lock = threading.Lock()
+        self._stopped = False
+
+    def start(self) -> bool:
+        """Open the listener connection once; False if the server lacks tracking."""
+        with self._lock:
+            if self.client_id is not None or self.error is not None:
+                return self.client_id is not None
+            connection = RespConnection(**dict(self.pool.connection_kwargs, timeout=None))
+            try:
+                connection.connect()
+                client_id = connection.execute('CLIENT', 'ID')
+                connection.execute('SUBSCRIBE', INVALIDATE_CHANNEL)
+            except (OSError, ConnectionError, RespError) as e:
+                connection.disconnect()
+                self.error = str(e)
+                return False
+            self.connection = connection
+            self.client_id = client_id
+            thread = threading.Thread(target=self._listen, daemon=True)
+            thread.start()
+            return True
+
+    def enable_on(self, connection: RespConnection) -> None:
+        """Turn on tracking for a newly opened pool connection."""
+        if self.start():
+            connection.execute('CLIENT', 'TRACKING', 'ON', 'REDIRECT', str(self.client_id))
+
+    def _listen(self) -> None:
+        try:
+            while True:
+                message = self.connection.read_reply(raise_errors=False)
+                if not isinstance(message, list) or len(message) < 3:
+                    continue
+                if message[0] != b'message' or message[1] != INVALIDATE_CHANNEL:
+                    continue
+                keys = message[2]
+                if keys is None:
+                    # FLUSHALL / FLUSHDB: everything may have changed
+                    self.cache.clear()
+                else:
+                    self.cache.invalidate(*(key.decode('utf-8', errors='replace') for key in keys))
+        except Exception as e:
+            if not self._stopped:
+                self.error = str(e)
+                self.cache.enabled = False
+                self.cache.clear()
+
+    def stop(self) -> None:
+        """Close the listener connection."""
+        self._stopped = True
+        connection = self.connection
+        if connection is not None and connection.sock is not None:
+            try:
+                connection.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            connection.disconnect()
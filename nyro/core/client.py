@@ -8,21 +8,37 @@ Consolidates connection logic from:
 - All script Redis CLI and curl implementations
 """
 
-import requests
-import subprocess
 import os
-from typing import Optional, Any, Dict, List, Union
-from urllib.parse import urlparse
-import json
+from typing import Optional, Any, ContextManager, Dict, Iterator, List, Sequence, Tuple
 import tempfile
 from pathlib import Path
 
 from .profiles import ProfileManager, ProfileConfig
+from .sessions import SessionPool
+from .pipeline import Pipeline
+from .errors import (
+    RedisConnectionError, RedisCommandError, RedisTransientError, CircuitOpenError, DeadlineExceededError
+)
+from .cache import invalidate_written
+from .retry import is_idempotent, is_read_only
+from .deadline import Deadline, deadline_scope
+from .resp import decode_reply
+from .codec import ValueCodec, MAGIC
+from .transport import Transport, CliTransport, create_transport, transport_signature, is_rest_url
 
+# The error types are re-exported so callers can import them with RedisClient
+__all__ = [
+    'RedisClient', 'MANY_BATCH_KEYS', 'MANY_BATCH_BYTES',
+    'RedisConnectionError', 'RedisCommandError', 'RedisTransientError', 'CircuitOpenError', 'DeadlineExceededError',
+]
 
-class RedisConnectionError(Exception):
-    """Redis connection related errors."""
-    pass
+
+# get_many / set_many split larger requests into sub-batches of at most this size
+MANY_BATCH_KEYS = 500
+MANY_BATCH_BYTES = 1024 * 1024
+
+# Compressed values seen through a text reply (previews) start with the header's text form
+COMPRESSED_PREFIX = MAGIC.decode('ascii')
 
 
 class RedisClient:
@@ -31,6 +47,12 @@ class RedisClient:
     def __init__(self, profile_manager: Optional[ProfileManager] = None):
         """Initialize Redis client with profile manager."""
         self.profile_manager = profile_manager or ProfileManager()
+        self.session_pool = SessionPool()
+        self._transports: Dict[str, Transport] = {}
+        self._active_transport: Optional[Transport] = None
+        # Error swallowed by the last set_key/get_key/delete_key (None on success),
+        # so callers can tell "key missing" from "server unreachable"
+        self.last_error: Optional[RedisConnectionError] = None
         self.temp_dir = Path(tempfile.gettempdir()) / "nyro-temp"
         self.temp_dir.mkdir(exist_ok=True)
         
@@ -47,8 +69,26 @@ class RedisClient:
     
     def _is_rest_url(self, url: str) -> bool:
         """Check if URL is REST API endpoint."""
-        parsed = urlparse(url)
-        return parsed.scheme in ('http', 'https')
+        return is_rest_url(url)
+    
+    def _resolve_transport(self) -> Transport:
+        """Build (or reuse) the transport for the current profile."""
+        config = self._get_current_config()
+        transport = self._transports.get(config.name)
+        if transport is None or transport.signature != transport_signature(config):
+            if transport is not None:
+                transport.close()
+            transport = create_transport(config, self.session_pool)
+            self._transports[config.name] = transport
+        self._active_transport = transport
+        return transport
+    
+    def _transport(self) -> Transport:
+        """Get the current profile's transport, resolving it only after a profile switch."""
+        transport = self._active_transport
+        if transport is not None and transport.profile_name == self.profile_manager.current_profile:
+            return transport
+        return self._resolve_transport()
     
     def _execute_redis_cli(self, command: List[str]) -> str:
         """Execute Redis CLI command with proper TLS handling."""
@@ -57,99 +97,67 @@ class RedisClient:
         if self._is_rest_url(config.url):
             raise RedisConnectionError("Cannot use Redis CLI with REST API URL. Use REST methods instead.")
         
-        # Build Redis CLI command with TLS support
-        cli_cmd = ['redis-cli']
-        
-        if self._is_tls_url(config.url):
-            cli_cmd.extend(['--tls', '-u', config.url, '--no-auth-warning'])
-        else:
-            cli_cmd.extend(['-u', config.url, '--no-auth-warning'])
-        
-        cli_cmd.extend(command)
-        
-        try:
-            result = subprocess.run(
-                cli_cmd, 
-                capture_output=True, 
-                text=True, 
-                check=True
-            )
-            return result.stdout.strip()
-        except subprocess.CalledProcessError as e:
-            raise RedisConnectionError(f"Redis CLI error: {e.stderr}")
-        except FileNotFoundError:
-            raise RedisConnectionError("redis-cli not found. Install Redis CLI or use REST API methods.")
-    
-    def _execute_rest_api(self, endpoint: str, data: Optional[Dict] = None, method: str = 'POST') -> Any:
-        """Execute REST API call with proper authentication."""
-        config = self._get_current_config()
-        
-        if not self._is_rest_url(config.url):
-            raise RedisConnectionError("Cannot use REST API with Redis CLI URL. Use CLI methods instead.")
+        return CliTransport(config).run_cli(command, config.timeout)
+    
+    def execute_command(self, *args: Any, raw: bool = False, timeout: Optional[float] = None) -> Any:
+        """Execute any Redis command, e.g. execute_command('HSET', 'h', 'f', b'v').
         
-        # For Upstash, commands go to base URL directly
-        url = config.url.rstrip('/')
-        token_cleaned = config.token.strip('\'"').strip()
-        headers = {
-            'Authorization': f'Bearer {token_cleaned}',
-            'Content-Type': 'application/json'
-        }
+        Arguments may be str, int, float, bytes, bytearray or memoryview.
+        With raw=True, string results come back as bytes exactly as stored;
+        otherwise they are decoded as UTF-8. timeout overrides the profile's
+        per-command timeout (NYRO_TIMEOUT) and is still capped by any
+        enclosing deadline(). Error replies raise RedisCommandError;
+        transport failures raise RedisConnectionError.
+        """
+        if not args:
+            raise ValueError("Empty command")
+        transport = self._transport()
+        if transport.cache is not None:
+            invalidate_written(transport.cache, args)
+        return transport.run(lambda attempt_timeout: transport.execute(args, raw, attempt_timeout),
+                             is_idempotent(args), timeout, hedge=is_read_only(args))
+    
+    def _execute_pipeline(self, commands: List[List[Any]], transaction: bool = False) -> List[Any]:
+        """Execute a batch of commands in one round trip where the transport allows."""
+        transport = self._transport()
+        if transport.cache is not None:
+            for command in commands:
+                invalidate_written(transport.cache, command)
+        retryable = all(is_idempotent(command) for command in commands)
+        return transport.run(lambda attempt_timeout: transport.execute_many(commands, transaction, attempt_timeout),
+                             retryable)
+    
+    def deadline(self, seconds: Optional[float]) -> ContextManager[Optional[Deadline]]:
+        """Bound every command in a with-block by one time budget.
         
-        try:
-            if method.upper() == 'GET':
-                response = requests.get(url, headers=headers, timeout=30)
-            else:
-                # Upstash expects Redis commands as arrays
-                if endpoint == 'set' and data:
-                    command = ["SET", data['key'], data['value']]
-                elif endpoint == 'get' and data:
-                    command = ["GET", data['key']]
-                elif endpoint == 'del' and data:
-                    command = ["DEL", data['key']]
-                elif endpoint == 'scan' and data:
-                    command = ["SCAN", str(data.get('cursor', 0)), "MATCH", data.get('match', '*'), "COUNT", str(data.get('count', 100))]
-                elif endpoint == 'ping':
-                    command = ["PING"]
-                elif endpoint == 'lpush' and data:
-                    command = ["LPUSH", data['key'], data['element']]
-                elif endpoint == 'rpush' and data:
-                    command = ["RPUSH", data['key'], data['element']]
-                elif endpoint == 'lrange' and data:
-                    command = ["LRANGE", data['key'], str(data['start']), str(data['stop'])]
-                elif endpoint == 'llen' and data:
-                    command = ["LLEN", data['key']]
-                elif endpoint == 'xadd' and data:
-                    # XADD stream_name id field1 value1 field2 value2...
-                    command = ["XADD", data['key'], data.get('id', '*')]
-                    for field, value in data.get('fields', {}).items():
-                        command.extend([field, str(value)])
-                elif endpoint == 'xrange' and data:
-                    command = ["XRANGE", data['key'], data.get('start', '-'), data.get('end', '+')]
-                    if 'count' in data:
-                        command.extend(["COUNT", str(data['count'])])
-                else:
-                    # Generic command format
-                    command = data if isinstance(data, list) else [endpoint]
-                
-                response = requests.post(url, headers=headers, json=command, timeout=30)
-            
-            response.raise_for_status()
-            
-            # Handle different response types
-            content_type = response.headers.get('content-type', '')
-            if 'application/json' in content_type:
-                result = response.json()
-                # Upstash returns {"result": value} format
-                return result
-            else:
-                return response.text
-                
-        except requests.exceptions.RequestException as e:
-            raise RedisConnectionError(f"REST API error: {e}")
+        Commands started after the budget is spent raise
+        DeadlineExceededError; each command's timeout is capped by the time
+        remaining. seconds=None leaves any enclosing deadline in force.
+        """
+        return deadline_scope(seconds)
+    
+    def pipeline(self) -> Pipeline:
+        """Create a command pipeline; use as a context manager to send on exit."""
+        return Pipeline(self)
+    
+    def transaction(self) -> Pipeline:
+        """Create an atomic MULTI/EXEC batch; use as a context manager to commit on exit."""
+        return Pipeline(self, transaction=True)
+    
+    def supports_transactions(self) -> bool:
+        """Check if the current profile's transport can commit atomic batches."""
+        return self._transport().supports_transactions
     
     def switch_profile(self, profile_name: str) -> bool:
-        """Switch to specified profile."""
-        return self.profile_manager.switch_profile(profile_name)
+        """Switch to specified profile and resolve its transport."""
+        if not self.profile_manager.switch_profile(profile_name):
+            return False
+        try:
+            self._resolve_transport()
+        except RedisConnectionError:
+            # Invalid URL: surface the error on first use, as before
+            self._active_transport = None
+        return True
     
     def list_profiles(self) -> Dict[str, ProfileConfig]:
         """List all available profiles."""
@@ -159,85 +167,234 @@ class RedisClient:
         """Get current profile name."""
         return self.profile_manager.current_profile
     
+    def get_pool_stats(self) -> Dict[str, int]:
+        """Get keep-alive pool hit/miss counters for the current profile."""
+        return self._transport().get_stats()
+    
+    def get_retry_stats(self) -> Dict[str, Any]:
+        """Get retry, hedging and circuit breaker counters for the current profile."""
+        transport = self._transport()
+        stats: Dict[str, Any] = transport.retry_policy.get_stats()
+        stats['circuit'] = transport.breaker.state
+        stats['consecutive_failures'] = transport.breaker.failures
+        stats.update(transport.hedge_stats)
+        return stats
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get get_key cache hit-rate and eviction counters ({} when caching is off)."""
+        cache = self._transport().cache
+        return cache.get_stats() if cache is not None else {}
+    
+    def get_codec(self) -> ValueCodec:
+        """Get the current profile's value compression codec."""
+        return self._transport().codec
+    
+    def get_compression_stats(self) -> Dict[str, Any]:
+        """Get compression ratio and CPU time counters for the current profile."""
+        return self._transport().codec.get_stats()
+    
+    def supports_binary_values(self) -> bool:
+        """Check if single commands on this profile carry binary values both ways."""
+        return self._transport().binary_safe
+    
+    def supports_binary_batches(self) -> bool:
+        """Check if pipelines and transactions on this profile can carry binary values."""
+        return self._transport().binary_batches
+    
+    def supports_blocking(self) -> bool:
+        """Check if blocking commands (XREAD BLOCK) can wait server-side on this profile."""
+        return self._transport().supports_blocking
+    
+    def close(self) -> None:
+        """Close all pooled connections held by this client."""
+        for transport in self._transports.values():
+            transport.close()
+        self._transports.clear()
+        self._active_transport = None
+        self.session_pool.close()
+    
     def test_connection(self) -> bool:
         """Test connection to current Redis instance."""
         try:
-            config = self._get_current_config()
-            
-            if self._is_rest_url(config.url):
-                # Test REST API connection with Upstash
-                result = self._execute_rest_api('ping')
-                return result.get('result') == 'PONG' if isinstance(result, dict) else str(result).upper() == 'PONG'
-            else:
-                # Test Redis CLI connection  
-                result = self._execute_redis_cli(['PING'])
-                return result.upper() == 'PONG'
-            
+            return str(self.execute_command('PING')).upper() == 'PONG'
         except RedisConnectionError:
             return False
     
     # Basic Redis Operations (unified interface)
     def set_key(self, key: str, value: str) -> bool:
         """Set a Redis key-value pair."""
-        config = self._get_current_config()
-        
+        self.last_error = None
+        transport = self._transport()
+        if transport.binary_safe and transport.codec.enabled:
+            # Compressed values are binary; redis-cli profiles store them as-is
+            value = transport.codec.encode(value.encode('utf-8'))
         try:
-            if self._is_rest_url(config.url):
-                result = self._execute_rest_api('set', {'key': key, 'value': value})
-                return result.get('result') == 'OK'
-            else:
-                result = self._execute_redis_cli(['SET', key, value])
-                return result == 'OK'
-        except RedisConnectionError:
+            return self.execute_command('SET', key, value) == 'OK'
+        except RedisConnectionError as e:
+            self.last_error = e
             return False
     
     def get_key(self, key: str) -> Optional[str]:
-        """Get value for Redis key."""
-        config = self._get_current_config()
-        
+        """Get value for Redis key (served from the client-side cache when enabled)."""
+        self.last_error = None
+        transport = self._transport()
+        cache = transport.cache
+        if cache is not None:
+            hit, value = cache.get(key)
+            if hit:
+                return value
+            version = cache.version
         try:
-            if self._is_rest_url(config.url):
-                result = self._execute_rest_api('get', {'key': key})
-                return result.get('result')
+            if transport.binary_safe:
+                # Fetch raw bytes so compressed values are detected by their header
+                value = self.execute_command('GET', key, raw=True)
+                if value is not None:
+                    value = decode_reply(transport.codec.decode(value))
             else:
-                result = self._execute_redis_cli(['GET', key])
-                return result if result != '(nil)' else None
-        except RedisConnectionError:
+                value = self.execute_command('GET', key)
+        except RedisConnectionError as e:
+            self.last_error = e
             return None
+        except ValueError as e:
+            self.last_error = RedisConnectionError(f"Could not decompress {key}: {e}")
+            return None
+        if cache is not None:
+            cache.set(key, value, version)
+        return value
+    
+    def get_many(self, keys: Sequence[str], batch_size: int = MANY_BATCH_KEYS) -> List[Optional[str]]:
+        """Get values for keys in order via MGET, one request per batch_size keys (None if missing)."""
+        self.last_error = None
+        transport = self._transport()
+        cache = transport.cache
+        results: List[Optional[str]] = [None] * len(keys)
+        pending = []
+        for i, key in enumerate(keys):
+            if cache is not None:
+                hit, value = cache.get(key)
+                if hit:
+                    results[i] = value
+                    continue
+            pending.append(i)
+        version = cache.version if cache is not None else None
+        
+        try:
+            for start in range(0, len(pending), batch_size):
+                batch = pending[start:start + batch_size]
+                values = self.execute_command('MGET', *(keys[i] for i in batch), raw=transport.binary_safe)
+                for i, value in zip(batch, values):
+                    if transport.binary_safe and value is not None:
+                        value = decode_reply(transport.codec.decode(value))
+                    results[i] = value
+                    if cache is not None:
+                        cache.set(keys[i], value, version)
+        except RedisConnectionError as e:
+            self.last_error = e
+            return [None] * len(keys)
+        except ValueError as e:
+            self.last_error = RedisConnectionError(f"Could not decompress value: {e}")
+            return [None] * len(keys)
+        return results
+    
+    def set_many(self, mapping: Dict[str, str], batch_size: int = MANY_BATCH_KEYS,
+                 batch_bytes: int = MANY_BATCH_BYTES) -> bool:
+        """Set several keys via MSET, split into batches bounded by key count and total size.
+        
+        Each batch is atomic; a failure part-way leaves earlier batches written.
+        """
+        self.last_error = None
+        transport = self._transport()
+        compress = transport.binary_batches and transport.codec.enabled
+        batches: List[List[Any]] = []
+        batch: List[Any] = []
+        size = 0
+        for key, value in mapping.items():
+            if compress:
+                value = transport.codec.encode(value.encode('utf-8'))
+            item_size = len(key) + len(value)
+            if batch and (len(batch) // 2 >= batch_size or size + item_size > batch_bytes):
+                batches.append(batch)
+                batch, size = [], 0
+            batch.extend((key, value))
+            size += item_size
+        if batch:
+            batches.append(batch)
+        
+        try:
+            return all(self.execute_command('MSET', *batch) == 'OK' for batch in batches)
+        except RedisConnectionError as e:
+            self.last_error = e
+            return False
+    
+    def preview_keys(self, keys: Sequence[str], length: int = 50) -> List[Dict[str, Any]]:
+        """Fetch type, size and the first length characters of each key in one pipelined batch.
+        
+        Only GETRANGE 0..length-1 is transferred per string value, never the
+        whole value. Non-string keys get a type but no size or preview.
+        """
+        with self.pipeline() as pipe:
+            for key in keys:
+                pipe.command('TYPE', key)
+                pipe.command('STRLEN', key)
+                pipe.command('GETRANGE', key, 0, length - 1)
+        results = pipe.results or []
+        
+        previews = []
+        for i, key in enumerate(keys):
+            key_type, size, head = results[3 * i:3 * i + 3]
+            if isinstance(key_type, Exception) or key_type != 'string':
+                size, head = None, None
+            elif isinstance(head, str) and head.startswith(COMPRESSED_PREFIX):
+                head = '<compressed>'
+            previews.append({
+                'key': key,
+                'type': None if isinstance(key_type, Exception) else key_type,
+                'size': size if isinstance(size, int) else None,
+                'preview': head if isinstance(head, str) else None,
+                'truncated': isinstance(size, int) and size > length,
+            })
+        return previews
     
     def delete_key(self, key: str) -> bool:
         """Delete a Redis key."""
-        config = self._get_current_config()
-        
+        self.last_error = None
         try:
-            if self._is_rest_url(config.url):
-                result = self._execute_rest_api('del', {'key': key})
-                return result.get('result', 0) > 0
-            else:
-                result = self._execute_redis_cli(['DEL', key])
-                return int(result) > 0
-        except (RedisConnectionError, ValueError):
+            return self.execute_command('DEL', key) > 0
+        except RedisConnectionError as e:
+            self.last_error = e
+            return False
+        except ValueError:
             return False
     
-    def scan_keys(self, pattern: str = '*', count: int = 100) -> List[str]:
-        """Scan Redis keys with pattern."""
-        config = self._get_current_config()
+    def _scan_page(self, cursor: str, pattern: str = '*', count: int = 100,
+                   key_type: Optional[str] = None) -> Tuple[str, List[str]]:
+        """Fetch one SCAN page, returning (next_cursor, keys)."""
+        command = ['SCAN', str(cursor), 'MATCH', pattern, 'COUNT', str(count)]
+        if key_type:
+            command.extend(['TYPE', key_type])
+        
+        next_cursor, keys = self.execute_command(*command) or ['0', []]
+        return str(next_cursor), keys or []
+    
+    def scan_iter(self, pattern: str = '*', count: int = 100,
+                  type: Optional[str] = None) -> Iterator[str]:
+        """Lazily iterate over every key matching pattern, following the SCAN cursor.
         
+        Keys are yielded as each page arrives, so memory stays flat on large
+        keyspaces. As with SCAN itself, a key may be yielded more than once.
+        """
+        cursor = '0'
+        while True:
+            cursor, keys = self._scan_page(cursor, pattern, count, type)
+            for key in keys:
+                yield key
+            if cursor == '0':
+                break
+    
+    def scan_keys(self, pattern: str = '*', count: int = 100) -> List[str]:
+        """Scan Redis keys with pattern (first cursor page only; see scan_iter)."""
         try:
-            if self._is_rest_url(config.url):
-                result = self._execute_rest_api('scan', {
-                    'cursor': 0, 
-                    'match': pattern, 
-                    'count': count
-                })
-                return result.get('result', [])
-            else:
-                result = self._execute_redis_cli(['SCAN', '0', 'MATCH', pattern, 'COUNT', str(count)])
-                lines = result.split('\n')
-                if len(lines) >= 2:
-                    # Skip cursor, return keys
-                    keys_line = lines[1] if len(lines) > 1 else ""
-                    return [k.strip() for k in keys_line.split() if k.strip()]
-                return []
+            cursor, keys = self._scan_page('0', pattern, count)
+            return keys
         except RedisConnectionError:
             return []
\ No newline at end of file
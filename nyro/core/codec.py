@@ -0,0 +1,143 @@
+"""
+Value Compression Module
+🧵 Synth: Shrinking large JSON and text values before they hit the wire
+
+Provides:
+- ValueCodec: opt-in compression for values above a size threshold
+- A 4-byte magic header (NUL, 'N', 'Z', codec id) so readers auto-detect
+  compressed values whatever their own compression setting is
+- zlib always; zstd (zstandard) and lz4 (lz4.frame) when installed
+"""
+
+import threading
+import time
+import zlib
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:  # optional: pip install nyro[compression]
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # optional: pip install nyro[compression]
+    lz4_frame = None
+
+
+MAGIC = b'\x00NZ'
+HEADER_SIZE = len(MAGIC) + 1
+
+
+def _zstd_compress(data: bytes) -> bytes:
+    return zstandard.ZstdCompressor().compress(data)
+
+
+def _zstd_decompress(data: bytes) -> bytes:
+    return zstandard.ZstdDecompressor().decompress(data)
+
+
+# name -> (header id, compress, decompress, available)
+CODECS: Dict[str, Tuple[int, Callable[[bytes], bytes], Callable[[bytes], bytes], bool]] = {
+    'zlib': (1, lambda data: zlib.compress(data, 6), zlib.decompress, True),
+    'zstd': (2, _zstd_compress, _zstd_decompress, zstandard is not None),
+    'lz4': (3, lambda data: lz4_frame.compress(data), lambda data: lz4_frame.decompress(data),
+            lz4_frame is not None),
+}
+CODEC_NAMES = {codec_id: name for name, (codec_id, _, _, _) in CODECS.items()}
+
+# name -> factory for an incremental decompressor with a decompress(data) method
+STREAM_DECOMPRESSORS: Dict[str, Callable[[], Any]] = {
+    'zlib': zlib.decompressobj,
+    'zstd': lambda: zstandard.ZstdDecompressor().decompressobj(),
+    'lz4': lambda: lz4_frame.LZ4FrameDecompressor(),
+}
+
+
+def is_compressed(data: Any) -> bool:
+    """Check if a stored value carries the compression header."""
+    return isinstance(data, (bytes, bytearray)) and len(data) >= HEADER_SIZE and data[:3] == MAGIC
+
+
+class ValueCodec:
+    """Compress values on write and auto-detect compressed values on read."""
+
+    def __init__(self, codec: str = 'none', threshold: int = 1024):
+        """codec is 'none', 'zlib', 'zstd' or 'lz4'; values below threshold bytes stay raw."""
+        codec = (codec or 'none').lower()
+        if codec != 'none':
+            if codec not in CODECS:
+                raise ValueError(f"Unknown compression codec: {codec}")
+            if not CODECS[codec][3]:
+                raise ValueError(f"Compression codec '{codec}' is not installed (pip install nyro[compression])")
+        self.codec = codec
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        self.stats = {
+            'compressed': 0, 'skipped': 0, 'decompressed': 0,
+            'bytes_in': 0, 'bytes_out': 0,
+            'compress_seconds': 0.0, 'decompress_seconds': 0.0,
+        }
+
+    @property
+    def enabled(self) -> bool:
+        """True when writes are compressed."""
+        return self.codec != 'none'
+
+    def encode(self, data: bytes) -> bytes:
+        """Compress data if enabled, large enough, and actually smaller."""
+        if not self.enabled or len(data) < self.threshold:
+            return data
+        codec_id, compress, _, _ = CODECS[self.codec]
+        started = time.perf_counter()
+        packed = MAGIC + bytes([codec_id]) + compress(bytes(data))
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.stats['compress_seconds'] += elapsed
+            if len(packed) >= len(data):
+                self.stats['skipped'] += 1
+                return data
+            self.stats['compressed'] += 1
+            self.stats['bytes_in'] += len(data)
+            self.stats['bytes_out'] += len(packed)
+        return packed
+
+    def decode(self, data: bytes) -> bytes:
+        """Decompress a value written with the header; anything else is returned as-is."""
+        if not is_compressed(data):
+            return data
+        name = CODEC_NAMES.get(data[3])
+        if name is None:
+            raise ValueError(f"Unknown compression codec id: {data[3]}")
+        _, _, decompress, available = CODECS[name]
+        if not available:
+            raise ValueError(f"Value is {name}-compressed but {name} support is not installed")
+        started = time.perf_counter()
+        try:
+            raw = decompress(bytes(data[HEADER_SIZE:]))
+        except Exception as e:
+            raise ValueError(f"Corrupt {name}-compressed value: {e}")
+        with self._lock:
+            self.stats['decompressed'] += 1
+            self.stats['decompress_seconds'] += time.perf_counter() - started
+        return raw
+
+    def stream_decoder(self, head: bytes) -> Tuple[Optional[Any], int]:
+        """For a value's first bytes, return (incremental decompressor or None, header length to skip)."""
+        if not is_compressed(head):
+            return None, 0
+        name = CODEC_NAMES.get(head[3])
+        if name is None or not CODECS[name][3]:
+            raise ValueError(f"Cannot stream-decompress codec id {head[3]}")
+        with self._lock:
+            self.stats['decompressed'] += 1
+        return STREAM_DECOMPRESSORS[name](), HEADER_SIZE
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get compression ratio and CPU time counters."""
+        with self._lock:
+            stats: Dict[str, Any] = dict(self.stats)
+        stats['codec'] = self.codec
+        stats['threshold'] = self.threshold
+        stats['ratio'] = stats['bytes_in'] / stats['bytes_out'] if stats['bytes_out'] else 1.0
+        return stats
@@ -0,0 +1,63 @@
+"""
+Deadline Module
+🧵 Synth: One time budget shared by every round trip of an operation
+
+A deadline set with `deadline_scope()` applies to all commands issued in
+that context (including chunked loads and scans made of many calls); each
+command's timeout is capped by the time that remains.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from .errors import DeadlineExceededError
+
+
+class Deadline:
+    """Absolute point in time after which no further command is started."""
+
+    def __init__(self, seconds: float):
+        """Start a budget of seconds from now."""
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Seconds left (may be negative)."""
+        return self.expires_at - time.monotonic()
+
+    def check(self) -> None:
+        """Raise DeadlineExceededError if the budget is spent."""
+        if self.remaining() <= 0:
+            raise DeadlineExceededError(f"Deadline of {self.seconds:g}s exceeded")
+
+    def cap(self, timeout: Optional[float]) -> float:
+        """Limit a per-command timeout to the time remaining."""
+        remaining = max(self.remaining(), 0.001)
+        return remaining if timeout is None else min(timeout, remaining)
+
+
+_current_deadline: ContextVar[Optional[Deadline]] = ContextVar('nyro_deadline', default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Get the deadline in force for the calling context, if any."""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float]) -> Iterator[Optional[Deadline]]:
+    """Apply a deadline to every command in the block; nested scopes keep the tighter one."""
+    outer = _current_deadline.get()
+    if seconds is None:
+        yield outer
+        return
+    deadline = Deadline(seconds)
+    if outer is not None and outer.expires_at < deadline.expires_at:
+        deadline = outer
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
@@ -0,0 +1,102 @@
+"""
+Content-addressed Chunk Module
+🧵 Synth: Re-uploading only the parts of a payload that changed
+
+Provides:
+- chunk_boundaries: content-defined cut points (gear rolling hash, FastCDC-style
+  normalized chunking) so an edit only changes the chunks around it
+- chunk_key / chunk_digest: chunks are stored once under their SHA-256
+- CHUNK_REFS_KEY: hash of manifest reference counts used for garbage collection
+- COLLECT_CHUNK_SCRIPT: Lua check-and-delete for unreferenced chunks
+"""
+
+import hashlib
+from typing import Iterator, List, Union
+
+
+CHUNK_PREFIX = 'nyro:chunk:'
+CHUNK_REFS_KEY = 'nyro:chunkrefs'
+
+DEDUP_MIN_CHUNK = 16 * 1024
+DEDUP_AVG_CHUNK = 64 * 1024
+DEDUP_MAX_CHUNK = 256 * 1024
+
+# Deletes a chunk only if no manifest references it, atomically with the check;
+# store_massive_payload references chunks before checking they exist, so a
+# chunk being reused is never collected
+COLLECT_CHUNK_SCRIPT = """
+local count = tonumber(redis.call('HGET', KEYS[1], ARGV[1]) or '0')
+if count > 0 then return 0 end
+redis.call('HDEL', KEYS[1], ARGV[1])
+return redis.call('DEL', KEYS[2])
+"""
+
+# Fixed pseudo-random table so every client cuts identical data identically
+GEAR = [int.from_bytes(hashlib.blake2b(bytes([i]), digest_size=4).digest(), 'big') for i in range(256)]
+
+
+def _masks(avg_size: int) -> tuple:
+    # Masks select high bits, which depend on the last 32 bytes of input;
+    # one extra bit before the average size and one fewer after it pulls
+    # chunk sizes towards avg_size
+    bits = max(2, avg_size.bit_length() - 1)
+    strict = ((1 << (bits + 1)) - 1) << (31 - bits)
+    loose = ((1 << (bits - 1)) - 1) << (33 - bits)
+    return strict, loose
+
+
+def chunk_boundaries(data: Union[bytes, bytearray, memoryview], min_size: int = DEDUP_MIN_CHUNK,
+                     avg_size: int = DEDUP_AVG_CHUNK, max_size: int = DEDUP_MAX_CHUNK) -> Iterator[int]:
+    """Yield the end offset of each content-defined chunk of data.
+
+    The first min_size bytes of every chunk are skipped without hashing,
+    so the per-byte loop runs over roughly half of the input.
+    """
+    strict, loose = _masks(avg_size)
+    gear = GEAR
+    total = len(data)
+    start = 0
+    while start < total:
+        end = min(start + max_size, total)
+        cut = end
+        if end - start > min_size:
+            normal = min(start + avg_size, end)
+            h = 0
+            position = start + min_size
+            for byte in bytes(data[position:normal]):
+                h = ((h << 1) + gear[byte]) & 0xFFFFFFFF
+                position += 1
+                if not h & strict:
+                    cut = position
+                    break
+            else:
+                for byte in bytes(data[normal:end]):
+                    h = ((h << 1) + gear[byte]) & 0xFFFFFFFF
+                    position += 1
+                    if not h & loose:
+                        cut = position
+                        break
+        yield cut
+        start = cut
+
+
+def chunk_digest(chunk: Union[bytes, memoryview]) -> str:
+    """Content address of a chunk (hex SHA-256 of its uncompressed bytes)."""
+    return hashlib.sha256(chunk).hexdigest()
+
+
+def chunk_key(digest: str) -> str:
+    """Redis key holding the chunk with this digest."""
+    return f"{CHUNK_PREFIX}{digest}"
+
+
+def split_chunks(data: Union[bytes, bytearray], min_size: int = DEDUP_MIN_CHUNK,
+                 avg_size: int = DEDUP_AVG_CHUNK, max_size: int = DEDUP_MAX_CHUNK) -> List[memoryview]:
+    """Cut data into zero-copy content-defined chunks."""
+    view = memoryview(data)
+    chunks = []
+    start = 0
+    for end in chunk_boundaries(view, min_size, avg_size, max_size):
+        chunks.append(view[start:end])
+        start = end
+    return chunks
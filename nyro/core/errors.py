@@ -0,0 +1,32 @@
+"""
+Redis Error Types
+🧵 Synth: Shared exceptions for every Nyro transport
+
+Kept in their own module so transports, client and operations can raise
+the same errors without importing each other.
+"""
+
+
+class RedisConnectionError(Exception):
+    """Redis connection related errors."""
+    pass
+
+
+class RedisCommandError(RedisConnectionError):
+    """Error reply for a single command (e.g. WRONGTYPE) within a batch."""
+    pass
+
+
+class RedisTransientError(RedisConnectionError):
+    """Failure worth retrying: timeout, dropped connection, HTTP 5xx or 429."""
+    pass
+
+
+class CircuitOpenError(RedisConnectionError):
+    """Call refused without contacting the server because the profile's circuit is open."""
+    pass
+
+
+class DeadlineExceededError(RedisConnectionError):
+    """The time budget for a call (or a multi-call operation) ran out."""
+    pass
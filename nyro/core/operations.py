@@ -12,13 +12,169 @@ Unifies functionality from:
 
 import json
 import base64
+import hashlib
+import io
+import mmap
 import os
-from typing import Dict, List, Optional, Any, Union, Tuple
+import stat
+from typing import BinaryIO, Dict, Iterator, List, Optional, Any, Union, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from itertools import accumulate, islice
 from datetime import datetime
 from pathlib import Path
 import tempfile
+import time
+import uuid
 
-from .client import RedisClient
+from .client import RedisClient, RedisConnectionError, RedisCommandError
+from .codec import ValueCodec, is_compressed
+from .dedup import (
+    CHUNK_PREFIX, CHUNK_REFS_KEY, COLLECT_CHUNK_SCRIPT, DEDUP_AVG_CHUNK, chunk_digest, chunk_key, split_chunks
+)
+from .walk import (
+    WalkManifest, IgnoreRules, IterableReader, DEFAULT_EXCLUDES, WALK_WORKERS, ordered_map, scan_tree
+)
+from .versions import (
+    RETIRED_VERSIONS_KEY, SWEEP_VERSION_SCRIPT, VERSION_GRACE_SECONDS, SWEEP_BATCH,
+    chunk_prefix, parse_retired_member, payload_version, retired_member, swap_pointer_command
+)
+from .transfer import (
+    TransferMeter, ProgressCallback, chunk_batches, chunk_checksum, run_batches, PAYLOAD_BATCH_BYTES,
+    PAYLOAD_CONCURRENCY, CHUNK_CHECKSUM, CHUNK_CHECKSUM_SCRIPT, CHECKSUM_BATCH_KEYS, CHUNK_REFETCH_ATTEMPTS
+)
+
+# Entries fetched per XRANGE call by stream_iter
+STREAM_PAGE_SIZE = 100
+
+# tail: server-side wait per XREAD BLOCK, plus slack for the request itself
+TAIL_BLOCK_SECONDS = 5.0
+TAIL_TIMEOUT_MARGIN = 5.0
+# tail without blocking (REST): idle polls back off from min to max seconds
+TAIL_POLL_MIN = 0.1
+TAIL_POLL_MAX = 2.0
+
+# Message ids acknowledged per XACK command by ack()
+ACK_BATCH_IDS = 500
+
+
+def build_payload_chunks(payload: Dict[str, Any], chunk_size: int, codec: Optional[ValueCodec] = None,
+                         binary: bool = True) -> Tuple[str, List[Union[memoryview, str]], Dict[str, Any]]:
+    """Serialize a payload and split it into raw chunks plus chunk metadata.
+
+    Chunks are zero-copy slices of the JSON bytes, stored as-is (no base64
+    layer): json.dumps escapes to ASCII, so every slice is also valid text
+    for REST bodies. With a codec the JSON is compressed before chunking;
+    compressed chunks are base64 text unless binary (the transport can
+    batch binary values). Returns (payload_json, [], {}) when the payload
+    fits in a single value.
+    """
+    payload_json = json.dumps(payload)
+    payload_bytes = payload_json.encode('utf-8')
+    if len(payload_bytes) <= chunk_size:
+        return payload_json, [], {}
+    
+    body = codec.encode(payload_bytes) if codec is not None else payload_bytes
+    compression = codec.codec if is_compressed(body) else 'none'
+    view = memoryview(body)
+    chunks: List[Union[memoryview, str]] = [view[i:i + chunk_size] for i in range(0, len(body), chunk_size)]
+    encoding = 'raw'
+    if compression != 'none' and not binary:
+        chunks = [base64.b64encode(chunk).decode('ascii') for chunk in chunks]
+        encoding = 'base64'
+    
+    metadata = {
+        'type': 'chunked_payload',
+        'encoding': encoding,
+        'compression': compression,
+        'total_chunks': len(chunks),
+        'chunk_size': chunk_size,
+        'total_size': len(payload_bytes),
+        'stored_size': len(body),
+        'checksum': CHUNK_CHECKSUM,
+        'checksums': [chunk_checksum(chunk) for chunk in chunks],
+        'timestamp': datetime.now().isoformat()
+    }
+    return payload_json, chunks, metadata
+
+
+def assemble_payload_chunks(chunks: List[Union[str, bytes]], metadata: Dict[str, Any],
+                            codec: Optional[ValueCodec] = None) -> Dict[str, Any]:
+    """Join stored chunks back into the original payload.
+
+    Payloads written before raw chunks existed carry no 'encoding' key and
+    hold base64 text per chunk. Compressed bodies are detected by their
+    header, so any client can read them whatever its compression setting.
+    """
+    parts = [chunk.encode('utf-8') if isinstance(chunk, str) else chunk for chunk in chunks]
+    if metadata.get('encoding') != 'raw':
+        parts = [base64.b64decode(part) for part in parts]
+    
+    return decode_payload_body(b''.join(parts), codec)
+
+
+def decode_payload_body(body: Union[bytes, bytearray], codec: Optional[ValueCodec] = None) -> Dict[str, Any]:
+    """Decompress (if the body carries the header) and parse a joined payload body."""
+    if is_compressed(body):
+        body = (codec or ValueCodec()).decode(body)
+    return json.loads(body.decode('utf-8'))
+
+
+def decode_cas_chunk(value: Union[str, bytes, None], digest: str, size: int,
+                     codec: Optional[ValueCodec] = None) -> bytes:
+    """Decompress a fetched content-addressed chunk and check it has the manifest's size."""
+    if not value:
+        raise ValueError(f"Missing chunk {digest}")
+    data = (codec or ValueCodec()).decode(value.encode('utf-8') if isinstance(value, str) else value)
+    if len(data) != size:
+        raise ValueError(f"Chunk {digest} has {len(data)} bytes, expected {size}")
+    return data
+
+
+def _remaining_size(fileobj: BinaryIO) -> int:
+    """Bytes left in a regular file, or 0 when the size is unknown (pipes)."""
+    try:
+        info = os.fstat(fileobj.fileno())
+        return max(0, info.st_size - fileobj.tell()) if stat.S_ISREG(info.st_mode) else 0
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return 0
+
+
+def _iter_chunks(fileobj: BinaryIO, chunk_size: int) -> Iterator[Union[memoryview, bytes]]:
+    """Yield exact chunk_size pieces of a stream (the last may be shorter).
+    
+    Regular files are memory-mapped and yielded as zero-copy slices, each
+    released when the next one is requested; other streams are read with
+    blocking reads so short pipe reads never shift chunk boundaries.
+    """
+    if _remaining_size(fileobj) > 0:
+        start = fileobj.tell()
+        with mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                for offset in range(start, len(mapped), chunk_size):
+                    chunk = view[offset:offset + chunk_size]
+                    try:
+                        yield chunk
+                    finally:
+                        chunk.release()
+            finally:
+                view.release()
+        return
+    
+    while True:
+        parts = []
+        needed = chunk_size
+        while needed:
+            data = fileobj.read(needed)
+            if not data:
+                break
+            parts.append(data)
+            needed -= len(data)
+        if parts:
+            yield parts[0] if len(parts) == 1 else b''.join(parts)
+        if needed:
+            return
 
 
 class RedisOperations:
@@ -27,60 +183,30 @@ class RedisOperations:
     def __init__(self, client: RedisClient):
         """Initialize with Redis client."""
         self.client = client
+        self.last_transfer: Dict[str, Any] = {}
     
     # List Operations (push-list.sh, read-list.sh)
     def push_list(self, list_name: str, element: str, direction: str = "left") -> bool:
         """Push element to Redis list (LPUSH/RPUSH)."""
-        config = self.client._get_current_config()
-        
+        command = 'LPUSH' if direction == "left" else 'RPUSH'
         try:
-            if self.client._is_rest_url(config.url):
-                command = "lpush" if direction == "left" else "rpush"
-                result = self.client._execute_rest_api(command, {
-                    'key': list_name, 
-                    'element': element
-                })
-                return result.get('result', 0) > 0
-            else:
-                redis_cmd = ['LPUSH' if direction == "left" else 'RPUSH', list_name, element]
-                result = self.client._execute_redis_cli(redis_cmd)
-                return int(result) > 0
+            return self.client.execute_command(command, list_name, element) > 0
         except Exception as e:
             print(f"🐛 Debug - Push error: {e}")
             return False
     
     def read_list(self, list_name: str, start: int = 0, stop: int = -1) -> List[str]:
         """Read from Redis list (LRANGE)."""
-        config = self.client._get_current_config()
-        
         try:
-            if self.client._is_rest_url(config.url):
-                result = self.client._execute_rest_api('lrange', {
-                    'key': list_name,
-                    'start': start,
-                    'stop': stop
-                })
-                return result.get('result', [])
-            else:
-                result = self.client._execute_redis_cli(['LRANGE', list_name, str(start), str(stop)])
-                if result:
-                    return [line.strip() for line in result.split('\\n') if line.strip()]
-                return []
+            return self.client.execute_command('LRANGE', list_name, str(start), str(stop)) or []
         except Exception as e:
             print(f"🐛 Debug - Read list error: {e}")
             return []
     
     def get_list_length(self, list_name: str) -> int:
         """Get length of Redis list."""
-        config = self.client._get_current_config()
-        
         try:
-            if self.client._is_rest_url(config.url):
-                result = self.client._execute_rest_api('llen', {'key': list_name})
-                return result.get('result', 0)
-            else:
-                result = self.client._execute_redis_cli(['LLEN', list_name])
-                return int(result) if result else 0
+            return self.client.execute_command('LLEN', list_name) or 0
         except Exception as e:
             print(f"🐛 Debug - List length error: {e}")
             return 0
@@ -88,77 +214,242 @@ class RedisOperations:
     # Stream Operations (stream-add.sh, stream-read.sh)
     def stream_add(self, stream_name: str, fields: Dict[str, str], stream_id: str = "*") -> Optional[str]:
         """Add entry to Redis stream (XADD)."""
-        config = self.client._get_current_config()
-        
         # Add timestamp if not provided
         if 'timestamp' not in fields:
             fields['timestamp'] = datetime.now().isoformat()
         
+        # Build Redis command: XADD stream_name id field1 value1 field2 value2...
+        cmd = ['XADD', stream_name, stream_id]
+        for field, value in fields.items():
+            cmd.extend([field, str(value)])
+        
         try:
-            if self.client._is_rest_url(config.url):
-                result = self.client._execute_rest_api('xadd', {
-                    'key': stream_name,
-                    'id': stream_id,
-                    'fields': fields
-                })
-                return result.get('result')
-            else:
-                # Build Redis CLI command: XADD stream_name id field1 value1 field2 value2...
-                cmd = ['XADD', stream_name, stream_id]
-                for field, value in fields.items():
-                    cmd.extend([field, str(value)])
-                
-                result = self.client._execute_redis_cli(cmd)
-                return result if result else None
+            return self.client.execute_command(*cmd)
         except Exception as e:
             print(f"🐛 Debug - Stream add error: {e}")
             return None
     
-    def stream_read(self, stream_name: str, count: int = 10, start_id: str = "-") -> List[Dict[str, Any]]:
-        """Read from Redis stream (XRANGE)."""
-        config = self.client._get_current_config()
-        
+    def stream_read(self, stream_name: str, count: int = 10, start_id: str = "-",
+                    timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Read from Redis stream (XRANGE), giving up after timeout seconds."""
         try:
-            if self.client._is_rest_url(config.url):
-                result = self.client._execute_rest_api('xrange', {
-                    'key': stream_name,
-                    'start': start_id,
-                    'end': '+',
-                    'count': count
-                })
-                return result.get('result', [])
-            else:
-                result = self.client._execute_redis_cli([
+            with self.client.deadline(timeout):
+                result = self.client.execute_command(
                     'XRANGE', stream_name, start_id, '+', 'COUNT', str(count)
-                ])
-                
-                # Parse Redis CLI stream output
-                entries = []
-                if result:
-                    lines = result.split('\\n')
-                    for i in range(0, len(lines), 2):
-                        if i + 1 < len(lines):
-                            stream_id = lines[i].strip()
-                            fields_line = lines[i + 1].strip()
-                            
-                            # Parse field-value pairs
-                            fields = {}
-                            if fields_line:
-                                parts = fields_line.split()
-                                for j in range(0, len(parts), 2):
-                                    if j + 1 < len(parts):
-                                        fields[parts[j]] = parts[j + 1]
-                            
-                            entries.append({
-                                'id': stream_id,
-                                'fields': fields
-                            })
-                
-                return entries
+                )
+            return self._parse_stream_entries(result)
         except Exception as e:
             print(f"🐛 Debug - Stream read error: {e}")
             return []
     
+    def stream_iter(self, stream_name: str, start: str = "-", end: str = "+",
+                    page_size: int = STREAM_PAGE_SIZE) -> Iterator[Dict[str, Any]]:
+        """Yield every entry of a stream between start and end (inclusive), oldest first.
+        
+        Entries are fetched page_size at a time with XRANGE, each page starting
+        just after the last id seen (exclusive "(" ids, Redis 6.2+), so memory
+        stays at one page however long the stream is. Unlike stream_read,
+        failures raise RedisConnectionError rather than ending the iteration
+        early.
+        """
+        next_start = start
+        while True:
+            raw = self.client.execute_command(
+                'XRANGE', stream_name, next_start, end, 'COUNT', str(page_size)
+            )
+            entries = self._parse_stream_entries(raw)
+            yield from entries
+            if len(entries) < page_size:
+                return
+            next_start = f"({entries[-1]['id']}"
+    
+    def tail(self, streams: Union[str, List[str]], last_ids: Optional[Dict[str, str]] = None,
+             block: float = TAIL_BLOCK_SECONDS, count: int = STREAM_PAGE_SIZE,
+             duration: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        """Follow several streams at once, yielding entries (with their 'stream') as they arrive.
+        
+        last_ids maps a stream to the id to read after; other streams (or
+        "$") start after their current last entry, resolved up front so
+        nothing added between two reads is missed. Profiles that can block
+        wait server-side with one XREAD BLOCK over all streams; REST
+        profiles, where long blocking requests are capped, poll with plain
+        XREAD instead, backing off from TAIL_POLL_MIN to TAIL_POLL_MAX
+        seconds while the streams stay idle. Runs for duration seconds
+        (forever when None); failures raise RedisConnectionError.
+        """
+        if isinstance(streams, str):
+            streams = [streams]
+        positions = {}
+        for name in streams:
+            start = (last_ids or {}).get(name, '$')
+            positions[name] = self._last_stream_id(name) if start == '$' else start
+        
+        blocking = self.client.supports_blocking()
+        ends_at = None if duration is None else time.monotonic() + duration
+        interval = TAIL_POLL_MIN
+        while True:
+            wait = block
+            if ends_at is not None:
+                wait = min(block, ends_at - time.monotonic())
+                if wait <= 0:
+                    return
+            command = ['XREAD', 'COUNT', str(count)]
+            if blocking:
+                # BLOCK 0 would wait forever, so never round down to it
+                command += ['BLOCK', str(max(1, int(wait * 1000)))]
+            command += ['STREAMS', *positions, *positions.values()]
+            raw = self.client.execute_command(*command, timeout=wait + TAIL_TIMEOUT_MARGIN)
+            
+            entries = self._parse_xread(raw)
+            for entry in entries:
+                positions[entry['stream']] = entry['id']
+                yield entry
+            if entries:
+                interval = TAIL_POLL_MIN
+            elif not blocking:
+                time.sleep(min(interval, wait))
+                interval = min(interval * 2, TAIL_POLL_MAX)
+    
+    def _last_stream_id(self, stream_name: str) -> str:
+        """Id of a stream's newest entry, or "0-0" when it is empty or missing."""
+        newest = self._parse_stream_entries(
+            self.client.execute_command('XREVRANGE', stream_name, '+', '-', 'COUNT', '1')
+        )
+        return newest[0]['id'] if newest else '0-0'
+    
+    def _parse_xread(self, raw: Any) -> List[Dict[str, Any]]:
+        """Flatten an XREAD reply (RESP2 [stream, entries] pairs or a RESP3 map) into tagged entries."""
+        pairs = raw.items() if isinstance(raw, dict) else (raw or [])
+        entries = []
+        for stream_name, raw_entries in pairs:
+            for entry in self._parse_stream_entries(raw_entries):
+                entry['stream'] = stream_name
+                entries.append(entry)
+        return entries
+    
+    def _parse_stream_entries(self, raw_entries: Optional[List[Any]]) -> List[Dict[str, Any]]:
+        """Convert wire-level [id, [field, value, ...]] pairs into entry dicts."""
+        entries = []
+        for stream_id, flat_fields in raw_entries or []:
+            flat_fields = flat_fields or []
+            if isinstance(flat_fields, dict):
+                fields = dict(flat_fields)
+            else:
+                fields = {
+                    flat_fields[j]: flat_fields[j + 1]
+                    for j in range(0, len(flat_fields) - 1, 2)
+                }
+            entries.append({'id': stream_id, 'fields': fields})
+        return entries
+    
+    # Consumer groups (XGROUP, XREADGROUP, XACK, XPENDING, XAUTOCLAIM)
+    def create_group(self, stream_name: str, group: str, start_id: str = "$", mkstream: bool = True) -> bool:
+        """Create a consumer group reading after start_id ("0" replays history); False if it already exists."""
+        command = ['XGROUP', 'CREATE', stream_name, group, start_id]
+        if mkstream:
+            command.append('MKSTREAM')
+        try:
+            self.client.execute_command(*command)
+        except RedisCommandError as e:
+            if 'BUSYGROUP' in str(e):
+                return False
+            raise
+        return True
+    
+    def destroy_group(self, stream_name: str, group: str) -> bool:
+        """Remove a consumer group and its pending entries list."""
+        return bool(self.client.execute_command('XGROUP', 'DESTROY', stream_name, group))
+    
+    def read_group(self, group: str, consumer: str, streams: Union[str, List[str]],
+                   count: int = STREAM_PAGE_SIZE, block: Optional[float] = None,
+                   last_ids: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+        """Read entries for consumer in group (XREADGROUP), tagged with their 'stream'.
+        
+        Streams read ">" (never-delivered entries) unless last_ids gives an
+        id, which re-reads this consumer's own pending entries after it.
+        With block, waits up to block seconds for entries: server-side where
+        the transport can block, otherwise (REST) polling with the same
+        backoff as tail(). Entries stay pending until ack()ed. XREADGROUP is
+        never retried, since a lost reply would still have delivered its
+        entries; claim_stuck() recovers those.
+        """
+        if isinstance(streams, str):
+            streams = [streams]
+        ids = [(last_ids or {}).get(name, '>') for name in streams]
+        blocking = self.client.supports_blocking()
+        ends_at = time.monotonic() + (block or 0)
+        interval = TAIL_POLL_MIN
+        while True:
+            wait = max(0.0, ends_at - time.monotonic())
+            command = ['XREADGROUP', 'GROUP', group, consumer, 'COUNT', str(count)]
+            if block and blocking:
+                command += ['BLOCK', str(max(1, int(wait * 1000)))]
+            command += ['STREAMS', *streams, *ids]
+            raw = self.client.execute_command(*command, timeout=wait + TAIL_TIMEOUT_MARGIN if block else None)
+            
+            entries = self._parse_xread(raw)
+            if entries or blocking or wait <= 0:
+                return entries
+            time.sleep(min(interval, wait))
+            interval = min(interval * 2, TAIL_POLL_MAX)
+    
+    def ack(self, stream_name: str, group: str, ids: List[str], batch_size: int = ACK_BATCH_IDS) -> int:
+        """Acknowledge processed entries, batch_size ids per XACK in one pipeline; returns how many were pending."""
+        ids = list(ids)
+        if not ids:
+            return 0
+        pipe = self.client.pipeline()
+        for i in range(0, len(ids), batch_size):
+            pipe.command('XACK', stream_name, group, *ids[i:i + batch_size])
+        return sum(int(result or 0) for result in pipe.execute(raise_on_error=True))
+    
+    def pending_summary(self, stream_name: str, group: str) -> Dict[str, Any]:
+        """Summarize a group's pending entries: count, id range and per-consumer counts."""
+        total, min_id, max_id, consumers = self.client.execute_command('XPENDING', stream_name, group)
+        return {
+            'count': int(total or 0),
+            'min_id': min_id,
+            'max_id': max_id,
+            'consumers': {name: int(pending) for name, pending in consumers or []},
+        }
+    
+    def pending(self, stream_name: str, group: str, count: int = STREAM_PAGE_SIZE,
+                consumer: Optional[str] = None, min_idle: Optional[float] = None,
+                start: str = "-", end: str = "+") -> List[Dict[str, Any]]:
+        """List pending entries (XPENDING extended form), optionally one consumer's or idle at least min_idle seconds."""
+        command = ['XPENDING', stream_name, group]
+        if min_idle is not None:
+            command += ['IDLE', str(int(min_idle * 1000))]
+        command += [start, end, str(count)]
+        if consumer:
+            command.append(consumer)
+        return [
+            {'id': entry_id, 'consumer': owner, 'idle_ms': int(idle), 'deliveries': int(deliveries)}
+            for entry_id, owner, idle, deliveries in self.client.execute_command(*command) or []
+        ]
+    
+    def claim_stuck(self, stream_name: str, group: str, consumer: str, min_idle: float,
+                    count: int = STREAM_PAGE_SIZE) -> Iterator[Dict[str, Any]]:
+        """Move entries pending longer than min_idle seconds to consumer (XAUTOCLAIM) and yield them.
+        
+        Pages through the whole pending entries list, count entries per call,
+        following the cursor until it wraps to "0-0". Claimed entries count
+        as delivered again and stay pending until ack()ed. Entries deleted
+        from the stream while pending are dropped from the list by Redis 7
+        and not yielded.
+        """
+        cursor = '0-0'
+        while True:
+            reply = self.client.execute_command(
+                'XAUTOCLAIM', stream_name, group, consumer, str(int(min_idle * 1000)), cursor, 'COUNT', str(count)
+            )
+            cursor, raw_entries = reply[0], reply[1]
+            for entry in self._parse_stream_entries([e for e in raw_entries or [] if e and e[1] is not None]):
+                entry['stream'] = stream_name
+                yield entry
+            if cursor in ('0-0', '0', None):
+                return
+    
     def add_diary_entry(self, diary_name: str = "garden.diary", event: str = "", **kwargs) -> Optional[str]:
         """Add diary entry to stream (garden diary pattern from scripts)."""
         fields = {
@@ -174,14 +465,28 @@ class RedisOperations:
         
         return self.stream_add(diary_name, fields)
     
-    def read_diary(self, diary_name: str = "garden.diary", count: int = 10) -> List[Dict[str, Any]]:
+    def read_diary(self, diary_name: str = "garden.diary", count: int = 10,
+                   timeout: Optional[float] = None) -> List[Dict[str, Any]]:
         """Read diary entries from stream."""
-        return self.stream_read(diary_name, count)
+        return self.stream_read(diary_name, count, timeout=timeout)
     
     # Advanced Scanning (scan-garden.sh patterns)
-    def scan_garden(self, pattern: str = "*", count: int = 100) -> Dict[str, Any]:
-        """Enhanced key scanning with garden metaphor."""
-        keys = self.client.scan_keys(pattern, count)
+    def scan_garden(self, pattern: str = "*", count: int = 100,
+                    timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Enhanced key scanning with garden metaphor (walks the full keyspace).
+        
+        With timeout, the whole walk shares one deadline; keys found before
+        it ran out are returned with 'complete' set to False.
+        """
+        keys = []
+        complete = True
+        try:
+            with self.client.deadline(timeout):
+                for key in self.client.scan_iter(pattern, count):
+                    keys.append(key)
+        except RedisConnectionError as e:
+            complete = False
+            print(f"🐛 Debug - Garden scan error: {e}")
         
         # Group keys by patterns
         categories = {
@@ -205,158 +510,780 @@ class RedisOperations:
         
         return {
             'pattern': pattern,
+            'complete': complete,
             'total_keys': len(keys),
             'categories': categories,
             'keys': keys
         }
     
+    def preview_pages(self, pattern: str = "*", page_size: int = 20,
+                      preview_length: int = 50) -> Iterator[List[Dict[str, Any]]]:
+        """Yield pages of key previews (see RedisClient.preview_keys) for keys matching pattern.
+        
+        Each page costs one SCAN step plus one pipelined round trip, and the
+        next page is fetched in the background while the caller shows the
+        current one. Connection errors surface from the next iteration.
+        """
+        keys = self.client.scan_iter(pattern, max(page_size, 100))
+        
+        def fetch_page() -> List[Dict[str, Any]]:
+            page = list(islice(keys, page_size))
+            return self.client.preview_keys(page, preview_length) if page else []
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            upcoming = executor.submit(fetch_page)
+            while True:
+                page = upcoming.result()
+                if not page:
+                    return
+                upcoming = executor.submit(fetch_page)
+                yield page
+    
     # Massive Data Handling (create-walk.sh, create-full-payload.sh patterns)
-    def create_walking_payload(self, directory_path: str, max_size_mb: int = 10) -> Dict[str, Any]:
-        """Create walking payload from directory (consolidated from create-walk.sh)."""
+    def create_walking_payload(self, directory_path: str, max_size_mb: int = 10,
+                               manifest_path: Optional[str] = None, delta: bool = False,
+                               excludes: Optional[List[str]] = None, gitignore: bool = True,
+                               workers: int = WALK_WORKERS) -> Dict[str, Any]:
+        """Create walking payload from directory (consolidated from create-walk.sh).
+        
+        Files are listed in path order with os.scandir, skipping DEFAULT_EXCLUDES,
+        virtualenvs, .gitignore matches (unless gitignore is False) and the
+        gitignore-style excludes patterns, and read on workers threads. The walk
+        stops at the first file that would exceed max_size_mb.
+        
+        With manifest_path, a local manifest of each file's size, mtime and
+        content hash is kept between walks: files whose size and mtime are
+        unchanged count as unchanged without comparing content. With delta
+        as well, a walking_payload_delta listing only added, changed and
+        removed files is returned instead (see apply_walking_delta), and
+        unchanged files are not read at all.
+        """
+        header, manifest = self._walk_header(directory_path, max_size_mb, manifest_path)
+        payload = {
+            'type': header['type'],
+            'directory': header['directory'],
+            'timestamp': header['timestamp'],
+            'files': [],
+            'structure': {},
+            'metadata': header['metadata']
+        }
+        if delta:
+            if manifest is None:
+                raise ValueError("delta walks need a manifest_path")
+            payload.update({
+                'type': 'walking_payload_delta',
+                'base_timestamp': manifest.timestamp,
+                'added': [],
+                'changed': [],
+                'removed': [],
+            })
+            del payload['files']
+        
+        removed = []
+        for status, file_info in self._walk_files(header, manifest, delta, removed, excludes, gitignore, workers):
+            if delta:
+                payload[status].append(file_info)
+            else:
+                payload['files'].append(file_info)
+        if delta:
+            payload['removed'] = removed
+        
+        return payload
+    
+    def iter_walking_json(self, directory_path: str, max_size_mb: int = 10,
+                          manifest_path: Optional[str] = None, excludes: Optional[List[str]] = None,
+                          gitignore: bool = True, workers: int = WALK_WORKERS) -> Iterator[bytes]:
+        """Yield the JSON of a walking payload piece by piece as files are read.
+        
+        The result parses to what create_walking_payload returns, but no
+        more than the files being read ahead is held in memory at once,
+        plus a few dozen bytes per file when a manifest is kept.
+        """
+        header, manifest = self._walk_header(directory_path, max_size_mb, manifest_path)
+        metadata = header['metadata']
+        yield (json.dumps({name: value for name, value in header.items() if name != 'metadata'})[:-1]
+               + ', "files": [').encode('utf-8')
+        separator = b''
+        for _, file_info in self._walk_files(header, manifest, False, [], excludes, gitignore, workers):
+            yield separator + json.dumps(file_info).encode('utf-8')
+            separator = b', '
+        yield f'], "structure": {{}}, "metadata": {json.dumps(metadata)}}}'.encode('utf-8')
+    
+    def store_walking_payload(self, key: str, directory_path: str, max_size_mb: int = 10,
+                              chunk_size: int = 1024*1024, manifest_path: Optional[str] = None,
+                              excludes: Optional[List[str]] = None, gitignore: bool = True,
+                              workers: int = WALK_WORKERS, progress: Optional[ProgressCallback] = None) -> int:
+        """Walk a directory straight into chunked storage under key.
+        
+        iter_walking_json feeds store_stream, so peak memory is about one
+        chunk plus the files being read ahead, whatever the size of the
+        files (a manifest adds only per-file size, mtime and hash).
+        Loads back with load_massive_payload. Returns the bytes stored.
+        """
+        pieces = self.iter_walking_json(directory_path, max_size_mb, manifest_path, excludes, gitignore, workers)
+        with closing(pieces):
+            return self.store_stream(key, IterableReader(pieces), chunk_size, progress)
+    
+    def _walk_header(self, directory_path: str, max_size_mb: int,
+                     manifest_path: Optional[str]) -> Tuple[Dict[str, Any], Optional[WalkManifest]]:
+        """Top-level walking payload fields and the manifest to walk against."""
         directory = Path(directory_path)
         if not directory.exists():
             raise ValueError(f"Directory not found: {directory_path}")
         
-        payload = {
+        header = {
             'type': 'walking_payload',
             'directory': str(directory.absolute()),
             'timestamp': datetime.now().isoformat(),
-            'files': [],
-            'structure': {},
             'metadata': {
                 'total_files': 0,
                 'total_size': 0,
                 'max_size_mb': max_size_mb
             }
         }
+        manifest = WalkManifest.load(manifest_path, header['directory']) if manifest_path else None
+        return header, manifest
+    
+    def _walk_files(self, header: Dict[str, Any], manifest: Optional[WalkManifest], delta: bool,
+                    removed: List[str], excludes: Optional[List[str]], gitignore: bool,
+                    workers: int) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield (status, file entry) for each file in the payload, in path order.
         
-        max_size_bytes = max_size_mb * 1024 * 1024
+        status is 'added', 'changed' or 'unchanged' against the manifest
+        (unchanged files are skipped in delta walks). header['metadata']
+        totals are updated as files are yielded; once the walk is done,
+        files gone since the manifest was saved are appended to removed.
+        """
+        metadata = header['metadata']
+        max_size_bytes = metadata['max_size_mb'] * 1024 * 1024
         current_size = 0
+        seen = set()
         
-        # Walk directory tree
-        for root, dirs, files in os.walk(directory):
-            root_path = Path(root)
-            relative_root = root_path.relative_to(directory)
-            
-            for file in files:
-                file_path = root_path / file
-                relative_file = relative_root / file
-                
-                try:
-                    file_size = file_path.stat().st_size
-                    
-                    # Check size limits
-                    if current_size + file_size > max_size_bytes:
-                        payload['metadata']['truncated'] = True
-                        break
-                    
-                    # Read file content (text files only)
-                    file_info = {
-                        'path': str(relative_file),
-                        'size': file_size,
-                        'modified': datetime.fromtimestamp(file_path.stat().st_mtime).isoformat()
-                    }
-                    
-                    if file_path.suffix in ['.py', '.js', '.ts', '.json', '.md', '.txt', '.yml', '.yaml']:
-                        try:
-                            with open(file_path, 'r', encoding='utf-8') as f:
-                                content = f.read()
-                                file_info['content'] = content
-                                current_size += len(content.encode('utf-8'))
-                        except (UnicodeDecodeError, PermissionError):
-                            file_info['content'] = '[Binary or unreadable file]'
-                    else:
-                        file_info['content'] = '[Binary file]'
-                    
-                    payload['files'].append(file_info)
-                    payload['metadata']['total_files'] += 1
-                    payload['metadata']['total_size'] += file_size
-                    
-                except (OSError, PermissionError):
+        def read(found: Tuple[str, str, os.stat_result]) -> Optional[tuple]:
+            relative_file, file_path, file_stat = found
+            trusted = manifest.lookup(relative_file, file_stat.st_size, file_stat.st_mtime_ns) if manifest else None
+            if trusted is not None and delta:
+                return relative_file, file_stat, None, trusted, True
+            try:
+                file_info, digest = self._read_walk_entry(Path(file_path), relative_file, file_stat)
+            except OSError:
+                return None
+            # A trusted size and mtime keep the recorded hash, as if the content was compared
+            return relative_file, file_stat, file_info, trusted or digest, trusted is not None
+        
+        rules = IgnoreRules().extend(DEFAULT_EXCLUDES).extend(excludes or [])
+        found = scan_tree(header['directory'], rules, gitignore)
+        
+        # Walk directory tree; files are read ahead on a thread pool but
+        # consumed in path order, so the budget cuts at the same file every time
+        with closing(ordered_map(read, found, workers)) as results:
+            for result in results:
+                if result is None:
                     continue
+                relative_file, file_stat, file_info, digest, trusted = result
+                file_size = file_stat.st_size
+                seen.add(relative_file)
+                
+                previous = manifest.previous_hash(relative_file) if manifest else None
+                if previous is None:
+                    status = 'added'
+                else:
+                    status = 'changed' if previous != digest else 'unchanged'
+                
+                included = not delta or status != 'unchanged'
+                content_size = len(file_info['content'].encode('utf-8')) if included else 0
+                
+                # Check size limits; the budget covers the whole walk
+                if current_size + content_size > max_size_bytes:
+                    metadata['truncated'] = True
+                    break
+                current_size += content_size
+                
+                # Unincluded changes stay out of the manifest so the next delta still carries them
+                if manifest is not None and not trusted:
+                    manifest.record(relative_file, file_size, file_stat.st_mtime_ns, digest)
+                
+                metadata['total_files'] += 1
+                metadata['total_size'] += file_size
+                if included:
+                    yield status, file_info
         
-        return payload
+        if manifest is not None:
+            # A truncated walk did not see every file, so absence proves nothing
+            if not metadata.get('truncated'):
+                gone = sorted(set(manifest.entries) - seen)
+                manifest.forget(gone)
+                removed.extend(gone)
+            manifest.save(header['timestamp'])
     
-    def store_massive_payload(self, key: str, payload: Dict[str, Any], chunk_size: int = 1024*1024) -> bool:
-        """Store massive payload with chunking (from redis-mobile.sh patterns)."""
+    def _read_walk_entry(self, file_path: Path, relative_file: str,
+                         file_stat: os.stat_result) -> Tuple[Dict[str, Any], str]:
+        """Build one walking payload file entry and the hash of its content."""
+        file_info = {
+            'path': relative_file,
+            'size': file_stat.st_size,
+            'modified': datetime.fromtimestamp(file_stat.st_mtime).isoformat()
+        }
+        
+        # Read file content (text files only)
+        if file_path.suffix in ['.py', '.js', '.ts', '.json', '.md', '.txt', '.yml', '.yaml']:
+            try:
+                with open(file_path, 'rb') as f:
+                    raw = f.read()
+                file_info['content'] = raw.decode('utf-8')
+                return file_info, hashlib.sha256(raw).hexdigest()
+            except (UnicodeDecodeError, PermissionError):
+                file_info['content'] = '[Binary or unreadable file]'
+        else:
+            file_info['content'] = '[Binary file]'
+        # Unread files change with their size or mtime
+        return file_info, f"{file_stat.st_size}:{file_stat.st_mtime_ns}"
+    
+    def store_massive_payload(self, key: str, payload: Dict[str, Any], chunk_size: int = 1024*1024,
+                              concurrency: int = PAYLOAD_CONCURRENCY, batch_bytes: int = PAYLOAD_BATCH_BYTES,
+                              progress: Optional[ProgressCallback] = None, dedup: bool = False,
+                              resume: bool = False) -> bool:
+        """Store massive payload with chunking (from redis-mobile.sh patterns).
+        
+        Payloads that fit in batch_bytes commit chunks and metadata in one
+        transaction. Larger ones send MSET batches of at most batch_bytes,
+        concurrency at a time, and write the metadata last so it never
+        points at missing chunks. progress(done_bytes, total_bytes) is
+        called after each batch; see get_transfer_stats() for throughput.
+        
+        Chunks go to a version namespace named after their checksums, and
+        the metadata pointer is swapped to it in one atomic step, so readers
+        see either the old payload or the new one, never a mix; the version
+        it replaced is left for sweep_versions. With resume, chunks an
+        interrupted upload of the same payload already stored (matching
+        checksums, compared server-side) are not sent again.
+        
+        With dedup, the payload is cut at content-defined boundaries and
+        only chunks not already stored (by any payload) are uploaded; the
+        metadata becomes a manifest of chunk hashes (chunk_size is unused).
+        """
         try:
-            payload_json = json.dumps(payload)
-            payload_bytes = payload_json.encode('utf-8')
+            if dedup:
+                return self._store_deduplicated(key, json.dumps(payload).encode('utf-8'),
+                                                concurrency, batch_bytes, progress)
             
-            # If payload is small enough, store directly
-            if len(payload_bytes) <= chunk_size:
-                return self.client.set_key(key, payload_json)
+            payload_json, chunks, metadata = build_payload_chunks(
+                payload, chunk_size, self.client.get_codec(), self.client.supports_binary_batches()
+            )
             
-            # Store in chunks
-            chunks = []
-            for i in range(0, len(payload_bytes), chunk_size):
-                chunk = payload_bytes[i:i + chunk_size]
-                chunk_encoded = base64.b64encode(chunk).decode('utf-8')
-                chunks.append(chunk_encoded)
-            
-            # Store chunk metadata
-            metadata = {
-                'type': 'chunked_payload',
-                'total_chunks': len(chunks),
-                'chunk_size': chunk_size,
-                'total_size': len(payload_bytes),
-                'timestamp': datetime.now().isoformat()
-            }
+            # If payload is small enough, store directly
+            if not chunks:
+                if not self.client.set_key(key, payload_json):
+                    return False
+                self._swap_metadata(key, None)
+                return True
             
-            # Store metadata
-            if not self.client.set_key(f"{key}:metadata", json.dumps(metadata)):
-                return False
+            version = metadata['version'] = payload_version(metadata['checksums'])
+            prefix = chunk_prefix(key, version)
+            # Rewriting a retired version revives it before the sweeper can take it
+            unretire = ('ZREM', RETIRED_VERSIONS_KEY, retired_member(key, version, len(chunks)))
             
-            # Store chunks
-            for i, chunk in enumerate(chunks):
-                chunk_key = f"{key}:chunk:{i}"
-                if not self.client.set_key(chunk_key, chunk):
+            if self.client.supports_transactions() and metadata['stored_size'] <= batch_bytes:
+                # Commit chunks and the pointer swap atomically in a single round trip
+                meter = TransferMeter(sum(len(chunk) for chunk in chunks), len(chunks), progress)
+                with self.client.transaction() as tx:
+                    tx.command(*unretire)
+                    for i, chunk in enumerate(chunks):
+                        tx.set_key(f"{prefix}{i}", chunk)
+                    tx.command(*swap_pointer_command(key, metadata))
+                meter.advance(meter.total_bytes, len(chunks))
+                self.last_transfer = meter.get_stats()
+                if not all(result == 'OK' for result in tx.results[1:-1]):
                     return False
+                self._release_manifest(key, self._parse_metadata(tx.results[-1]))
+                return True
             
+            if not self.client.supports_transactions():
+                # redis-cli fallback: one chunk per command line
+                batch_bytes = chunk_size
+            
+            self.client.execute_command(*unretire)
+            try:
+                stored = self._matching_chunks(prefix, metadata['checksums']) if resume else set()
+                pending = [i for i in range(len(chunks)) if i not in stored]
+                meter = TransferMeter(sum(len(chunks[i]) for i in pending), len(pending), progress)
+                
+                def upload(batch: range) -> bool:
+                    pairs = []
+                    for position in batch:
+                        pairs.extend((f"{prefix}{pending[position]}", chunks[pending[position]]))
+                    ok = self.client.execute_command('MSET', *pairs) == 'OK'
+                    meter.advance(sum(len(chunks[pending[position]]) for position in batch), len(batch))
+                    return ok
+                
+                # Chunks first so metadata never points at missing data
+                uploaded = run_batches(upload, chunk_batches(len(pending), chunk_size, batch_bytes), concurrency)
+                self.last_transfer = dict(meter.get_stats(), skipped_chunks=len(stored))
+                if not all(uploaded):
+                    raise RedisConnectionError(f"Failed to store chunks of {key}")
+                self._swap_metadata(key, metadata)
+            except BaseException:
+                # Leave the partial upload to the sweeper; a resume revives it first
+                self._retire_version(key, version, len(chunks))
+                raise
             return True
             
         except Exception:
             return False
     
-    def load_massive_payload(self, key: str) -> Optional[Dict[str, Any]]:
-        """Load massive payload with chunking support."""
+    def _retire_version(self, key: str, version: str, total_chunks: int) -> None:
+        """Queue a version's chunks for the sweeper after a failed upload."""
         try:
-            # Try direct load first
-            direct_data = self.client.get_key(key)
-            if direct_data:
-                return json.loads(direct_data)
+            self.client.execute_command('ZADD', RETIRED_VERSIONS_KEY, repr(time.time()),
+                                        retired_member(key, version, total_chunks))
+        except RedisConnectionError:
+            pass
+    
+    def _matching_chunks(self, prefix: str, checksums: List[str]) -> set:
+        """Indexes of chunks under prefix already stored with the expected checksums.
+        
+        Checksums are computed by Redis, so nothing is downloaded; if the
+        server cannot run the script every chunk is treated as missing.
+        """
+        matched = set()
+        for start in range(0, len(checksums), CHECKSUM_BATCH_KEYS):
+            names = [f"{prefix}{i}" for i in range(start, min(start + CHECKSUM_BATCH_KEYS, len(checksums)))]
+            try:
+                sums = self.client.execute_command('EVAL', CHUNK_CHECKSUM_SCRIPT, str(len(names)), *names)
+            except Exception as e:
+                print(f"🐛 Debug - Resume check error: {e}")
+                return matched
+            if not isinstance(sums, list) or len(sums) != len(names):
+                return matched
+            matched.update(start + offset for offset, checksum in enumerate(sums)
+                           if checksum == checksums[start + offset])
+        return matched
+    
+    def _refetch_chunk(self, name: str, checksum: str, binary: bool) -> bytes:
+        """Re-read a chunk that failed verification until it matches its checksum."""
+        for _ in range(CHUNK_REFETCH_ATTEMPTS):
+            value = self.client.execute_command('GET', name, raw=binary)
+            if isinstance(value, str):
+                value = value.encode('utf-8')
+            if value and chunk_checksum(value) == checksum:
+                return value
+        raise ValueError(f"Chunk {name} failed checksum verification")
+    
+    def _store_deduplicated(self, key: str, payload_bytes: bytes, concurrency: int, batch_bytes: int,
+                            progress: Optional[ProgressCallback]) -> bool:
+        """Upload only unseen content-defined chunks, then write the manifest."""
+        codec = self.client.get_codec()
+        # Chunks are compressed one by one so unchanged chunks keep identical bytes
+        compress = codec.enabled and self.client.supports_binary_values()
+        batchable = self.client.supports_binary_batches() or not compress
+        chunks = split_chunks(payload_bytes)
+        digests = [chunk_digest(chunk) for chunk in chunks]
+        unique: Dict[str, memoryview] = {}
+        for digest, chunk in zip(digests, chunks):
+            unique.setdefault(digest, chunk)
+        
+        # Reference chunks before checking they exist: collect_chunks only
+        # deletes unreferenced chunks, so nothing found here can vanish
+        with self.client.pipeline() as pipe:
+            for digest in unique:
+                pipe.command('HINCRBY', CHUNK_REFS_KEY, digest, 1)
+                pipe.command('EXISTS', chunk_key(digest))
+        for reply in pipe.results:
+            if isinstance(reply, Exception):
+                raise reply
+        missing = [digest for i, digest in enumerate(unique) if not pipe.results[2 * i + 1]]
+        
+        try:
+            values = {digest: codec.encode(bytes(unique[digest])) if compress else unique[digest]
+                      for digest in missing}
+            meter = TransferMeter(sum(len(value) for value in values.values()), len(missing), progress)
             
-            # Try chunked load
-            metadata_key = f"{key}:metadata"
-            metadata_json = self.client.get_key(metadata_key)
-            if not metadata_json:
-                return None
+            def upload(batch: range) -> bool:
+                names = [missing[i] for i in batch]
+                if len(names) == 1:
+                    ok = self.client.execute_command('SET', chunk_key(names[0]), values[names[0]]) == 'OK'
+                else:
+                    pairs = []
+                    for digest in names:
+                        pairs.extend((chunk_key(digest), values[digest]))
+                    ok = self.client.execute_command('MSET', *pairs) == 'OK'
+                meter.advance(sum(len(values[digest]) for digest in names), len(names))
+                return ok
             
-            metadata = json.loads(metadata_json)
-            if metadata.get('type') != 'chunked_payload':
-                return None
+            # Binary values can only be batched where the transport allows it
+            batches = chunk_batches(len(missing), DEDUP_AVG_CHUNK if batchable else batch_bytes, batch_bytes)
+            if not all(run_batches(upload, batches, concurrency)):
+                raise RedisConnectionError(f"Failed to upload chunks of {key}")
             
-            # Reconstruct from chunks
-            chunks = []
-            for i in range(metadata['total_chunks']):
-                chunk_key = f"{key}:chunk:{i}"
-                chunk_data = self.client.get_key(chunk_key)
-                if not chunk_data:
+        except BaseException:
+            self._release_chunks(list(unique))
+            raise
+        
+        manifest = {
+            'type': 'cas_payload',
+            'chunks': digests,
+            'sizes': [len(chunk) for chunk in chunks],
+            'total_size': len(payload_bytes),
+            'timestamp': datetime.now().isoformat()
+        }
+        # Old fixed-size chunks are retired for sweep_versions by the swap. If
+        # the swap fails its references are kept, since it may still have landed
+        self._swap_metadata(key, manifest)
+        
+        stats = meter.get_stats()
+        stats.update({
+            'total_chunks': len(digests),
+            'new_chunks': len(missing),
+            'reused_chunks': len(unique) - len(missing),
+            'total_bytes': len(payload_bytes),
+        })
+        self.last_transfer = stats
+        return True
+    
+    def _swap_metadata(self, key: str, metadata: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Atomically replace key's metadata, retiring and releasing what it pointed at."""
+        previous = self._parse_metadata(self.client.execute_command(*swap_pointer_command(key, metadata)))
+        self._release_manifest(key, previous)
+        return previous
+    
+    def _parse_metadata(self, metadata_json: Any) -> Optional[Dict[str, Any]]:
+        """Metadata/manifest from a raw reply, or None if absent or unreadable."""
+        try:
+            return json.loads(metadata_json) if isinstance(metadata_json, (str, bytes)) and metadata_json else None
+        except ValueError:
+            return None
+    
+    def _release_manifest(self, key: str, manifest: Optional[Dict[str, Any]]) -> None:
+        """Drop the chunk references of a replaced content-addressed manifest.
+        
+        Runs after the pointer has moved, so a failure is not fatal: the old
+        chunks just stay referenced and collect_chunks keeps them.
+        """
+        if manifest and manifest.get('type') == 'cas_payload':
+            try:
+                self._release_chunks(manifest['chunks'])
+            except RedisConnectionError as e:
+                print(f"🐛 Debug - Chunk release error: {e}")
+    
+    def _release_chunks(self, digests: List[str]) -> None:
+        """Drop one reference to each chunk; collect_chunks deletes chunks left at zero."""
+        with self.client.pipeline() as pipe:
+            for digest in dict.fromkeys(digests):
+                pipe.command('HINCRBY', CHUNK_REFS_KEY, digest, -1)
+    
+    def delete_massive_payload(self, key: str) -> bool:
+        """Delete a payload in any layout.
+        
+        Content-addressed chunks are released for collect_chunks; chunked
+        versions are retired for sweep_versions, so loads already under way
+        still finish.
+        """
+        try:
+            deleted = self.client.execute_command('DEL', key)
+            previous = self._swap_metadata(key, None)
+            return deleted > 0 or previous is not None
+        except RedisConnectionError as e:
+            print(f"🐛 Debug - Payload delete error: {e}")
+            return False
+    
+    def sweep_versions(self, grace_seconds: float = VERSION_GRACE_SECONDS,
+                       batch_size: int = SWEEP_BATCH) -> Dict[str, int]:
+        """Delete the chunks of payload versions retired over grace_seconds ago.
+        
+        Retired versions are taken batch_size at a time; each is deleted by
+        a script that first re-checks, atomically, that no pointer has moved
+        back to it. See VersionSweeper to run this in the background.
+        """
+        cutoff = repr(time.time() - grace_seconds)
+        candidates = 0
+        deleted = 0
+        while True:
+            members = self.client.execute_command(
+                'ZRANGEBYSCORE', RETIRED_VERSIONS_KEY, '-inf', cutoff, 'LIMIT', '0', str(batch_size)
+            ) or []
+            if not members:
+                break
+            with self.client.pipeline() as pipe:
+                for member in members:
+                    key, version, total_chunks = parse_retired_member(member)
+                    prefix = chunk_prefix(key, version)
+                    names = [f"{prefix}{i}" for i in range(total_chunks)]
+                    pipe.command('EVAL', SWEEP_VERSION_SCRIPT, str(2 + len(names)), f"{key}:metadata",
+                                 RETIRED_VERSIONS_KEY, *names, member, version, cutoff)
+            for result in pipe.results:
+                if isinstance(result, Exception):
+                    raise result
+            candidates += len(members)
+            deleted += sum(1 for result in pipe.results if str(result) == '1')
+            if len(members) < batch_size:
+                break
+        return {'candidates': candidates, 'deleted': deleted}
+    
+    def collect_chunks(self) -> Dict[str, int]:
+        """Delete content-addressed chunks that no manifest references.
+        
+        Each deletion re-checks the reference count atomically on the
+        server, so chunks a concurrent store has just referenced survive.
+        """
+        replies = self.client.execute_command('HGETALL', CHUNK_REFS_KEY) or []
+        if isinstance(replies, dict):
+            counts = {str(k): int(v) for k, v in replies.items()}
+        else:
+            counts = {str(replies[i]): int(replies[i + 1]) for i in range(0, len(replies) - 1, 2)}
+        
+        candidates = [digest for digest, count in counts.items() if count <= 0]
+        # Chunks with no reference entry at all (e.g. left by an interrupted upload)
+        for name in self.client.scan_iter(f"{CHUNK_PREFIX}*"):
+            digest = name[len(CHUNK_PREFIX):]
+            if digest not in counts:
+                candidates.append(digest)
+        
+        with self.client.pipeline() as pipe:
+            for digest in dict.fromkeys(candidates):
+                pipe.command('EVAL', COLLECT_CHUNK_SCRIPT, 2, CHUNK_REFS_KEY, chunk_key(digest), digest)
+        results = pipe.results or []
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        return {
+            'referenced': sum(1 for count in counts.values() if count > 0),
+            'candidates': len(results),
+            'deleted': sum(1 for result in results if str(result) == '1'),
+        }
+    
+    def load_massive_payload(self, key: str, timeout: Optional[float] = None,
+                             concurrency: int = PAYLOAD_CONCURRENCY, batch_bytes: int = PAYLOAD_BATCH_BYTES,
+                             progress: Optional[ProgressCallback] = None) -> Optional[Dict[str, Any]]:
+        """Load massive payload with chunking support; timeout bounds the whole load.
+        
+        Chunks are fetched with MGET batches of about batch_bytes, up to
+        concurrency at a time, and raw chunks are copied straight into one
+        preallocated buffer. When the metadata carries checksums, chunks that
+        do not match are re-read individually; the load fails (None) if one
+        still does not match after CHUNK_REFETCH_ATTEMPTS reads.
+        """
+        try:
+            with self.client.deadline(timeout):
+                # Try direct load first
+                direct_data = self.client.get_key(key)
+                if direct_data:
+                    return json.loads(direct_data)
+                
+                # Try chunked load
+                metadata_key = f"{key}:metadata"
+                metadata_json = self.client.get_key(metadata_key)
+                if not metadata_json:
                     return None
-                chunks.append(chunk_data)
-            
-            # Decode chunks
-            payload_bytes = b''
-            for chunk_encoded in chunks:
-                chunk_bytes = base64.b64decode(chunk_encoded.encode('utf-8'))
-                payload_bytes += chunk_bytes
+                
+                metadata = json.loads(metadata_json)
+                if metadata.get('type') == 'cas_payload':
+                    return self._load_deduplicated(metadata, concurrency, batch_bytes, progress)
+                if metadata.get('type') != 'chunked_payload':
+                    return None
+                
+                total_chunks = metadata['total_chunks']
+                prefix = chunk_prefix(key, metadata.get('version', ''))
+                chunk_size = metadata.get('chunk_size', 1024 * 1024)
+                raw = metadata.get('encoding') == 'raw'
+                checksums = metadata.get('checksums')
+                # Raw chunks are exact slices of the stored body; legacy base64 chunks vary in size
+                stored_size = metadata.get('stored_size', metadata.get('total_size', 0))
+                buffer = bytearray(stored_size) if raw else None
+                parts: List[Any] = [None] * total_chunks
+                corrupt: List[int] = []
+                meter = TransferMeter(stored_size, total_chunks, progress)
+                binary = self.client.supports_binary_values()
+                
+                def place(i: int, value: bytes) -> None:
+                    if raw:
+                        offset = i * chunk_size
+                        if offset + len(value) > stored_size:
+                            raise ValueError(f"Chunk {i} of {key} overflows the payload")
+                        buffer[offset:offset + len(value)] = value
+                    else:
+                        parts[i] = value
+                
+                def download(batch: range) -> None:
+                    keys = [f"{prefix}{i}" for i in batch]
+                    values = self.client.execute_command('MGET', *keys, raw=binary)
+                    nbytes = 0
+                    placed = 0
+                    for i, value in zip(batch, values):
+                        if isinstance(value, str):
+                            value = value.encode('utf-8')
+                        if checksums and (not value or chunk_checksum(value) != checksums[i]):
+                            corrupt.append(i)
+                            continue
+                        if not value:
+                            raise ValueError(f"Missing chunk {i} of {key}")
+                        place(i, value)
+                        nbytes += len(value)
+                        placed += 1
+                    meter.advance(nbytes, placed)
+                
+                # Reconstruct from chunks, fetched as raw bytes
+                run_batches(download, chunk_batches(total_chunks, chunk_size, batch_bytes), concurrency)
+                # Only chunks that failed verification are read again
+                for i in sorted(corrupt):
+                    value = self._refetch_chunk(f"{prefix}{i}", checksums[i], binary)
+                    place(i, value)
+                    meter.advance(len(value), 1)
+                self.last_transfer = dict(meter.get_stats(), refetched_chunks=len(corrupt))
             
-            payload_json = payload_bytes.decode('utf-8')
-            return json.loads(payload_json)
+            if raw:
+                return decode_payload_body(buffer, self.client.get_codec())
+            return assemble_payload_chunks(parts, metadata, self.client.get_codec())
             
         except Exception:
             return None
     
+    def store_stream(self, key: str, fileobj: BinaryIO, chunk_size: int = 1024*1024,
+                     progress: Optional[ProgressCallback] = None) -> int:
+        """Store a binary stream chunk by chunk in the versioned chunk/metadata layout.
+        
+        Regular files are memory-mapped and sliced without copying; pipes
+        such as stdin are read one chunk at a time, so peak memory stays
+        around one chunk. Chunks go to a fresh version and the metadata is
+        swapped to it at the end (a failed upload's chunks are retired for
+        sweep_versions). Streams of JSON load back with
+        load_massive_payload. Returns the number of bytes stored; raises
+        RedisConnectionError if a write fails.
+        """
+        binary = self.client.supports_binary_values()
+        meter = TransferMeter(_remaining_size(fileobj), 0, progress)
+        version = uuid.uuid4().hex[:16]
+        prefix = chunk_prefix(key, version)
+        total_size = 0
+        total_chunks = 0
+        checksums = []
+        try:
+            for chunk in _iter_chunks(fileobj, chunk_size):
+                value = chunk if binary else base64.b64encode(chunk).decode('ascii')
+                if self.client.execute_command('SET', f"{prefix}{total_chunks}", value) != 'OK':
+                    raise RedisConnectionError(f"Failed to store chunk {total_chunks} of {key}")
+                checksums.append(chunk_checksum(value))
+                total_size += len(chunk)
+                total_chunks += 1
+                meter.advance(len(chunk), 1)
+        except BaseException:
+            self._retire_version(key, version, total_chunks + 1)
+            raise
+        
+        metadata = {
+            'type': 'chunked_payload',
+            'encoding': 'raw' if binary else 'base64',
+            'compression': 'none',
+            'total_chunks': total_chunks,
+            'chunk_size': chunk_size,
+            'total_size': total_size,
+            'stored_size': total_size,
+            'checksum': CHUNK_CHECKSUM,
+            'checksums': checksums,
+            'version': version,
+            'timestamp': datetime.now().isoformat()
+        }
+        self._swap_metadata(key, metadata)
+        self.last_transfer = meter.get_stats()
+        return total_size
+    
+    def load_stream(self, key: str, fileobj: BinaryIO, progress: Optional[ProgressCallback] = None) -> Optional[int]:
+        """Write a stored payload to a binary stream one chunk at a time.
+        
+        Reads anything store_massive_payload or store_stream wrote, including
+        content-addressed manifests, legacy base64 and compressed chunks
+        (decompressed incrementally).
+        Returns the number of bytes written, or None if key does not exist;
+        raises RedisConnectionError or ValueError for failed or corrupt reads.
+        """
+        binary = self.client.supports_binary_values()
+        codec = self.client.get_codec()
+        
+        def fetch(name: str) -> Optional[bytes]:
+            value = self.client.execute_command('GET', name, raw=binary)
+            return value.encode('utf-8') if isinstance(value, str) else value
+        
+        direct = fetch(key)
+        if direct:
+            data = codec.decode(direct)
+            fileobj.write(data)
+            return len(data)
+        
+        metadata_json = self.client.get_key(f"{key}:metadata")
+        if not metadata_json:
+            return None
+        metadata = json.loads(metadata_json)
+        if metadata.get('type') == 'cas_payload':
+            meter = TransferMeter(metadata['total_size'], len(metadata['chunks']), progress)
+            written = 0
+            for digest in metadata['chunks']:
+                data = fetch(chunk_key(digest))
+                if not data:
+                    raise ValueError(f"Missing chunk {digest}")
+                data = codec.decode(data)
+                fileobj.write(data)
+                written += len(data)
+                meter.advance(len(data), 1)
+            self.last_transfer = meter.get_stats()
+            return written
+        if metadata.get('type') != 'chunked_payload':
+            return None
+        
+        meter = TransferMeter(metadata.get('stored_size', metadata.get('total_size', 0)),
+                              metadata['total_chunks'], progress)
+        checksums = metadata.get('checksums')
+        prefix = chunk_prefix(key, metadata.get('version', ''))
+        decompressor = None
+        written = 0
+        for i in range(metadata['total_chunks']):
+            data = fetch(f"{prefix}{i}")
+            if checksums and (not data or chunk_checksum(data) != checksums[i]):
+                data = self._refetch_chunk(f"{prefix}{i}", checksums[i], binary)
+            if not data:
+                raise ValueError(f"Missing chunk {i} of {key}")
+            meter.advance(len(data), 1)
+            if metadata.get('encoding') != 'raw':
+                data = base64.b64decode(data)
+            if i == 0:
+                decompressor, header_size = codec.stream_decoder(data)
+                data = data[header_size:]
+            if decompressor is not None:
+                data = decompressor.decompress(data)
+            fileobj.write(data)
+            written += len(data)
+        
+        flush = getattr(decompressor, 'flush', None)
+        if flush is not None:
+            tail = flush()
+            fileobj.write(tail)
+            written += len(tail)
+        self.last_transfer = meter.get_stats()
+        return written
+    
+    def _load_deduplicated(self, manifest: Dict[str, Any], concurrency: int, batch_bytes: int,
+                           progress: Optional[ProgressCallback]) -> Dict[str, Any]:
+        """Fetch a manifest's chunks by hash into one preallocated buffer."""
+        digests = manifest['chunks']
+        sizes = manifest['sizes']
+        offsets = [0] + list(accumulate(sizes))
+        buffer = bytearray(manifest['total_size'])
+        binary = self.client.supports_binary_values()
+        codec = self.client.get_codec()
+        meter = TransferMeter(manifest['total_size'], len(digests), progress)
+        
+        def download(batch: range) -> None:
+            values = self.client.execute_command('MGET', *(chunk_key(digests[i]) for i in batch), raw=binary)
+            for i, value in zip(batch, values):
+                buffer[offsets[i]:offsets[i + 1]] = decode_cas_chunk(value, digests[i], sizes[i], codec)
+            meter.advance(sum(sizes[i] for i in batch), len(batch))
+        
+        run_batches(download, chunk_batches(len(digests), DEDUP_AVG_CHUNK, batch_bytes), concurrency)
+        self.last_transfer = meter.get_stats()
+        return decode_payload_body(buffer, codec)
+    
+    def get_transfer_stats(self) -> Dict[str, Any]:
+        """Get bytes, requests and throughput of the last chunked store or load."""
+        return dict(self.last_transfer)
+    
     def export_to_clipboard(self, data: Any) -> bool:
         """Export data to clipboard (from mobile script patterns)."""
         try:
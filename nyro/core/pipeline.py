@@ -0,0 +1,80 @@
+"""
+Command Pipeline Module
+🧵 Synth: Batching many Redis commands into one round trip
+
+Buffers commands client-side and sends them together:
+- REST profiles: one POST to Upstash's /pipeline endpoint
+- RESP profiles: one pipelined socket write, replies read in order
+
+Transactions use the same buffer but commit atomically through Upstash's
+/multi-exec endpoint or MULTI/EXEC on RESP.
+"""
+
+from typing import Any, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import RedisClient
+
+
+class Pipeline:
+    """Buffered command batch created by RedisClient.pipeline() or transaction()."""
+
+    def __init__(self, client: 'RedisClient', transaction: bool = False):
+        """Initialize an empty batch bound to a client."""
+        self.client = client
+        self.transaction = transaction
+        self.commands: List[List[Any]] = []
+        self.results: Optional[List[Any]] = None
+
+    def __enter__(self) -> 'Pipeline':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # Send on clean exit only; an exception inside the block discards the batch
+        if exc_type is None and self.commands:
+            self.execute()
+        self.commands = []
+
+    def __len__(self) -> int:
+        return len(self.commands)
+
+    def command(self, *args: Any) -> 'Pipeline':
+        """Queue an arbitrary Redis command, e.g. command('HSET', 'h', 'f', 'v')."""
+        if not args:
+            raise ValueError("Empty command")
+        self.commands.append(list(args))
+        return self
+
+    # Shortcuts mirroring RedisClient's basic operations
+    def set_key(self, key: str, value: str) -> 'Pipeline':
+        """Queue SET."""
+        return self.command('SET', key, value)
+
+    def get_key(self, key: str) -> 'Pipeline':
+        """Queue GET."""
+        return self.command('GET', key)
+
+    def delete_key(self, key: str) -> 'Pipeline':
+        """Queue DEL."""
+        return self.command('DEL', key)
+
+    def execute(self, raise_on_error: bool = False) -> List[Any]:
+        """Send all queued commands and return their results in order.
+
+        Failed commands appear in the result list as RedisCommandError
+        instances unless raise_on_error is set, in which case the first
+        error is raised after the whole batch has run. For transactions, a
+        batch the server refuses to commit raises RedisCommandError and
+        none of its writes are applied.
+        """
+        commands, self.commands = self.commands, []
+        if not commands:
+            self.results = []
+            return self.results
+
+        self.results = self.client._execute_pipeline(commands, transaction=self.transaction)
+        if raise_on_error:
+            for result in self.results:
+                if isinstance(result, Exception):
+                    raise result
+        return self.results
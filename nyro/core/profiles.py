@@ -14,6 +14,16 @@ from dataclasses import dataclass
 from pathlib import Path
 
 
+def _parse_bool(value: str) -> bool:
+    """Parse .env booleans (1/0, true/false, yes/no, on/off)."""
+    lowered = value.strip().lower()
+    if lowered in ('1', 'true', 'yes', 'on'):
+        return True
+    if lowered in ('0', 'false', 'no', 'off'):
+        return False
+    raise ValueError(f"Not a boolean: {value}")
+
+
 @dataclass
 class ProfileConfig:
     """Configuration for a Redis database profile."""
@@ -21,11 +31,45 @@ class ProfileConfig:
     token: str
     name: str
     description: Optional[str] = None
+    pool_size: int = 10
+    transport: str = 'auto'  # 'auto' (native RESP for redis://) or 'cli' (redis-cli)
+    resp_protocol: int = 2
+    cache_size: int = 0  # get_key cache entries; 0 disables the client-side cache
+    cache_ttl: float = 30.0
+    cache_tracking: bool = False  # RESP only: CLIENT TRACKING invalidation
+    retries: int = 2  # extra attempts for idempotent commands on transient errors
+    retry_backoff: float = 0.1
+    retry_max_backoff: float = 2.0
+    breaker_threshold: int = 5  # consecutive transient failures before failing fast; 0 disables
+    breaker_reset: float = 30.0
+    timeout: float = 30.0  # per-command timeout in seconds
+    hedge_after: float = 0.0  # duplicate slow idempotent reads after this many seconds; 0 disables
+    compression: str = 'none'  # 'none', 'zlib', 'zstd' or 'lz4' for large values
+    compression_threshold: int = 1024  # values smaller than this many bytes stay uncompressed
 
 
 class ProfileManager:
     """Manages multiple Redis database profiles and credentials."""
     
+    # Optional per-profile tuning (PROFILE_X_POOL_SIZE, or NYRO_POOL_SIZE for all)
+    OPTION_TYPES = {
+        'pool_size': int,
+        'transport': str.lower,
+        'resp_protocol': int,
+        'cache_size': int,
+        'cache_ttl': float,
+        'cache_tracking': _parse_bool,
+        'retries': int,
+        'retry_backoff': float,
+        'retry_max_backoff': float,
+        'breaker_threshold': int,
+        'breaker_reset': float,
+        'timeout': float,
+        'hedge_after': float,
+        'compression': str.lower,
+        'compression_threshold': int,
+    }
+    
     def __init__(self, env_file: Optional[str] = None, debug: bool = False):
         """Initialize profile manager with environment file."""
         self.debug = debug
@@ -80,7 +124,8 @@ class ProfileManager:
                 url=default_url,
                 token=default_token, 
                 name='default',
-                description='Default Redis database'
+                description='Default Redis database',
+                **self._load_options(env_vars, 'NYRO_')
             )
             self.current_profile = 'default'
         
@@ -103,9 +148,25 @@ class ProfileManager:
                     url=url,
                     token=token,
                     name=profile_name,
-                    description=f'Redis profile: {profile_name}'
+                    description=f'Redis profile: {profile_name}',
+                    **self._load_options(env_vars, f'PROFILE_{profile_name.upper()}_')
                 )
     
+    def _load_options(self, env_vars: Dict[str, str], prefix: str) -> Dict[str, Any]:
+        """Load tuning options for a profile, falling back to global NYRO_ settings."""
+        options: Dict[str, Any] = {}
+        for option, cast in self.OPTION_TYPES.items():
+            env_key = option.upper()
+            value = env_vars.get(f'{prefix}{env_key}', env_vars.get(f'NYRO_{env_key}'))
+            if value is None or value == '':
+                continue
+            try:
+                options[option] = cast(value)
+            except ValueError:
+                if self.debug:
+                    print(f"⚠️ Ignoring invalid {prefix}{env_key}={value}")
+        return options
+    
     def list_profiles(self) -> Dict[str, ProfileConfig]:
         """Get all available profiles."""
         return self.profiles.copy()
@@ -0,0 +1,358 @@
+"""
+Native RESP Protocol Module
+🧵 Synth: In-process Redis wire protocol instead of one redis-cli per command
+
+Replaces the subprocess pattern of get-key.sh / set-key.sh with:
+- RESP2/RESP3 request encoding and reply parsing
+- TLS-capable socket connections (rediss://)
+- A keep-alive connection pool shared by all commands of a profile
+"""
+
+import socket
+import ssl
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse, unquote
+
+
+class RespError(Exception):
+    """Error reply returned by the Redis server (e.g. WRONGTYPE, ERR)."""
+    pass
+
+
+class RespProtocolError(Exception):
+    """Malformed or unexpected data on the wire."""
+    pass
+
+
+class SimpleString(str):
+    """Status reply (+OK, +PONG) kept distinct from bulk strings."""
+    pass
+
+
+def encode_command(args: Tuple[Any, ...]) -> bytes:
+    """Encode a command as a RESP array of bulk strings."""
+    parts = [b'*%d\r\n' % len(args)]
+    for arg in args:
+        if isinstance(arg, (bytes, bytearray, memoryview)):
+            data = bytes(arg)
+        elif isinstance(arg, str):
+            data = arg.encode('utf-8')
+        elif isinstance(arg, (int, float)):
+            data = repr(arg).encode('ascii')
+        else:
+            raise TypeError(f"Cannot encode argument of type {type(arg).__name__}")
+        parts.append(b'$%d\r\n' % len(data))
+        parts.append(data)
+        parts.append(b'\r\n')
+    return b''.join(parts)
+
+
+def decode_reply(reply: Any, encoding: str = 'utf-8') -> Any:
+    """Recursively decode bulk-string bytes in a reply to str."""
+    if isinstance(reply, bytes):
+        return reply.decode(encoding, errors='replace')
+    if isinstance(reply, list):
+        return [decode_reply(item, encoding) for item in reply]
+    if isinstance(reply, dict):
+        return {decode_reply(k, encoding): decode_reply(v, encoding) for k, v in reply.items()}
+    if isinstance(reply, set):
+        return [decode_reply(item, encoding) for item in reply]
+    return reply
+
+
+class RespReader:
+    """Parse RESP2 and RESP3 replies from a buffered binary stream."""
+
+    def __init__(self, stream):
+        """Wrap a file-like object supporting readline() and read()."""
+        self.stream = stream
+
+    def _readline(self) -> bytes:
+        line = self.stream.readline()
+        if not line:
+            raise ConnectionError("Connection closed by server")
+        if not line.endswith(b'\r\n'):
+            raise RespProtocolError(f"Unterminated line: {line!r}")
+        return line[:-2]
+
+    def _read_exact(self, length: int) -> bytes:
+        data = self.stream.read(length + 2)
+        if data is None or len(data) < length + 2:
+            raise ConnectionError("Connection closed by server")
+        return data[:-2]
+
+    def read_reply(self) -> Any:
+        """Read one complete reply; error replies are returned as RespError instances."""
+        line = self._readline()
+        if not line:
+            raise RespProtocolError("Empty reply line")
+        prefix, body = line[:1], line[1:]
+
+        if prefix == b'+':
+            return SimpleString(body.decode('utf-8', errors='replace'))
+        if prefix == b'-':
+            return RespError(body.decode('utf-8', errors='replace'))
+        if prefix == b':':
+            return int(body)
+        if prefix == b'$':
+            length = int(body)
+            return None if length < 0 else self._read_exact(length)
+        if prefix in (b'*', b'~', b'>'):
+            length = int(body)
+            if length < 0:
+                return None
+            return [self.read_reply() for _ in range(length)]
+        if prefix == b'%':
+            length = int(body)
+            result = {}
+            for _ in range(length):
+                key = self.read_reply()
+                result[key] = self.read_reply()
+            return result
+        # RESP3-only types
+        if prefix == b'_':
+            return None
+        if prefix == b'#':
+            return body == b't'
+        if prefix == b',':
+            return float(body)
+        if prefix == b'(':
+            return int(body)
+        if prefix == b'!':
+            return RespError(self._read_exact(int(body)).decode('utf-8', errors='replace'))
+        if prefix == b'=':
+            # Verbatim string: "txt:" format marker then payload
+            return self._read_exact(int(body))[4:]
+        if prefix == b'|':
+            # Attributes precede the actual reply; skip them
+            for _ in range(int(body) * 2):
+                self.read_reply()
+            return self.read_reply()
+        raise RespProtocolError(f"Unknown reply type: {prefix!r}")
+
+
+class RespConnection:
+    """Single socket connection speaking RESP to a Redis server."""
+
+    def __init__(self, host: str, port: int = 6379, username: Optional[str] = None,
+                 password: Optional[str] = None, db: int = 0, use_tls: bool = False,
+                 protocol: int = 2, timeout: Optional[float] = 30.0):
+        """Store connection parameters; the socket opens on connect()."""
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.db = db
+        self.use_tls = use_tls
+        self.protocol = protocol
+        self.timeout = timeout
+        self.sock: Optional[socket.socket] = None
+        self.reader: Optional[RespReader] = None
+        self.reused = False
+
+    def connect(self) -> None:
+        """Open the socket, negotiate TLS/protocol, authenticate and select db."""
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if self.use_tls:
+            context = ssl.create_default_context()
+            sock = context.wrap_socket(sock, server_hostname=self.host)
+        self.sock = sock
+        self.reader = RespReader(sock.makefile('rb'))
+
+        try:
+            self._handshake()
+        except Exception:
+            self.disconnect()
+            raise
+
+    def _handshake(self) -> None:
+        """Authenticate using HELLO (RESP3) or AUTH (RESP2)."""
+        if self.protocol == 3:
+            hello = ['HELLO', '3']
+            if self.password:
+                hello.extend(['AUTH', self.username or 'default', self.password])
+            reply = self.execute(*hello, raise_errors=False)
+            if isinstance(reply, RespError):
+                # Server predates RESP3 - fall back to RESP2 handshake
+                self.protocol = 2
+            else:
+                self._select_db()
+                return
+
+        if self.password:
+            if self.username:
+                self.execute('AUTH', self.username, self.password)
+            else:
+                self.execute('AUTH', self.password)
+        self._select_db()
+
+    def _select_db(self) -> None:
+        if self.db:
+            self.execute('SELECT', str(self.db))
+
+    def disconnect(self) -> None:
+        """Close the socket."""
+        if self.sock is not None:
+            try:
+                self.sock.close()
+            except OSError:
+                pass
+        self.sock = None
+        self.reader = None
+
+    @property
+    def is_connected(self) -> bool:
+        """True while the socket is open."""
+        return self.sock is not None
+
+    def send_command(self, *args: Any) -> None:
+        """Write one encoded command to the socket."""
+        if self.sock is None:
+            self.connect()
+        self.sock.sendall(encode_command(args))
+
+    def read_reply(self, raise_errors: bool = True) -> Any:
+        """Read one reply, raising RespError for error replies by default."""
+        reply = self.reader.read_reply()
+        if raise_errors and isinstance(reply, RespError):
+            raise reply
+        return reply
+
+    def set_timeout(self, timeout: Optional[float]) -> None:
+        """Change the socket timeout for subsequent sends and reads."""
+        if self.sock is not None:
+            self.sock.settimeout(timeout)
+
+    def execute(self, *args: Any, raise_errors: bool = True) -> Any:
+        """Send a command and wait for its reply."""
+        self.send_command(*args)
+        return self.read_reply(raise_errors)
+
+
+def parse_redis_url(url: str) -> Dict[str, Any]:
+    """Split a redis:// or rediss:// URL into RespConnection keyword arguments."""
+    parsed = urlparse(url)
+    if parsed.scheme not in ('redis', 'rediss'):
+        raise ValueError(f"Unsupported Redis URL scheme: {parsed.scheme}")
+
+    db = 0
+    path = parsed.path.lstrip('/')
+    if path:
+        try:
+            db = int(path)
+        except ValueError:
+            raise ValueError(f"Invalid database number in URL: {path}")
+
+    return {
+        'host': parsed.hostname or 'localhost',
+        'port': parsed.port or 6379,
+        'username': unquote(parsed.username) if parsed.username else None,
+        'password': unquote(parsed.password) if parsed.password else None,
+        'db': db,
+        'use_tls': parsed.scheme == 'rediss',
+    }
+
+
+class RespConnectionPool:
+    """Keep-alive pool of RESP connections for one profile."""
+
+    def __init__(self, url: str, max_connections: int = 10, protocol: int = 2,
+                 timeout: Optional[float] = 30.0):
+        """Initialize pool for a redis:// or rediss:// URL."""
+        self.connection_kwargs = parse_redis_url(url)
+        self.connection_kwargs.update({'protocol': protocol, 'timeout': timeout})
+        self.max_connections = max_connections
+        # Called with each newly opened connection (e.g. to enable CLIENT TRACKING)
+        self.on_connect: Optional[Callable[[RespConnection], None]] = None
+        self._idle: List[RespConnection] = []
+        self._in_use = 0
+        self._lock = threading.Condition()
+        self.stats = {'requests': 0, 'hits': 0, 'misses': 0}
+
+    def get_connection(self) -> RespConnection:
+        """Take an idle connection, or open a new one if under the limit."""
+        with self._lock:
+            while not self._idle and self._in_use >= self.max_connections:
+                self._lock.wait()
+            self._in_use += 1
+            self.stats['requests'] += 1
+            if self._idle:
+                self.stats['hits'] += 1
+                connection = self._idle.pop()
+                connection.reused = True
+                return connection
+            self.stats['misses'] += 1
+
+        connection = RespConnection(**self.connection_kwargs)
+        try:
+            connection.connect()
+            if self.on_connect is not None:
+                self.on_connect(connection)
+        except Exception:
+            connection.disconnect()
+            self.release(connection)
+            raise
+        return connection
+
+    def release(self, connection: RespConnection) -> None:
+        """Return a connection to the pool (broken connections are dropped)."""
+        with self._lock:
+            self._in_use -= 1
+            if connection.is_connected:
+                self._idle.append(connection)
+            self._lock.notify()
+
+    def execute(self, *args: Any, timeout: Optional[float] = None) -> Any:
+        """Run one command on a pooled connection.
+
+        An idle connection the server has already closed is retried once
+        on a fresh connection; a timeout is not retried.
+        """
+        for attempt in range(2):
+            connection = self.get_connection()
+            try:
+                connection.set_timeout(timeout if timeout is not None else connection.timeout)
+                return connection.execute(*args)
+            except socket.timeout:
+                # Reply may still arrive later; the connection is unusable. (socket.timeout
+                # is TimeoutError from 3.10, but only an OSError subclass before that.)
+                connection.disconnect()
+                raise
+            except (OSError, ConnectionError, RespProtocolError):
+                connection.disconnect()
+                if attempt or not connection.reused:
+                    raise
+            finally:
+                self.release(connection)
+
+    def execute_many(self, commands: List[List[Any]], timeout: Optional[float] = None) -> List[Any]:
+        """Pipeline several commands on one connection.
+
+        All commands are written in a single send; replies are read back in
+        order and error replies are returned in place as RespError.
+        """
+        connection = self.get_connection()
+        try:
+            connection.set_timeout(timeout if timeout is not None else connection.timeout)
+            connection.sock.sendall(b''.join(encode_command(tuple(cmd)) for cmd in commands))
+            return [connection.read_reply(raise_errors=False) for _ in commands]
+        except (OSError, ConnectionError, RespProtocolError):
+            connection.disconnect()
+            raise
+        finally:
+            self.release(connection)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get connection reuse counters."""
+        stats = dict(self.stats)
+        stats['pool_size'] = self.max_connections
+        return stats
+
+    def disconnect(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            for connection in self._idle:
+                connection.disconnect()
+            self._idle.clear()
@@ -0,0 +1,190 @@
+"""
+Retry and Circuit Breaker Module
+🧵 Synth: Riding out transient failures without piling up timeouts
+
+Provides:
+- RetryPolicy: exponential backoff with jitter for idempotent commands
+- CircuitBreaker: per-profile fail-fast while an endpoint keeps failing
+- is_idempotent / is_read_only: which commands are safe to send twice
+"""
+
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from .errors import RedisCommandError, RedisTransientError, CircuitOpenError, DeadlineExceededError
+from .deadline import Deadline
+
+
+# Commands that only read; safe to retry and to hedge with a duplicate request
+READ_COMMANDS = {
+    'PING', 'GET', 'MGET', 'EXISTS', 'TYPE', 'STRLEN', 'GETRANGE', 'TTL', 'PTTL',
+    'SCAN', 'LRANGE', 'LLEN', 'LINDEX', 'XRANGE', 'XREVRANGE', 'XLEN', 'XINFO',
+    'HGET', 'HGETALL', 'HMGET', 'HLEN', 'HKEYS', 'HVALS', 'SMEMBERS', 'SCARD', 'SISMEMBER',
+    'ZRANGE', 'ZSCORE', 'ZCARD', 'DBSIZE', 'INFO',
+}
+
+# Commands whose repetition leaves the same state and the same reply: reads, and
+# writes that set absolute state and answer OK. Writes that count what they
+# changed (DEL, HSET, SADD, ZADD, ...) are left out: a retry after a lost reply
+# would report 0, and callers read that count as "nothing was there".
+IDEMPOTENT_COMMANDS = READ_COMMANDS | {
+    'SET', 'MSET', 'EXPIRE', 'PEXPIRE', 'EXPIREAT', 'PEXPIREAT',
+    # A read, but not hedged: XREAD BLOCK is slow by design
+    'XREAD',
+}
+
+# Options that make an otherwise idempotent command's reply depend on the state it finds
+CONDITIONAL_OPTIONS = {
+    'SET': {'NX', 'XX', 'GET'},
+    'EXPIRE': {'NX', 'XX', 'GT', 'LT'},
+    'PEXPIRE': {'NX', 'XX', 'GT', 'LT'},
+    'EXPIREAT': {'NX', 'XX', 'GT', 'LT'},
+    'PEXPIREAT': {'NX', 'XX', 'GT', 'LT'},
+}
+
+
+def _command_name(args: Sequence[Any]) -> str:
+    name = args[0]
+    if isinstance(name, (bytes, bytearray, memoryview)):
+        name = bytes(name).decode('utf-8', errors='replace')
+    return str(name).upper()
+
+
+def is_idempotent(args: Sequence[Any]) -> bool:
+    """Check if a command can be retried without changing its effect or its reply."""
+    name = _command_name(args)
+    if name not in IDEMPOTENT_COMMANDS:
+        return False
+    conditional = CONDITIONAL_OPTIONS.get(name)
+    # Option words are short; values (which may be binary) are not inspected
+    return not conditional or not any(
+        isinstance(arg, (str, bytes)) and len(arg) <= 4 and _command_name([arg]) in conditional
+        for arg in args[3 if name == 'SET' else 2:]
+    )
+
+
+def is_read_only(args: Sequence[Any]) -> bool:
+    """Check if a command only reads (eligible for hedged requests)."""
+    return _command_name(args) in READ_COMMANDS
+
+
+class CircuitBreaker:
+    """Closed -> open after repeated failures -> half-open probe after a cool-down."""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """Initialize a closed breaker; failure_threshold <= 0 disables it."""
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError if calls should fail fast."""
+        if self.failure_threshold <= 0:
+            return
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            if self.state == self.OPEN:
+                remaining = self.opened_at + self.reset_timeout - time.monotonic()
+                if remaining > 0:
+                    raise CircuitOpenError(f"Circuit open after {self.failures} failures; retry in {remaining:.1f}s")
+                self.state = self.HALF_OPEN
+                self._probing = False
+            # Half-open: let a single probe through
+            if self._probing:
+                raise CircuitOpenError("Circuit half-open; probe request in flight")
+            self._probing = True
+
+    def release_probe(self) -> None:
+        """Let another probe through after a call ended without a verdict."""
+        with self._lock:
+            self._probing = False
+
+    def record_success(self) -> None:
+        """Close the circuit after a call reached the server."""
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._probing = False
+
+    def record_failure(self) -> None:
+        """Count a transient failure, opening the circuit at the threshold."""
+        if self.failure_threshold <= 0:
+            return
+        with self._lock:
+            self.failures += 1
+            self._probing = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
+class RetryPolicy:
+    """Exponential backoff with jitter for transient failures."""
+
+    def __init__(self, retries: int = 2, backoff: float = 0.1, max_backoff: float = 2.0):
+        """retries is the number of extra attempts after the first."""
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.stats = {'retries': 0, 'gave_up': 0, 'fast_failed': 0}
+
+    def delay(self, attempt: int) -> float:
+        """Backoff before retry number attempt (1-based): half fixed, half random."""
+        ceiling = min(self.max_backoff, self.backoff * (2 ** (attempt - 1)))
+        return ceiling / 2 + random.uniform(0, ceiling / 2)
+
+    def run(self, operation: Callable[[], Any], breaker: CircuitBreaker, retryable: bool = True,
+            deadline: Optional[Deadline] = None) -> Any:
+        """Call operation, retrying transient errors if retryable.
+
+        Error replies (RedisCommandError) mean the server was reached, so
+        they count as breaker successes and are never retried. No attempt
+        or backoff sleep runs past the deadline.
+        """
+        attempt = 0
+        while True:
+            if deadline is not None:
+                deadline.check()
+            try:
+                breaker.before_call()
+            except CircuitOpenError:
+                self.stats['fast_failed'] += 1
+                raise
+            try:
+                result = operation()
+            except RedisCommandError:
+                breaker.record_success()
+                raise
+            except RedisTransientError as e:
+                breaker.record_failure()
+                attempt += 1
+                if not retryable or attempt > self.retries:
+                    self.stats['gave_up'] += 1
+                    raise
+                delay = self.delay(attempt)
+                if deadline is not None and delay >= deadline.remaining():
+                    self.stats['gave_up'] += 1
+                    raise DeadlineExceededError(f"Deadline of {deadline.seconds:g}s exceeded: {e}") from e
+                self.stats['retries'] += 1
+                time.sleep(delay)
+                continue
+            except BaseException:
+                breaker.release_probe()
+                raise
+            breaker.record_success()
+            return result
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get retry counters."""
+        return dict(self.stats)
@@ -0,0 +1,86 @@
+"""
+HTTP Session Pool Module
+🧵 Synth: Keep-alive connection reuse for the Upstash REST transport
+
+Replaces the per-command requests.get/requests.post calls (and the
+one-curl-per-command pattern of redis-rest.sh) with one long-lived,
+pooled requests.Session per profile.
+"""
+
+import threading
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .profiles import ProfileConfig
+
+
+class SessionPool:
+    """Long-lived keep-alive HTTP sessions, one per profile."""
+
+    def __init__(self):
+        """Initialize an empty session pool."""
+        self._sessions: Dict[str, requests.Session] = {}
+        self._signatures: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+
+    def _create_session(self, config: ProfileConfig) -> requests.Session:
+        """Create a session whose adapter keeps up to pool_size connections alive."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=config.pool_size,
+            pool_block=False
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def get_session(self, config: ProfileConfig) -> requests.Session:
+        """Get the pooled session for a profile, creating it on first use."""
+        signature = (config.url, config.pool_size)
+        with self._lock:
+            session = self._sessions.get(config.name)
+            if session is not None and self._signatures.get(config.name) == signature:
+                return session
+
+            # Profile settings changed (or first use) - start a fresh pool
+            if session is not None:
+                session.close()
+            session = self._create_session(config)
+            self._sessions[config.name] = session
+            self._signatures[config.name] = signature
+            return session
+
+    def get_stats(self, profile_name: str) -> Dict[str, int]:
+        """Get connection reuse counters for a profile's session.
+
+        A request served by an already-open connection counts as a hit;
+        a request that had to open a new TCP+TLS connection counts as a miss.
+        """
+        stats = {'requests': 0, 'hits': 0, 'misses': 0, 'pool_size': 0}
+        session = self._sessions.get(profile_name)
+        if session is None:
+            return stats
+
+        adapter = session.get_adapter('https://')
+        stats['pool_size'] = adapter._pool_maxsize
+        for pool_key in list(adapter.poolmanager.pools.keys()):
+            pool = adapter.poolmanager.pools.get(pool_key)
+            if pool is None:
+                continue
+            stats['requests'] += pool.num_requests
+            stats['misses'] += pool.num_connections
+        stats['hits'] = max(stats['requests'] - stats['misses'], 0)
+        return stats
+
+    def close(self, profile_name: Optional[str] = None) -> None:
+        """Close one profile's session, or all sessions."""
+        with self._lock:
+            names = [profile_name] if profile_name else list(self._sessions)
+            for name in names:
+                session = self._sessions.pop(name, None)
+                self._signatures.pop(name, None)
+                if session is not None:
+                    session.close()
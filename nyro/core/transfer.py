@@ -0,0 +1,111 @@
+"""
+Chunk Transfer Module
+🧵 Synth: Moving massive payload chunks in bounded parallel batches
+
+Provides:
+- TransferMeter: thread-safe byte/chunk counters, throughput and progress callbacks
+- chunk_batches: split chunk indexes into batches bounded by count
+- run_batches: run batch transfers with a bounded number in flight
+- chunk_checksum / CHUNK_CHECKSUM_SCRIPT: per-chunk SHA-1, computed locally or
+  server-side, for resumable uploads and verified loads
+"""
+
+import contextvars
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+
+# Default request budget and parallelism for chunked payload transfers
+PAYLOAD_BATCH_BYTES = 4 * 1024 * 1024
+PAYLOAD_CONCURRENCY = 4
+
+ProgressCallback = Callable[[int, int], None]
+
+# Chunks are checksummed with SHA-1 (integrity, not security) because Redis
+# can compute it too: resuming compares stored chunks without downloading them
+CHUNK_CHECKSUM = 'sha1'
+CHUNK_CHECKSUM_SCRIPT = """
+local sums = {}
+for i, name in ipairs(KEYS) do
+  local value = redis.call('GET', name)
+  if value then sums[i] = redis.sha1hex(value) else sums[i] = '' end
+end
+return sums
+"""
+CHECKSUM_BATCH_KEYS = 500
+
+# Re-reads of a chunk that fails verification before the load gives up
+CHUNK_REFETCH_ATTEMPTS = 3
+
+
+class TransferMeter:
+    """Counts transferred bytes and chunks, reporting progress as batches finish."""
+
+    def __init__(self, total_bytes: int, total_chunks: int, progress: Optional[ProgressCallback] = None):
+        """progress is called as progress(done_bytes, total_bytes) after each batch."""
+        self.total_bytes = total_bytes
+        self.total_chunks = total_chunks
+        self.progress = progress
+        self.bytes = 0
+        self.chunks = 0
+        self.requests = 0
+        self.started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def advance(self, nbytes: int, chunks: int) -> None:
+        """Record one finished request that moved nbytes in chunks chunks."""
+        with self._lock:
+            self.bytes += nbytes
+            self.chunks += chunks
+            self.requests += 1
+            done = self.bytes
+        if self.progress is not None:
+            self.progress(done, self.total_bytes)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get bytes, requests, elapsed seconds and throughput so far."""
+        seconds = time.perf_counter() - self.started
+        return {
+            'bytes': self.bytes,
+            'chunks': self.chunks,
+            'requests': self.requests,
+            'seconds': seconds,
+            'mb_per_s': self.bytes / (1024 * 1024) / seconds if seconds > 0 else 0.0,
+        }
+
+
+def chunk_batches(total_chunks: int, chunk_size: int, batch_bytes: int = PAYLOAD_BATCH_BYTES) -> List[range]:
+    """Group chunk indexes into ranges of at most batch_bytes worth of chunks (at least one each)."""
+    per_batch = max(1, batch_bytes // max(1, chunk_size))
+    return [range(start, min(start + per_batch, total_chunks)) for start in range(0, total_chunks, per_batch)]
+
+
+def run_batches(transfer: Callable[[range], Any], batches: Sequence[range],
+                concurrency: int = PAYLOAD_CONCURRENCY) -> List[Any]:
+    """Run transfer(batch) for every batch with at most concurrency in flight.
+
+    Results come back in batch order. The first failure cancels batches not
+    yet started and is raised once those in flight finish. Each worker runs
+    in a copy of the caller's context, so an enclosing client.deadline()
+    still applies.
+    """
+    if concurrency <= 1 or len(batches) <= 1:
+        return [transfer(batch) for batch in batches]
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(batches))) as executor:
+        futures = [executor.submit(contextvars.copy_context().run, transfer, batch) for batch in batches]
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+
+def chunk_checksum(value: Union[bytes, bytearray, memoryview, str]) -> str:
+    """Hex SHA-1 of a chunk exactly as stored (text chunks as UTF-8)."""
+    if isinstance(value, str):
+        value = value.encode('utf-8')
+    return hashlib.sha1(value).hexdigest()
@@ -0,0 +1,495 @@
+"""
+Profile Transport Module
+🧵 Synth: One resolved transport per profile instead of per-call branching
+
+Replaces the per-command `_get_current_config()` / `urlparse` / header
+rebuilding in RedisClient and RedisOperations with:
+- RestTransport: Upstash REST over a keep-alive session, headers prebuilt
+- RespTransport: native RESP over a pooled socket connection
+- CliTransport: redis-cli subprocess fallback (transport=cli)
+
+Each transport is built once per profile and carries its capabilities, so
+callers dispatch through `execute()` / `execute_many()` without re-checking
+URL schemes.
+"""
+
+import base64
+import dataclasses
+import json
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout, as_completed
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from urllib.parse import urlparse, quote
+
+import requests
+
+from .profiles import ProfileConfig
+from .sessions import SessionPool
+from .resp import RespConnectionPool, RespError, RespProtocolError, decode_reply
+from .errors import RedisConnectionError, RedisCommandError, RedisTransientError
+from .cache import KeyCache, TrackingListener
+from .retry import CircuitBreaker, RetryPolicy
+from .deadline import current_deadline
+from .codec import ValueCodec
+
+
+# Argument type -> JSON-safe text for REST bodies; bytes must be valid UTF-8 here
+REST_ARG_ENCODERS: Dict[type, Callable[[Any], str]] = {
+    str: lambda arg: arg,
+    bytes: lambda arg: arg.decode('utf-8'),
+    bytearray: lambda arg: bytes(arg).decode('utf-8'),
+    memoryview: lambda arg: arg.tobytes().decode('utf-8'),
+    int: str,
+    float: repr,
+}
+
+
+def encode_rest_args(args: Any) -> List[str]:
+    """Encode command arguments for an Upstash JSON body.
+
+    Raises UnicodeDecodeError for binary arguments that JSON cannot carry.
+    """
+    encoded = []
+    for arg in args:
+        encoder = REST_ARG_ENCODERS.get(type(arg))
+        if encoder is None:
+            raise TypeError(f"Cannot encode argument of type {type(arg).__name__}")
+        encoded.append(encoder(arg))
+    return encoded
+
+
+def decode_base64_result(value: Any) -> Any:
+    """Decode a result sent with Upstash-Encoding: base64 into raw bytes."""
+    if isinstance(value, str):
+        return base64.b64decode(value)
+    if isinstance(value, list):
+        return [decode_base64_result(item) for item in value]
+    return value
+
+
+def is_rest_url(url: str) -> bool:
+    """Check if URL is a REST API endpoint."""
+    return urlparse(url).scheme in ('http', 'https')
+
+
+def transport_signature(config: ProfileConfig) -> tuple:
+    """Profile settings a resolved transport depends on."""
+    return dataclasses.astuple(config)
+
+
+def rest_error(error: Exception) -> RedisConnectionError:
+    """Map a requests/JSON failure to a transient or permanent connection error."""
+    if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+        return RedisTransientError(f"REST API error: {error}")
+    response = getattr(error, 'response', None)
+    if response is not None and (response.status_code >= 500 or response.status_code == 429):
+        return RedisTransientError(f"REST API error: {error}")
+    return RedisConnectionError(f"REST API error: {error}")
+
+
+class Transport:
+    """Resolved connection for one profile; subclasses implement the wire format."""
+
+    name = 'base'
+    supports_pipelining = False
+    supports_transactions = False
+    binary_safe = False
+    binary_batches = False
+    # Blocking commands (XREAD BLOCK) can hold a request open for as long as they ask
+    supports_blocking = False
+
+    def __init__(self, config: ProfileConfig):
+        """Bind the transport to the profile it was resolved from."""
+        self.config = config
+        self.profile_name = config.name
+        self.signature = transport_signature(config)
+        self.cache: Optional[KeyCache] = (
+            KeyCache(config.cache_size, config.cache_ttl) if config.cache_size > 0 else None
+        )
+        self.retry_policy = RetryPolicy(config.retries, config.retry_backoff, config.retry_max_backoff)
+        self.breaker = CircuitBreaker(config.breaker_threshold, config.breaker_reset)
+        self.timeout = config.timeout
+        self.hedge_after = config.hedge_after
+        self.hedge_stats = {'hedged': 0, 'backup_wins': 0}
+        try:
+            # Always present: reads auto-detect compressed values even with compression off
+            self.codec = ValueCodec(config.compression, config.compression_threshold)
+        except ValueError as e:
+            raise RedisConnectionError(f"Invalid compression setting: {e}")
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def run(self, operation: Callable[[Optional[float]], Any], retryable: bool,
+            timeout: Optional[float] = None, hedge: bool = False) -> Any:
+        """Call operation(timeout) under the profile's retry policy, breaker and deadline.
+
+        Each attempt gets the per-command timeout (the profile's, unless
+        overridden) capped by the deadline of the calling context. With
+        hedge set and hedge_after configured, a slow attempt is duplicated.
+        """
+        deadline = current_deadline()
+        limit = self.timeout if timeout is None else timeout
+
+        def attempt() -> Any:
+            attempt_timeout = deadline.cap(limit) if deadline is not None else limit
+            if hedge and self.hedge_after > 0:
+                return self._hedged(operation, attempt_timeout)
+            return operation(attempt_timeout)
+
+        return self.retry_policy.run(attempt, self.breaker, retryable, deadline)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=max(2, self.config.pool_size * 2),
+                                                    thread_name_prefix=f'nyro-hedge-{self.profile_name}')
+            return self._executor
+
+    def _hedged(self, operation: Callable[[Optional[float]], Any], timeout: Optional[float]) -> Any:
+        """Send a duplicate when the first request outlasts hedge_after; first answer wins."""
+        executor = self._get_executor()
+        primary = executor.submit(operation, timeout)
+        try:
+            return primary.result(timeout=self.hedge_after)
+        except FutureTimeout:
+            pass
+
+        self.hedge_stats['hedged'] += 1
+        backup = executor.submit(operation, timeout)
+        error: Optional[Exception] = None
+        for future in as_completed([primary, backup]):
+            try:
+                result = future.result()
+            except RedisCommandError:
+                raise
+            except RedisConnectionError as e:
+                error = e
+                continue
+            if future is backup:
+                self.hedge_stats['backup_wins'] += 1
+            return result
+        raise error
+
+    def execute(self, args: Sequence[Any], raw: bool = False, timeout: Optional[float] = None) -> Any:
+        """Run one command; raw=True returns string results as bytes."""
+        raise NotImplementedError
+
+    def execute_many(self, commands: List[List[Any]], transaction: bool = False,
+                     timeout: Optional[float] = None) -> List[Any]:
+        """Run a batch, with per-command errors returned as RedisCommandError."""
+        raise NotImplementedError
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get connection reuse counters."""
+        return {'requests': 0, 'hits': 0, 'misses': 0, 'pool_size': 0}
+
+    def close(self) -> None:
+        """Release pooled connections and hedging threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+class RestTransport(Transport):
+    """Upstash REST transport with URL and auth headers resolved up front."""
+
+    name = 'rest'
+    supports_pipelining = True
+    supports_transactions = True
+    binary_safe = True
+
+    def __init__(self, config: ProfileConfig, session_pool: SessionPool):
+        """Prepare URL, headers and the profile's keep-alive session."""
+        super().__init__(config)
+        self.session_pool = session_pool
+        self.session = session_pool.get_session(config)
+        self.url = config.url.rstrip('/')
+        token_cleaned = config.token.strip('\'"').strip()
+        self.json_headers = {
+            'Authorization': f'Bearer {token_cleaned}',
+            'Content-Type': 'application/json'
+        }
+        self.body_headers = {
+            'Authorization': f'Bearer {token_cleaned}',
+            'Content-Type': 'application/octet-stream'
+        }
+        # Upstash returns every string result base64-encoded with this header
+        self.raw_json_headers = {**self.json_headers, 'Upstash-Encoding': 'base64'}
+        self.raw_body_headers = {**self.body_headers, 'Upstash-Encoding': 'base64'}
+
+    def execute(self, args: Sequence[Any], raw: bool = False, timeout: Optional[float] = None) -> Any:
+        """Execute one command over REST, binary-safe in both directions."""
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            try:
+                body = encode_rest_args(args)
+                headers = self.raw_json_headers if raw else self.json_headers
+                response = self.session.post(self.url, headers=headers, json=body, timeout=timeout)
+            except UnicodeDecodeError:
+                # Binary final argument: send it as the raw request body,
+                # the rest of the command as path segments (POST /SET/key)
+                *head, tail = args
+                path = '/'.join(quote(part, safe='') for part in encode_rest_args(head))
+                headers = self.raw_body_headers if raw else self.body_headers
+                response = self.session.post(f"{self.url}/{path}", headers=headers,
+                                             data=bytes(tail), timeout=timeout)
+
+            if response.status_code == 400:
+                raise RedisCommandError(response.json().get('error', 'Command rejected'))
+            response.raise_for_status()
+            result = response.json()
+        except UnicodeDecodeError:
+            raise RedisConnectionError("Only the last argument may be binary on REST profiles.")
+        except (requests.exceptions.RequestException, ValueError) as e:
+            raise rest_error(e)
+
+        if 'error' in result:
+            raise RedisCommandError(result['error'])
+        value = result.get('result')
+        return decode_base64_result(value) if raw else value
+
+    def execute_many(self, commands: List[List[Any]], transaction: bool = False,
+                     timeout: Optional[float] = None) -> List[Any]:
+        """Send a batch to Upstash's /pipeline or /multi-exec endpoint."""
+        timeout = self.timeout if timeout is None else timeout
+        endpoint = 'multi-exec' if transaction else 'pipeline'
+        try:
+            body = [encode_rest_args(command) for command in commands]
+        except UnicodeDecodeError:
+            raise RedisConnectionError("Binary values cannot be batched over REST; use execute_command() per value.")
+
+        try:
+            response = self.session.post(f"{self.url}/{endpoint}", headers=self.json_headers,
+                                         json=body, timeout=timeout)
+            if response.status_code == 400:
+                # Whole batch rejected (e.g. a transaction with an invalid command)
+                raise RedisCommandError(response.json().get('error', 'Batch rejected'))
+            response.raise_for_status()
+            replies = response.json()
+        except (requests.exceptions.RequestException, ValueError) as e:
+            raise rest_error(e)
+
+        return [
+            RedisCommandError(reply['error']) if 'error' in reply else reply.get('result')
+            for reply in replies
+        ]
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get keep-alive hit/miss counters for the profile's session."""
+        return self.session_pool.get_stats(self.profile_name)
+
+    def close(self) -> None:
+        """Close the profile's session."""
+        super().close()
+        self.session_pool.close(self.profile_name)
+
+
+class RespTransport(Transport):
+    """Native RESP transport over a keep-alive connection pool."""
+
+    name = 'resp'
+    supports_pipelining = True
+    supports_transactions = True
+    binary_safe = True
+    binary_batches = True
+    supports_blocking = True
+
+    def __init__(self, config: ProfileConfig):
+        """Parse the redis:// URL once and set up the pool (connections open lazily)."""
+        super().__init__(config)
+        try:
+            self.pool = RespConnectionPool(
+                config.url,
+                max_connections=config.pool_size,
+                protocol=config.resp_protocol
+            )
+        except ValueError as e:
+            raise RedisConnectionError(f"Invalid Redis URL: {e}")
+
+        self.tracking: Optional[TrackingListener] = None
+        if self.cache is not None and config.cache_tracking:
+            # Started lazily with the first pooled connection
+            self.tracking = TrackingListener(self.pool, self.cache)
+            self.pool.on_connect = self.tracking.enable_on
+
+    def execute(self, args: Sequence[Any], raw: bool = False, timeout: Optional[float] = None) -> Any:
+        """Execute one command on a pooled connection."""
+        try:
+            reply = self.pool.execute(*args, timeout=self.timeout if timeout is None else timeout)
+        except RespError as e:
+            raise RedisCommandError(str(e))
+        except OSError as e:
+            raise RedisTransientError(f"Redis connection error: {e}")
+        except RespProtocolError as e:
+            raise RedisConnectionError(f"Redis protocol error: {e}")
+        return reply if raw else decode_reply(reply)
+
+    def execute_many(self, commands: List[List[Any]], transaction: bool = False,
+                     timeout: Optional[float] = None) -> List[Any]:
+        """Pipeline a batch on one connection, wrapped in MULTI/EXEC for transactions."""
+        batch = [['MULTI']] + commands + [['EXEC']] if transaction else commands
+        try:
+            replies = self.pool.execute_many(batch, timeout=self.timeout if timeout is None else timeout)
+        except OSError as e:
+            raise RedisTransientError(f"Redis connection error: {e}")
+        except RespProtocolError as e:
+            raise RedisConnectionError(f"Redis protocol error: {e}")
+
+        if transaction:
+            # Replies are: +OK for MULTI, +QUEUED per command, then EXEC's array
+            exec_reply = replies[-1]
+            if isinstance(exec_reply, RespError) or exec_reply is None:
+                queue_errors = [r for r in replies[:-1] if isinstance(r, RespError)]
+                raise RedisCommandError(str(queue_errors[0] if queue_errors else exec_reply or 'Transaction aborted'))
+            replies = exec_reply
+
+        return [
+            RedisCommandError(str(reply)) if isinstance(reply, RespError) else decode_reply(reply)
+            for reply in replies
+        ]
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get connection reuse counters for the RESP pool."""
+        return self.pool.get_stats()
+
+    def close(self) -> None:
+        """Close idle RESP connections and the tracking listener."""
+        super().close()
+        if self.tracking is not None:
+            self.tracking.stop()
+        self.pool.disconnect()
+
+
+def _cli_int(output: str) -> int:
+    return int(output) if output else 0
+
+
+def _cli_nullable(output: str) -> Optional[str]:
+    return None if output in ('', '(nil)') else output
+
+
+def _cli_lines(output: str) -> List[str]:
+    return [line.strip() for line in output.split('\n') if line.strip()]
+
+
+def _cli_nullable_lines(output: str) -> List[Optional[str]]:
+    # One line per element, nil as an empty line; only the final newline is dropped
+    return [line or None for line in output[:-1].split('\n')] if output else []
+
+
+def _cli_scan(output: str) -> List[Any]:
+    # redis-cli prints the cursor on the first line, then one key per line
+    lines = output.split('\n')
+    return [lines[0].strip() or '0', [line.strip() for line in lines[1:] if line.strip()]]
+
+
+def _cli_json(output: str) -> Any:
+    # Printed with --json: nesting and field values survive whitespace and newlines
+    return json.loads(output) if output else None
+
+
+# Replies whose blank lines are meaningful, so run_cli must not strip them
+CLI_UNSTRIPPED_REPLIES = {'MGET'}
+
+# Structured replies redis-cli is asked to print as JSON (redis-cli 7+) instead of flattened text
+CLI_JSON_REPLIES = {'XRANGE', 'XREVRANGE', 'XREAD', 'XREADGROUP', 'XPENDING', 'XAUTOCLAIM', 'XGROUP'}
+
+# redis-cli prints text; these turn it back into the shapes REST/RESP return
+CLI_REPLY_PARSERS: Dict[str, Callable[[str], Any]] = {
+    'GET': _cli_nullable,
+    'MGET': _cli_nullable_lines,
+    'XADD': _cli_nullable,
+    'DEL': _cli_int,
+    'EXISTS': _cli_int,
+    'LPUSH': _cli_int,
+    'RPUSH': _cli_int,
+    'LLEN': _cli_int,
+    'STRLEN': _cli_int,
+    'HINCRBY': _cli_int,
+    'HGETALL': _cli_lines,
+    'ZRANGEBYSCORE': _cli_lines,
+    'LRANGE': _cli_lines,
+    'SCAN': _cli_scan,
+    'XRANGE': _cli_json,
+    'XREVRANGE': _cli_json,
+    'XREAD': _cli_json,
+    'XREADGROUP': _cli_json,
+    'XPENDING': _cli_json,
+    'XAUTOCLAIM': _cli_json,
+    'XGROUP': _cli_json,
+    'XACK': _cli_int,
+}
+
+
+class CliTransport(Transport):
+    """redis-cli subprocess fallback with the base command line prebuilt."""
+
+    name = 'cli'
+    supports_blocking = True
+
+    def __init__(self, config: ProfileConfig):
+        """Build the redis-cli prefix with TLS support."""
+        super().__init__(config)
+        self.base_command = ['redis-cli']
+        if config.url.startswith('rediss://'):
+            self.base_command.append('--tls')
+        self.base_command.extend(['-u', config.url, '--no-auth-warning'])
+
+    def run_cli(self, command: Sequence[str], timeout: Optional[float] = None, strip: bool = True,
+                options: Sequence[str] = ()) -> str:
+        """Run redis-cli with extra options (e.g. --json) and return its output, stripped unless strip is False."""
+        try:
+            result = subprocess.run(
+                self.base_command + list(options) + list(command),
+                capture_output=True,
+                text=True,
+                check=True,
+                timeout=timeout
+            )
+            return result.stdout.strip() if strip else result.stdout
+        except subprocess.TimeoutExpired:
+            raise RedisTransientError(f"redis-cli timed out after {timeout:g}s")
+        except subprocess.CalledProcessError as e:
+            raise RedisConnectionError(f"Redis CLI error: {e.stderr}")
+        except FileNotFoundError:
+            raise RedisConnectionError("redis-cli not found. Install Redis CLI or use REST API methods.")
+
+    def execute(self, args: Sequence[Any], raw: bool = False, timeout: Optional[float] = None) -> Any:
+        """Execute through redis-cli, parsing known replies into structured values."""
+        # redis-cli takes text arguments and prints text replies
+        cli_args = [
+            bytes(arg).decode('utf-8', errors='surrogateescape')
+            if isinstance(arg, (bytes, bytearray, memoryview)) else str(arg)
+            for arg in args
+        ]
+        name = cli_args[0].upper()
+        output = self.run_cli(cli_args, self.timeout if timeout is None else timeout,
+                              strip=name not in CLI_UNSTRIPPED_REPLIES,
+                              options=['--json'] if name in CLI_JSON_REPLIES and not raw else [])
+        if raw:
+            return output.encode('utf-8', errors='surrogateescape')
+        parser = CLI_REPLY_PARSERS.get(name)
+        return parser(output) if parser else output
+
+    def execute_many(self, commands: List[List[Any]], transaction: bool = False,
+                     timeout: Optional[float] = None) -> List[Any]:
+        """Run commands one by one; redis-cli has no pipelining."""
+        if transaction:
+            raise RedisConnectionError("Transactions need the REST or native RESP transport, not redis-cli.")
+        results = []
+        for command in commands:
+            try:
+                results.append(self.execute(command, timeout=timeout))
+            except (RedisConnectionError, ValueError) as e:
+                results.append(RedisCommandError(str(e)))
+        return results
+
+
+def create_transport(config: ProfileConfig, session_pool: SessionPool) -> Transport:
+    """Resolve the transport for a profile from its URL scheme and transport option."""
+    if is_rest_url(config.url):
+        return RestTransport(config, session_pool)
+    if config.transport == 'cli':
+        return CliTransport(config)
+    return RespTransport(config)
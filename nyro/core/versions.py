@@ -0,0 +1,138 @@
+"""
+Payload Version Module
+🧵 Synth: Swapping whole payloads atomically and sweeping what they replaced
+
+Provides:
+- payload_version / chunk_prefix: chunks of each payload write live under
+  their own key:v:VERSION:chunk: namespace, so a rewrite never touches
+  chunks a reader is fetching
+- SWAP_POINTER_SCRIPT / swap_pointer_command: replace key:metadata and retire
+  the version it pointed at in one atomic step
+- SWEEP_VERSION_SCRIPT: delete a retired version's chunks once its grace
+  period has passed, unless the pointer has moved back to it
+- VersionSweeper: background thread running RedisOperations.sweep_versions
+"""
+
+import hashlib
+import json
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+RETIRED_VERSIONS_KEY = 'nyro:retired'
+
+# Retired versions stay readable this long, so loads that read the old
+# pointer just before a swap still find every chunk
+VERSION_GRACE_SECONDS = 300
+SWEEP_BATCH = 100
+SWEEP_INTERVAL = 60.0
+
+# KEYS: metadata key, retired zset, payload key; ARGV: new metadata ('' deletes
+# it), new version, now. Setting metadata also drops a direct value at the
+# payload key, which would shadow it. Returns the metadata it replaced.
+SWAP_POINTER_SCRIPT = """
+local old = redis.call('GET', KEYS[1])
+if ARGV[1] == '' then
+  redis.call('DEL', KEYS[1])
+else
+  redis.call('SET', KEYS[1], ARGV[1])
+  redis.call('DEL', KEYS[3])
+end
+if old then
+  local ok, meta = pcall(cjson.decode, old)
+  if ok and type(meta) == 'table' and meta['type'] == 'chunked_payload' then
+    local version = meta['version'] or ''
+    if version ~= ARGV[2] then
+      local member = version .. ':' .. string.format('%d', meta['total_chunks'] or 0) .. ':' .. KEYS[3]
+      redis.call('ZADD', KEYS[2], ARGV[3], member)
+    end
+  end
+end
+return old
+"""
+
+# KEYS: metadata key, retired zset, then the version's chunk keys;
+# ARGV: retired member, version, cutoff. Returns 1 if the version was deleted.
+SWEEP_VERSION_SCRIPT = """
+local score = redis.call('ZSCORE', KEYS[2], ARGV[1])
+if not score or tonumber(score) > tonumber(ARGV[3]) then return 0 end
+redis.call('ZREM', KEYS[2], ARGV[1])
+local current = redis.call('GET', KEYS[1])
+if current then
+  local ok, meta = pcall(cjson.decode, current)
+  if ok and type(meta) == 'table' and meta['type'] == 'chunked_payload' and (meta['version'] or '') == ARGV[2] then
+    return 0
+  end
+end
+for i = 3, #KEYS, 1000 do
+  redis.call('DEL', unpack(KEYS, i, math.min(i + 999, #KEYS)))
+end
+return 1
+"""
+
+
+def payload_version(checksums: Iterable[str]) -> str:
+    """Version id derived from chunk checksums: rewriting (or resuming) the same payload reuses it."""
+    return hashlib.sha1(''.join(checksums).encode('ascii')).hexdigest()[:16]
+
+
+def chunk_prefix(key: str, version: str = '') -> str:
+    """Key prefix of a payload version's chunks ('' is the unversioned legacy layout)."""
+    return f"{key}:v:{version}:chunk:" if version else f"{key}:chunk:"
+
+
+def retired_member(key: str, version: str, total_chunks: int) -> str:
+    """Member naming a retired version in RETIRED_VERSIONS_KEY (built the same way in SWAP_POINTER_SCRIPT)."""
+    return f"{version}:{total_chunks}:{key}"
+
+
+def swap_pointer_command(key: str, metadata: Optional[Dict[str, Any]]) -> List[Any]:
+    """EVAL arguments pointing key at metadata (None removes the pointer); replies with the old metadata."""
+    return ['EVAL', SWAP_POINTER_SCRIPT, '3', f"{key}:metadata", RETIRED_VERSIONS_KEY, key,
+            json.dumps(metadata) if metadata else '', (metadata or {}).get('version', ''), repr(time.time())]
+
+
+def parse_retired_member(member: str) -> Tuple[str, str, int]:
+    """Split a retired member into (key, version, total_chunks)."""
+    version, total_chunks, key = member.split(':', 2)
+    return key, version, int(total_chunks)
+
+
+class VersionSweeper:
+    """Background thread sweeping retired payload versions every interval seconds."""
+
+    def __init__(self, operations: Any, interval: float = SWEEP_INTERVAL,
+                 grace_seconds: float = VERSION_GRACE_SECONDS, batch_size: int = SWEEP_BATCH):
+        """Bind to a RedisOperations; call start() to begin sweeping."""
+        self.operations = operations
+        self.interval = interval
+        self.grace_seconds = grace_seconds
+        self.batch_size = batch_size
+        self.deleted = 0
+        self.error: Optional[str] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> 'VersionSweeper':
+        """Start the sweeper thread (a daemon, so it never blocks exit)."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.deleted += self.operations.sweep_versions(self.grace_seconds, self.batch_size)['deleted']
+                self.error = None
+            except Exception as e:
+                # Keep sweeping: the next pass retries whatever this one missed
+                self.error = str(e)
+            self._stop.wait(self.interval)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Ask the sweeper to finish and wait for the current pass."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
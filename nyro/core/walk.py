@@ -0,0 +1,309 @@
+"""
+Walking Payload Helpers
+🧵 Synth: Re-walking large trees at the cost of what changed
+
+Provides:
+- WalkManifest: local cache of path -> size, mtime and content hash
+- apply_walking_delta: rebuild a full walking payload from a base and a delta
+- IgnoreRules / scan_tree: os.scandir walker honouring .gitignore and excludes,
+  yielding files in a deterministic order with one stat each
+- ordered_map: thread pool map with bounded read-ahead and in-order results
+- IterableReader: binary stream over generated pieces (e.g. streamed JSON)
+"""
+
+import io
+import json
+import os
+import re
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+MANIFEST_VERSION = 2
+
+# Files modified this close to the manifest save may have changed again within
+# the same mtime tick, so their recorded state is not trusted
+RACY_WINDOW_NS = 2_000_000_000
+
+# Directories never worth shipping in a walking payload
+DEFAULT_EXCLUDES = ('.git/', '.hg/', '.svn/', 'node_modules/', '__pycache__/',
+                    '.venv/', 'venv/', '.tox/', '.mypy_cache/', '.pytest_cache/')
+
+WALK_WORKERS = 8
+
+
+class WalkManifest:
+    """Per-directory record of what the previous walk saw."""
+
+    def __init__(self, path: str, directory: str):
+        """Bind to a manifest file; call load() to read the previous walk."""
+        self.path = path
+        self.directory = directory
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.timestamp: Optional[str] = None
+        self.saved_ns = 0
+
+    @classmethod
+    def load(cls, path: str, directory: str) -> 'WalkManifest':
+        """Read a manifest; a missing, corrupt or foreign one starts empty."""
+        manifest = cls(path, directory)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return manifest
+        if data.get('version') == MANIFEST_VERSION and data.get('directory') == directory:
+            manifest.entries = data.get('files', {})
+            manifest.timestamp = data.get('timestamp')
+            manifest.saved_ns = data.get('saved_ns', 0)
+        return manifest
+
+    def lookup(self, relative_path: str, size: int, mtime_ns: int) -> Optional[str]:
+        """Recorded content hash if size and mtime are unchanged since the last walk."""
+        record = self.entries.get(relative_path)
+        if record is None or record['size'] != size or record['mtime_ns'] != mtime_ns:
+            return None
+        if mtime_ns >= self.saved_ns - RACY_WINDOW_NS:
+            return None
+        return record['hash']
+
+    def previous_hash(self, relative_path: str) -> Optional[str]:
+        """Content hash recorded for a path, or None if it is new."""
+        record = self.entries.get(relative_path)
+        return record['hash'] if record else None
+
+    def record(self, relative_path: str, size: int, mtime_ns: int, digest: str) -> None:
+        """Remember a file's current state (never its content, so the manifest stays small)."""
+        self.entries[relative_path] = {'size': size, 'mtime_ns': mtime_ns, 'hash': digest}
+
+    def forget(self, relative_paths: List[str]) -> None:
+        """Drop files that no longer exist."""
+        for relative_path in relative_paths:
+            self.entries.pop(relative_path, None)
+
+    def save(self, timestamp: str) -> None:
+        """Write the manifest atomically (temp file + rename)."""
+        data = {
+            'version': MANIFEST_VERSION,
+            'directory': self.directory,
+            'timestamp': timestamp,
+            'saved_ns': time.time_ns(),
+            'files': self.entries,
+        }
+        folder = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(dir=folder, prefix='.walk-manifest-')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+
+def apply_walking_delta(base: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply a walking_payload_delta to the full payload it was taken against."""
+    files = {entry['path']: entry for entry in base['files']}
+    for path in delta['removed']:
+        files.pop(path, None)
+    for entry in delta['added'] + delta['changed']:
+        files[entry['path']] = entry
+    payload = dict(base)
+    payload['timestamp'] = delta['timestamp']
+    payload['files'] = sorted(files.values(), key=lambda entry: walk_order(entry['path']))
+    payload['metadata'] = dict(base['metadata'],
+                               total_files=len(files),
+                               total_size=sum(entry['size'] for entry in files.values()))
+    return payload
+
+
+def walk_order(relative_path: str) -> List[str]:
+    """Sort key matching the order scan_tree yields paths in."""
+    return relative_path.split('/')
+
+
+def _translate(pattern: str) -> str:
+    # gitignore glob -> regex over '/'-separated relative paths
+    parts = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if pattern.startswith('**/', i):
+            parts.append('(?:.*/)?')
+            i += 3
+            continue
+        if pattern.startswith('/**', i) and i + 3 == len(pattern):
+            parts.append('/.*')
+            i += 3
+            continue
+        if char == '*':
+            parts.append('.*' if pattern.startswith('**', i) else '[^/]*')
+            i += 2 if pattern.startswith('**', i) else 1
+            continue
+        if char == '?':
+            parts.append('[^/]')
+        elif char == '[':
+            close = pattern.find(']', i + 2)
+            if close == -1:
+                parts.append(re.escape(char))
+            else:
+                body = pattern[i + 1:close].replace('\\', '\\\\')
+                if body.startswith('!'):
+                    body = '^' + body[1:]
+                parts.append(f'[{body}]')
+                i = close
+        elif char == '\\' and i + 1 < len(pattern):
+            i += 1
+            parts.append(re.escape(pattern[i]))
+        else:
+            parts.append(re.escape(char))
+        i += 1
+    return ''.join(parts)
+
+
+class IgnoreRules:
+    """Ordered gitignore-style rules; the last matching rule decides."""
+
+    def __init__(self, rules: Tuple[Tuple[str, Any, bool, bool, bool], ...] = ()):
+        """rules are (base, regex, negated, directory_only, anchored) tuples."""
+        self.rules = rules
+
+    @staticmethod
+    def parse(lines: Iterable[str], base: str = '') -> List[Tuple[str, Any, bool, bool, bool]]:
+        """Compile gitignore lines relative to base (a directory path, '' for the root)."""
+        rules = []
+        for line in lines:
+            line = line.rstrip('\n\r')
+            if not line.endswith('\\ '):
+                line = line.rstrip(' ')
+            if not line or line.startswith('#'):
+                continue
+            negated = line.startswith('!')
+            if negated or line.startswith('\\'):
+                line = line[1:]
+            directory_only = line.endswith('/')
+            line = line.rstrip('/')
+            if not line:
+                continue
+            anchored = '/' in line
+            line = line.lstrip('/')
+            rules.append((base, re.compile(_translate(line)), negated, directory_only, anchored))
+        return rules
+
+    def extend(self, lines: Iterable[str], base: str = '') -> 'IgnoreRules':
+        """New rule set with lines (e.g. a nested .gitignore) applied after these."""
+        added = self.parse(lines, base)
+        return IgnoreRules(self.rules + tuple(added)) if added else self
+
+    def ignored(self, relative_path: str, is_dir: bool) -> bool:
+        """Whether a path (relative to the walk root) is excluded."""
+        result = False
+        name = relative_path.rsplit('/', 1)[-1]
+        for base, regex, negated, directory_only, anchored in self.rules:
+            if result != negated or (directory_only and not is_dir):
+                continue
+            if base:
+                if not relative_path.startswith(base + '/'):
+                    continue
+                subject = relative_path[len(base) + 1:]
+            else:
+                subject = relative_path
+            if regex.fullmatch(subject if anchored else name):
+                result = not negated
+        return result
+
+
+def scan_tree(root: str, rules: Optional[IgnoreRules] = None, gitignore: bool = True,
+              relative_root: str = '') -> Iterator[Tuple[str, str, os.stat_result]]:
+    """Yield (relative_path, path, stat) for every file under root.
+
+    Entries are visited in name order, so the output is reproducible.
+    Ignored and virtualenv directories are never entered, directory
+    symlinks are not followed, and each file is stat'ed once.
+    """
+    rules = rules if rules is not None else IgnoreRules()
+    try:
+        with os.scandir(root) as iterator:
+            entries = sorted(iterator, key=lambda entry: entry.name)
+    except OSError:
+        return
+    names = {entry.name for entry in entries}
+    if relative_root and 'pyvenv.cfg' in names:
+        return
+    if gitignore and '.gitignore' in names:
+        try:
+            with open(os.path.join(root, '.gitignore'), 'r', encoding='utf-8', errors='replace') as f:
+                rules = rules.extend(f.readlines(), relative_root)
+        except OSError:
+            pass
+
+    for entry in entries:
+        relative_path = f"{relative_root}/{entry.name}" if relative_root else entry.name
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                if not rules.ignored(relative_path, True):
+                    yield from scan_tree(entry.path, rules, gitignore, relative_path)
+                continue
+            if rules.ignored(relative_path, False) or not entry.is_file():
+                continue
+            file_stat = entry.stat()
+        except OSError:
+            continue
+        yield relative_path, entry.path, file_stat
+
+
+def ordered_map(func: Callable[[Any], Any], items: Iterable[Any], workers: int = WALK_WORKERS) -> Iterator[Any]:
+    """Yield func(item) for each item, in order, computed on a thread pool.
+
+    At most 2 * workers items are in flight ahead of the consumer, so
+    stopping early (closing the generator) wastes little work and cancels
+    whatever has not started.
+    """
+    if workers <= 1:
+        for item in items:
+            yield func(item)
+        return
+    iterator = iter(items)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        window = deque(executor.submit(func, item) for item in islice(iterator, workers * 2))
+        try:
+            while window:
+                result = window.popleft().result()
+                window.extend(executor.submit(func, item) for item in islice(iterator, 1))
+                yield result
+        finally:
+            for future in window:
+                future.cancel()
+
+
+class IterableReader(io.RawIOBase):
+    """Read-only binary stream over an iterator of bytes pieces.
+
+    Only the piece being read is held, so a generator of serialized
+    entries can be consumed like a pipe (see RedisOperations.store_stream).
+    """
+
+    def __init__(self, pieces: Iterable[bytes]):
+        """Wrap pieces; empty pieces are skipped."""
+        self._pieces = iter(pieces)
+        self._current = b''
+        self._offset = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        """Copy up to len(buffer) bytes of the next piece(s); 0 at the end."""
+        while self._offset >= len(self._current):
+            self._current = next(self._pieces, None)
+            self._offset = 0
+            if self._current is None:
+                self._current = b''
+                return 0
+        size = min(len(buffer), len(self._current) - self._offset)
+        buffer[:size] = self._current[self._offset:self._offset + size]
+        self._offset += size
+        return size
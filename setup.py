@@ -38,6 +38,11 @@ musical_requirements = [
     "mido>=1.2.0",
 ]
 
+compression_requirements = [
+    "zstandard>=0.18.0",
+    "lz4>=4.0.0",
+]
+
 setup(
     name="nyro",
     version="0.1.3",
@@ -69,7 +74,8 @@ setup(
     extras_require={
         "dev": dev_requirements,
         "musical": musical_requirements,
-        "all": dev_requirements + musical_requirements,
+        "compression": compression_requirements,
+        "all": dev_requirements + musical_requirements + compression_requirements,
     },
     entry_points={
         "console_scripts": [
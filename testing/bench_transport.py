@@ -0,0 +1,85 @@
+"""
+Transport Dispatch Micro-benchmark
+🧵 Synth: Measuring the per-call cost of resolving a profile's transport
+
+Compares the legacy per-call path (profile lookup, urlparse, auth header
+rebuild, session lookup) with dispatch through the resolved Transport.
+The HTTP session is replaced by a null session, so only client-side
+overhead is timed.
+
+Run: python testing/bench_transport.py [iterations]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+from urllib.parse import urlparse
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from nyro.core.profiles import ProfileManager
+from nyro.core.client import RedisClient
+from nyro.core.errors import RedisConnectionError
+
+
+class _NullResponse:
+    status_code = 200
+    headers = {'content-type': 'application/json'}
+
+    def json(self):
+        return {'result': 'OK'}
+
+    def raise_for_status(self):
+        pass
+
+
+class _NullSession:
+    def post(self, url, **kwargs):
+        return _NullResponse()
+
+
+def _legacy_set(client: RedisClient, key: str, value: str) -> dict:
+    """SET as every call used to run it: profile, URL scheme, headers and session resolved per call."""
+    config = client.profile_manager.get_current_profile()
+    if not config:
+        raise RedisConnectionError("No active profile. Use switch_profile() first.")
+    if urlparse(config.url).scheme not in ('http', 'https'):
+        raise RedisConnectionError("Cannot use REST API with Redis CLI URL. Use CLI methods instead.")
+    url = config.url.rstrip('/')
+    token_cleaned = config.token.strip('\'"').strip()
+    headers = {
+        'Authorization': f'Bearer {token_cleaned}',
+        'Content-Type': 'application/json'
+    }
+    session = client.session_pool.get_session(config)
+    response = session.post(url, headers=headers, json=["SET", key, value], timeout=config.timeout)
+    response.raise_for_status()
+    return response.json()
+
+
+def main(iterations: int = 50000) -> None:
+    temp_dir = tempfile.mkdtemp()
+    env_file = os.path.join(temp_dir, '.env')
+    with open(env_file, 'w') as f:
+        f.write("KV_REST_API_URL=https://bench.invalid\nKV_REST_API_TOKEN='bench_token'\n")
+
+    client = RedisClient(ProfileManager(env_file))
+    null_session = _NullSession()
+    client.session_pool.get_session = lambda config: null_session
+    client._transport()
+
+    legacy = timeit.timeit(lambda: _legacy_set(client, 'k', 'v'), number=iterations)
+    resolved = timeit.timeit(lambda: client.execute_command('SET', 'k', 'v'), number=iterations)
+
+    print(f"🧵 {iterations} calls (network excluded)")
+    print(f"   per-call resolution : {legacy / iterations * 1e6:7.2f} µs/call")
+    print(f"   resolved transport  : {resolved / iterations * 1e6:7.2f} µs/call")
+    print(f"   overhead removed    : {(legacy - resolved) / iterations * 1e6:7.2f} µs/call")
+    shutil.rmtree(temp_dir)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
@@ -0,0 +1,843 @@
+"""
+Local Redis Stand-ins for Transport Tests
+🧵 Synth: In-process servers so transports can be exercised without Upstash
+
+Provides:
+- FakeRedisStore: tiny in-memory command engine shared by the stand-ins
+- RestStandIn: Upstash-style REST endpoint served over keep-alive HTTP/1.1
+- RespStandIn: RESP2/RESP3 socket server speaking the Redis wire protocol
+- StandInContractMixin: per-test stand-in, profile and client for contract tests
+"""
+
+import base64
+import fnmatch
+import hashlib
+import json
+import os
+import shutil
+import socketserver
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import unquote_to_bytes
+
+from nyro.core.client import RedisClient
+from nyro.core.dedup import COLLECT_CHUNK_SCRIPT
+from nyro.core.operations import RedisOperations
+from nyro.core.profiles import ProfileManager
+from nyro.core.transfer import CHUNK_CHECKSUM_SCRIPT
+from nyro.core.versions import SWAP_POINTER_SCRIPT, SWEEP_VERSION_SCRIPT
+
+
+class CommandError(Exception):
+    """Error reply raised by the fake command engine."""
+    pass
+
+
+class SimpleString(str):
+    """Status reply such as OK or PONG."""
+    pass
+
+
+WRITE_COMMANDS = {'SET', 'MSET', 'DEL', 'LPUSH', 'RPUSH', 'XADD', 'EVAL'}
+
+
+class FakeHash(dict):
+    """Hash value (kept apart from stream dicts for TYPE)."""
+    pass
+
+
+class FakeSortedSet(dict):
+    """Sorted set value: member -> score."""
+    pass
+
+
+class FakeRedisStore:
+    """Minimal in-memory Redis command engine for tests."""
+
+    def __init__(self):
+        """Initialize empty keyspace."""
+        self.data: Dict[bytes, Any] = {}
+        self.lock = threading.RLock()
+        # Notified on XADD; XREAD BLOCK waits on it (releasing the lock)
+        self.stream_added = threading.Condition(self.lock)
+        self.commands: List[List[bytes]] = []
+        # Called with the keys touched by each write (used for CLIENT TRACKING)
+        self.write_listeners: List[Any] = []
+
+    def execute(self, args: List[bytes]) -> Any:
+        """Execute one command given as a list of byte strings."""
+        with self.lock:
+            self.commands.append(args)
+            name = args[0].decode().upper()
+            handler = getattr(self, f'cmd_{name.lower()}', None)
+            if handler is None:
+                raise CommandError(f"ERR unknown command '{name}'")
+            result = handler(*args[1:])
+            if name in WRITE_COMMANDS:
+                if name == 'DEL':
+                    keys = list(args[1:])
+                elif name == 'MSET':
+                    keys = list(args[1::2])
+                elif name == 'EVAL':
+                    keys = list(args[3:3 + int(args[2])])
+                else:
+                    keys = [args[1]]
+                for listener in self.write_listeners:
+                    listener(keys)
+            return result
+
+    def cmd_ping(self, *args):
+        return SimpleString('PONG')
+
+    def cmd_set(self, key, value, *options):
+        self.data[key] = value
+        return SimpleString('OK')
+
+    def cmd_get(self, key):
+        value = self.data.get(key)
+        if value is not None and not isinstance(value, bytes):
+            raise CommandError('WRONGTYPE Operation against a key holding the wrong kind of value')
+        return value
+
+    def cmd_strlen(self, key):
+        return len(self.cmd_get(key) or b'')
+
+    def cmd_getrange(self, key, start, end):
+        value = self.cmd_get(key) or b''
+        start, end = int(start), int(end)
+        end = len(value) + end if end < 0 else end
+        return value[start:end + 1]
+
+    def cmd_mget(self, *keys):
+        return [value if isinstance(value, bytes) else None for value in map(self.data.get, keys)]
+
+    def cmd_mset(self, *pairs):
+        if not pairs or len(pairs) % 2:
+            raise CommandError("ERR wrong number of arguments for 'mset' command")
+        for i in range(0, len(pairs), 2):
+            self.data[pairs[i]] = pairs[i + 1]
+        return SimpleString('OK')
+
+    def cmd_del(self, *keys):
+        return sum(1 for key in keys if self.data.pop(key, None) is not None)
+
+    def cmd_exists(self, *keys):
+        return sum(1 for key in keys if key in self.data)
+
+    def cmd_scan(self, cursor, *options):
+        opts = {options[i].upper(): options[i + 1] for i in range(0, len(options) - 1, 2)}
+        pattern = opts.get(b'MATCH', b'*').decode()
+        count = int(opts.get(b'COUNT', b'10'))
+        keys = sorted(self.data)
+        start = int(cursor)
+        page = keys[start:start + count]
+        next_cursor = start + count if start + count < len(keys) else 0
+        matched = [k for k in page if fnmatch.fnmatchcase(k.decode(), pattern)]
+        if b'TYPE' in opts:
+            matched = [k for k in matched if self.cmd_type(k) == opts[b'TYPE'].decode()]
+        return [str(next_cursor).encode(), matched]
+
+    def cmd_type(self, key):
+        value = self.data.get(key)
+        if value is None:
+            return SimpleString('none')
+        if isinstance(value, bytes):
+            return SimpleString('string')
+        if isinstance(value, list):
+            return SimpleString('list')
+        if isinstance(value, FakeHash):
+            return SimpleString('hash')
+        if isinstance(value, FakeSortedSet):
+            return SimpleString('zset')
+        return SimpleString('stream')
+
+    def _hash(self, key):
+        value = self.data.get(key)
+        if value is None:
+            return FakeHash()
+        if not isinstance(value, FakeHash):
+            raise CommandError('WRONGTYPE Operation against a key holding the wrong kind of value')
+        return value
+
+    def cmd_hincrby(self, key, field, increment):
+        fields = self.data[key] = self._hash(key)
+        fields[field] = str(int(fields.get(field, b'0')) + int(increment)).encode()
+        return int(fields[field])
+
+    def cmd_hget(self, key, field):
+        return self._hash(key).get(field)
+
+    def cmd_hgetall(self, key):
+        return [item for pair in self._hash(key).items() for item in pair]
+
+    def cmd_hdel(self, key, *fields):
+        hash_value = self._hash(key)
+        removed = sum(1 for field in fields if hash_value.pop(field, None) is not None)
+        if not hash_value:
+            self.data.pop(key, None)
+        return removed
+
+    def _zset(self, key):
+        value = self.data.get(key)
+        if value is None:
+            return FakeSortedSet()
+        if not isinstance(value, FakeSortedSet):
+            raise CommandError('WRONGTYPE Operation against a key holding the wrong kind of value')
+        return value
+
+    def cmd_zadd(self, key, *pairs):
+        members = self.data[key] = self._zset(key)
+        added = 0
+        for i in range(0, len(pairs) - 1, 2):
+            added += pairs[i + 1] not in members
+            members[pairs[i + 1]] = float(pairs[i])
+        return added
+
+    def cmd_zrem(self, key, *members):
+        zset = self._zset(key)
+        removed = sum(1 for member in members if zset.pop(member, None) is not None)
+        if not zset:
+            self.data.pop(key, None)
+        return removed
+
+    def cmd_zscore(self, key, member):
+        score = self._zset(key).get(member)
+        return None if score is None else repr(score).encode()
+
+    def cmd_zrangebyscore(self, key, low, high, *options):
+        low = float('-inf') if low == b'-inf' else float(low)
+        high = float('inf') if high == b'+inf' else float(high)
+        members = sorted((score, member) for member, score in self._zset(key).items() if low <= score <= high)
+        result = [member for _, member in members]
+        if len(options) == 3 and options[0].upper() == b'LIMIT':
+            offset, count = int(options[1]), int(options[2])
+            result = result[offset:offset + count] if count >= 0 else result[offset:]
+        return result
+
+    def cmd_eval(self, script, numkeys, *args):
+        # No Lua here: known scripts map to Python equivalents
+        handler = SCRIPTS.get(script.strip())
+        if handler is None:
+            raise CommandError('ERR unsupported script in stand-in')
+        numkeys = int(numkeys)
+        return handler(self, list(args[:numkeys]), list(args[numkeys:]))
+
+    def _script_collect_chunk(self, keys, argv):
+        if int(self.cmd_hget(keys[0], argv[0]) or b'0') > 0:
+            return 0
+        self.cmd_hdel(keys[0], argv[0])
+        return self.cmd_del(keys[1])
+
+    def _script_swap_pointer(self, keys, argv):
+        old = self.cmd_get(keys[0])
+        if argv[0] == b'':
+            self.cmd_del(keys[0])
+        else:
+            self.cmd_set(keys[0], argv[0])
+            self.cmd_del(keys[2])
+        try:
+            meta = json.loads(old) if old else None
+        except ValueError:
+            meta = None
+        if isinstance(meta, dict) and meta.get('type') == 'chunked_payload':
+            version = meta.get('version', '')
+            if version.encode() != argv[1]:
+                member = f"{version}:{int(meta.get('total_chunks', 0))}:".encode() + keys[2]
+                self.cmd_zadd(keys[1], argv[2], member)
+        return old
+
+    def _script_sweep_version(self, keys, argv):
+        score = self.cmd_zscore(keys[1], argv[0])
+        if score is None or float(score) > float(argv[2]):
+            return 0
+        self.cmd_zrem(keys[1], argv[0])
+        current = self.cmd_get(keys[0])
+        try:
+            meta = json.loads(current) if current else None
+        except ValueError:
+            meta = None
+        if isinstance(meta, dict) and meta.get('type') == 'chunked_payload' and \
+                meta.get('version', '').encode() == argv[1]:
+            return 0
+        self.cmd_del(*keys[2:])
+        return 1
+
+    def _script_chunk_checksums(self, keys, argv):
+        values = [self.cmd_get(key) for key in keys]
+        return [hashlib.sha1(value).hexdigest().encode() if value is not None else b'' for value in values]
+
+    def cmd_lpush(self, key, *elements):
+        items = self.data.setdefault(key, [])
+        for element in elements:
+            items.insert(0, element)
+        return len(items)
+
+    def cmd_rpush(self, key, *elements):
+        items = self.data.setdefault(key, [])
+        items.extend(elements)
+        return len(items)
+
+    def cmd_lrange(self, key, start, stop):
+        items = self.data.get(key, [])
+        start, stop = int(start), int(stop)
+        stop = len(items) + stop if stop < 0 else stop
+        return items[start:stop + 1]
+
+    def cmd_llen(self, key):
+        return len(self.data.get(key, []))
+
+    def cmd_xadd(self, key, entry_id, *fields):
+        entries = self.data.setdefault(key, {'entries': []})['entries']
+        if entry_id == b'*':
+            ms = int(time.time() * 1000)
+            seq = 0
+            if entries:
+                last_ms, last_seq = (int(p) for p in entries[-1][0].split(b'-'))
+                if last_ms >= ms:
+                    ms, seq = last_ms, last_seq + 1
+            entry_id = f'{ms}-{seq}'.encode()
+        entries.append((entry_id, list(fields)))
+        self.stream_added.notify_all()
+        return entry_id
+
+    def cmd_xrange(self, key, start, end, *options):
+        entries = self.data.get(key, {'entries': []})['entries']
+        count = int(options[1]) if len(options) >= 2 else None
+        result = []
+        for entry_id, fields in entries:
+            if not _stream_id_in_range(entry_id, start, end):
+                continue
+            result.append([entry_id, list(fields)])
+            if count is not None and len(result) >= count:
+                break
+        return result
+
+    def cmd_xrevrange(self, key, end, start, *options):
+        entries = self.data.get(key, {'entries': []})['entries']
+        count = int(options[1]) if len(options) >= 2 else None
+        result = [[entry_id, list(fields)] for entry_id, fields in reversed(entries)
+                  if _stream_id_in_range(entry_id, start, end)]
+        return result[:count] if count is not None else result
+
+    def _last_stream_id(self, key):
+        newest = self.cmd_xrevrange(key, b'+', b'-', b'COUNT', b'1')
+        return newest[0][0] if newest else b'0-0'
+
+    def _read_options(self, args):
+        # [COUNT n] [BLOCK ms] [NOACK] STREAMS key... id...
+        options = [arg.upper() for arg in args]
+        streams_at = options.index(b'STREAMS')
+        count = int(args[options.index(b'COUNT') + 1]) if b'COUNT' in options[:streams_at] else None
+        block = int(args[options.index(b'BLOCK') + 1]) if b'BLOCK' in options[:streams_at] else None
+        names = args[streams_at + 1:]
+        return count, block, names[:len(names) // 2], names[len(names) // 2:]
+
+    def _wait_for_entries(self, block, read):
+        # BLOCK 0 waits forever; no BLOCK answers at once
+        deadline = None if not block else time.monotonic() + block / 1000
+        while True:
+            result = read()
+            if result or block is None:
+                return result or None
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return None
+            self.stream_added.wait(remaining)
+
+    def cmd_xread(self, *args):
+        count, block, keys, ids = self._read_options(args)
+        # "$" means "after whatever is last right now", fixed before blocking
+        ids = [self._last_stream_id(key) if entry_id == b'$' else entry_id for key, entry_id in zip(keys, ids)]
+        options = [b'COUNT', str(count).encode()] if count else []
+
+        def read():
+            result = []
+            for key, entry_id in zip(keys, ids):
+                entries = self.cmd_xrange(key, b'(' + entry_id, b'+', *options)
+                if entries:
+                    result.append([key, entries])
+            return result
+
+        return self._wait_for_entries(block, read)
+
+    def _group(self, key, group):
+        stream = self.data.get(key)
+        groups = stream.get('groups', {}) if isinstance(stream, dict) else {}
+        if group not in groups:
+            raise CommandError(f"NOGROUP No such key '{key.decode()}' or consumer group '{group.decode()}'")
+        return groups[group]
+
+    def cmd_xgroup(self, subcommand, key, group, *args):
+        subcommand = subcommand.upper()
+        if subcommand == b'CREATE':
+            if key not in self.data:
+                if b'MKSTREAM' not in [arg.upper() for arg in args[1:]]:
+                    raise CommandError('ERR The XGROUP subcommand requires the key to exist.')
+                self.data[key] = {'entries': []}
+            groups = self.data[key].setdefault('groups', {})
+            if group in groups:
+                raise CommandError('BUSYGROUP Consumer Group name already exists')
+            last = self._last_stream_id(key) if args[0] == b'$' else args[0]
+            groups[group] = {'last': last, 'pending': {}}
+            return SimpleString('OK')
+        if subcommand == b'DESTROY':
+            stream = self.data.get(key)
+            return int(isinstance(stream, dict) and stream.get('groups', {}).pop(group, None) is not None)
+        raise CommandError(f"ERR unknown subcommand '{subcommand.decode()}'")
+
+    def _pending_ordered(self, pending):
+        return sorted(pending, key=lambda entry_id: _stream_id_key(entry_id, 0))
+
+    def cmd_xreadgroup(self, group_word, group, consumer, *args):
+        count, block, keys, ids = self._read_options(args)
+        options = [b'COUNT', str(count).encode()] if count else []
+
+        def read():
+            now = int(time.time() * 1000)
+            result = []
+            for key, entry_id in zip(keys, ids):
+                state = self._group(key, group)
+                if entry_id == b'>':
+                    entries = self.cmd_xrange(key, b'(' + state['last'], b'+', *options)
+                    for new_id, _ in entries:
+                        state['pending'][new_id] = [consumer, now, 1]
+                    if entries:
+                        state['last'] = entries[-1][0]
+                else:
+                    # History: this consumer's own pending entries after the id
+                    fields_by_id = dict(self.data[key]['entries'])
+                    entries = [[pending_id, fields_by_id.get(pending_id)]
+                               for pending_id in self._pending_ordered(state['pending'])
+                               if state['pending'][pending_id][0] == consumer
+                               and _stream_id_in_range(pending_id, b'(' + entry_id, b'+')][:count]
+                if entries:
+                    result.append([key, entries])
+            return result
+
+        return self._wait_for_entries(block if b'>' in ids else None, read)
+
+    def cmd_xack(self, key, group, *ids):
+        pending = self._group(key, group)['pending']
+        return sum(1 for entry_id in ids if pending.pop(entry_id, None) is not None)
+
+    def cmd_xpending(self, key, group, *args):
+        pending = self._group(key, group)['pending']
+        ordered = self._pending_ordered(pending)
+        if not args:
+            if not ordered:
+                return [0, None, None, None]
+            counts: Dict[bytes, int] = {}
+            for entry_id in ordered:
+                counts[pending[entry_id][0]] = counts.get(pending[entry_id][0], 0) + 1
+            return [len(ordered), ordered[0], ordered[-1], [[name, str(n).encode()] for name, n in counts.items()]]
+        min_idle = None
+        if args[0].upper() == b'IDLE':
+            min_idle, args = int(args[1]), args[2:]
+        start, end, count = args[:3]
+        consumer = args[3] if len(args) > 3 else None
+        now = int(time.time() * 1000)
+        result = []
+        for entry_id in ordered:
+            owner, delivered, deliveries = pending[entry_id]
+            if not _stream_id_in_range(entry_id, start, end) or (consumer and owner != consumer):
+                continue
+            if min_idle is not None and now - delivered < min_idle:
+                continue
+            result.append([entry_id, owner, now - delivered, deliveries])
+            if len(result) >= int(count):
+                break
+        return result
+
+    def cmd_xautoclaim(self, key, group, consumer, min_idle, start, *options):
+        count = int(options[1]) if len(options) >= 2 else 100
+        pending = self._group(key, group)['pending']
+        fields_by_id = dict(self.data[key]['entries'])
+        now = int(time.time() * 1000)
+        claimed, deleted, cursor = [], [], b'0-0'
+        for entry_id in self._pending_ordered(pending):
+            if not _stream_id_in_range(entry_id, start, b'+'):
+                continue
+            if len(claimed) + len(deleted) >= count:
+                cursor = entry_id
+                break
+            owner, delivered, deliveries = pending[entry_id]
+            if now - delivered < int(min_idle):
+                continue
+            if entry_id not in fields_by_id:
+                del pending[entry_id]
+                deleted.append(entry_id)
+                continue
+            pending[entry_id] = [consumer, now, deliveries + 1]
+            claimed.append([entry_id, list(fields_by_id[entry_id])])
+        return [cursor, claimed, deleted]
+
+def _stream_id_key(entry_id: bytes, default_seq: int) -> tuple:
+    """Convert a stream id into a sortable tuple."""
+    exclusive = entry_id.startswith(b'(')
+    if exclusive:
+        entry_id = entry_id[1:]
+    if b'-' in entry_id:
+        ms, seq = entry_id.split(b'-', 1)
+        return (int(ms), int(seq)), exclusive
+    return (int(entry_id), default_seq), exclusive
+
+
+def _stream_id_in_range(entry_id: bytes, start: bytes, end: bytes) -> bool:
+    """Check whether an entry id falls inside an XRANGE interval."""
+    current, _ = _stream_id_key(entry_id, 0)
+    if start != b'-':
+        low, exclusive = _stream_id_key(start, 0)
+        if current < low or (exclusive and current == low):
+            return False
+    if end != b'+':
+        high, exclusive = _stream_id_key(end, 2 ** 64)
+        if current > high or (exclusive and current == high):
+            return False
+    return True
+
+
+def _to_json(value: Any, use_base64: bool = False) -> Any:
+    """Convert engine replies into Upstash JSON result values."""
+    if isinstance(value, str) and use_base64:
+        value = value.encode('utf-8')
+    if isinstance(value, bytes):
+        if use_base64:
+            return base64.b64encode(value).decode('ascii')
+        return value.decode('utf-8', errors='replace')
+    if isinstance(value, list):
+        return [_to_json(item, use_base64) for item in value]
+    return value
+
+
+SCRIPTS = {
+    COLLECT_CHUNK_SCRIPT.strip().encode(): FakeRedisStore._script_collect_chunk,
+    CHUNK_CHECKSUM_SCRIPT.strip().encode(): FakeRedisStore._script_chunk_checksums,
+    SWAP_POINTER_SCRIPT.strip().encode(): FakeRedisStore._script_swap_pointer,
+    SWEEP_VERSION_SCRIPT.strip().encode(): FakeRedisStore._script_sweep_version,
+}
+
+
+class _RestHandler(BaseHTTPRequestHandler):
+    """Upstash REST protocol handler: POST / with a JSON command array."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status: int, body: Any) -> None:
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _run(self, command: List[Any]) -> Dict[str, Any]:
+        args = [part if isinstance(part, bytes) else str(part).encode('utf-8') for part in command]
+        use_base64 = self.headers.get('Upstash-Encoding') == 'base64'
+        try:
+            return {'result': _to_json(self.server.store.execute(args), use_base64)}
+        except CommandError as e:
+            return {'error': str(e)}
+
+    def do_POST(self):
+        self.server.requests_seen += 1
+        if self.headers.get('Authorization') != f'Bearer {self.server.token}':
+            self._send_json(401, {'error': 'Unauthorized'})
+            return
+        length = int(self.headers.get('Content-Length', 0))
+        raw_body = self.rfile.read(length)
+        if self.server.slow_next > 0:
+            self.server.slow_next -= 1
+            time.sleep(self.server.slow_seconds)
+        if self.server.fail_next > 0:
+            # Injected outage: answer like an overloaded upstream
+            self.server.fail_next -= 1
+            self._send_json(503, {'error': 'Service Unavailable'})
+            return
+        path = self.path.rstrip('/')
+        if path not in ('', '/pipeline', '/multi-exec'):
+            # Path-style command: POST /SET/key with the value as raw body
+            command = [unquote_to_bytes(part) for part in path.strip('/').split('/')]
+            if raw_body:
+                command.append(raw_body)
+            reply = self._run(command)
+            self._send_json(400 if 'error' in reply else 200, reply)
+            return
+        body = json.loads(raw_body or b'null')
+        if path == '/pipeline':
+            self._send_json(200, [self._run(command) for command in body])
+            return
+        if path == '/multi-exec':
+            with self.server.store.lock:
+                unknown = [c for c in body if not hasattr(self.server.store, f'cmd_{str(c[0]).lower()}')]
+                if unknown:
+                    self._send_json(400, {'error': f"ERR unknown command '{unknown[0][0]}'"})
+                    return
+                self._send_json(200, [self._run(command) for command in body])
+            return
+        reply = self._run(body)
+        self._send_json(400 if 'error' in reply else 200, reply)
+
+
+class RestStandIn:
+    """Upstash-compatible REST stand-in running on a background thread."""
+
+    def __init__(self, token: str = 'test_token', store: Optional[FakeRedisStore] = None):
+        """Start the server on an ephemeral localhost port."""
+        self.store = store or FakeRedisStore()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), _RestHandler)
+        self.server.daemon_threads = True
+        self.server.store = self.store
+        self.server.token = token
+        self.server.requests_seen = 0
+        self.server.fail_next = 0
+        self.server.slow_next = 0
+        self.server.slow_seconds = 0.0
+        # Clients that time out close their end; don't print the broken pipe
+        self.server.handle_error = lambda request, client_address: None
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}'
+        self.thread = threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True)
+        self.thread.start()
+
+    @property
+    def requests_seen(self) -> int:
+        """Number of HTTP requests received."""
+        return self.server.requests_seen
+
+    def fail_requests(self, count: int) -> None:
+        """Answer the next count requests with HTTP 503."""
+        self.server.fail_next = count
+
+    def slow_requests(self, count: int, seconds: float) -> None:
+        """Delay the next count requests by seconds each."""
+        self.server.slow_seconds = seconds
+        self.server.slow_next = count
+
+    def stop(self) -> None:
+        """Shut the server down."""
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def encode_resp(value: Any, protocol: int = 2) -> bytes:
+    """Encode an engine reply in RESP."""
+    if isinstance(value, CommandError):
+        return b'-' + str(value).encode('utf-8') + b'\r\n'
+    if isinstance(value, SimpleString):
+        return b'+' + value.encode('utf-8') + b'\r\n'
+    if value is None:
+        return b'_\r\n' if protocol == 3 else b'$-1\r\n'
+    if isinstance(value, bool):
+        return b':%d\r\n' % int(value)
+    if isinstance(value, int):
+        return b':%d\r\n' % value
+    if isinstance(value, str):
+        value = value.encode('utf-8')
+    if isinstance(value, bytes):
+        return b'$%d\r\n' % len(value) + value + b'\r\n'
+    if isinstance(value, dict):
+        if protocol == 3:
+            out = [b'%%%d\r\n' % len(value)]
+            for key, item in value.items():
+                out.append(encode_resp(key, protocol))
+                out.append(encode_resp(item, protocol))
+            return b''.join(out)
+        flat = []
+        for key, item in value.items():
+            flat.extend([key, item])
+        value = flat
+    if isinstance(value, (list, tuple)):
+        return b'*%d\r\n' % len(value) + b''.join(encode_resp(item, protocol) for item in value)
+    raise TypeError(f"Cannot encode {type(value).__name__}")
+
+
+class _RespHandler(socketserver.StreamRequestHandler):
+    """Per-connection RESP command loop."""
+
+    def _read_command(self) -> Optional[List[bytes]]:
+        line = self.rfile.readline()
+        if not line:
+            return None
+        if not line.startswith(b'*'):
+            return line.strip().split()
+        args = []
+        for _ in range(int(line[1:])):
+            length = int(self.rfile.readline()[1:])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+    def _write(self, data: bytes) -> None:
+        with self.write_lock:
+            self.wfile.write(data)
+            self.wfile.flush()
+
+    def setup(self):
+        super().setup()
+        self.write_lock = threading.Lock()
+        self.tracking_redirect: Optional[int] = None
+        with self.server.clients_lock:
+            self.server.next_client_id += 1
+            self.client_id = self.server.next_client_id
+            self.server.clients[self.client_id] = self
+
+    def finish(self):
+        with self.server.clients_lock:
+            self.server.clients.pop(self.client_id, None)
+        super().finish()
+
+    def handle(self):
+        self.server.connections_opened += 1
+        protocol = 2
+        authenticated = self.server.password is None
+        queued: Optional[List[List[bytes]]] = None
+        queue_failed = False
+        while True:
+            args = self._read_command()
+            if args is None:
+                return
+            name = args[0].upper()
+            if name == b'MULTI':
+                queued, queue_failed = [], False
+                reply = SimpleString('OK')
+            elif name == b'EXEC':
+                if queued is None:
+                    reply = CommandError('ERR EXEC without MULTI')
+                elif queue_failed:
+                    reply = CommandError('EXECABORT Transaction discarded because of previous errors.')
+                else:
+                    reply = []
+                    with self.server.store.lock:
+                        for command in queued:
+                            try:
+                                reply.append(self.server.store.execute(command))
+                            except CommandError as e:
+                                reply.append(e)
+                queued = None
+            elif queued is not None:
+                if hasattr(self.server.store, f'cmd_{name.decode().lower()}'):
+                    queued.append(args)
+                    reply = SimpleString('QUEUED')
+                else:
+                    queue_failed = True
+                    reply = CommandError(f"ERR unknown command '{name.decode()}'")
+            elif name == b'HELLO':
+                requested = int(args[1]) if len(args) > 1 else protocol
+                if b'AUTH' in [a.upper() for a in args]:
+                    authenticated = args[-1].decode() == self.server.password
+                if requested == 3 and not self.server.resp3:
+                    reply = CommandError('ERR unknown command HELLO')
+                else:
+                    protocol = requested
+                    reply = {b'server': b'standin', b'proto': protocol}
+            elif name == b'AUTH':
+                authenticated = args[-1].decode() == self.server.password
+                reply = SimpleString('OK') if authenticated else CommandError('WRONGPASS invalid password')
+            elif name == b'SELECT':
+                reply = SimpleString('OK')
+            elif name == b'CLIENT' and args[1].upper() == b'ID':
+                reply = self.client_id
+            elif name == b'CLIENT' and args[1].upper() == b'TRACKING':
+                options = [a.upper() for a in args[2:]]
+                if b'REDIRECT' in options:
+                    self.tracking_redirect = int(args[2 + options.index(b'REDIRECT') + 1])
+                reply = SimpleString('OK')
+            elif name == b'SUBSCRIBE':
+                reply = [b'subscribe', args[1], 1]
+            elif not authenticated:
+                reply = CommandError('NOAUTH Authentication required.')
+            else:
+                try:
+                    reply = self.server.store.execute(args)
+                except CommandError as e:
+                    reply = e
+            self._write(encode_resp(reply, protocol))
+
+
+class _ThreadingRespServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class RespStandIn:
+    """RESP socket server backed by FakeRedisStore on a background thread."""
+
+    def __init__(self, password: Optional[str] = None, resp3: bool = True,
+                 store: Optional[FakeRedisStore] = None):
+        """Start the server on an ephemeral localhost port."""
+        self.store = store or FakeRedisStore()
+        self.server = _ThreadingRespServer(('127.0.0.1', 0), _RespHandler)
+        self.server.store = self.store
+        self.server.password = password
+        self.server.resp3 = resp3
+        self.server.connections_opened = 0
+        self.server.clients: Dict[int, _RespHandler] = {}
+        self.server.clients_lock = threading.Lock()
+        self.server.next_client_id = 0
+        self.store.write_listeners.append(self._send_invalidations)
+        auth = f':{password}@' if password else ''
+        self.url = f'redis://{auth}127.0.0.1:{self.server.server_address[1]}/0'
+        self.thread = threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True)
+        self.thread.start()
+
+    def _send_invalidations(self, keys: List[bytes]) -> None:
+        """Notify CLIENT TRACKING redirect targets (every write is reported, like BCAST)."""
+        with self.server.clients_lock:
+            clients = list(self.server.clients.values())
+            targets = {c.tracking_redirect for c in clients if c.tracking_redirect is not None}
+            for target_id in targets:
+                target = self.server.clients.get(target_id)
+                if target is not None:
+                    target._write(encode_resp([b'message', b'__redis__:invalidate', keys]))
+
+    @property
+    def connections_opened(self) -> int:
+        """Number of client connections accepted."""
+        return self.server.connections_opened
+
+    def stop(self) -> None:
+        """Shut the server down."""
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class StandInContractMixin:
+    """Start a stand-in per test and point a profile at it.
+
+    Contract tests mix this into one TestCase per transport and set
+    server_factory, e.g. RespStandIn or partial(RestStandIn, token='tok').
+    """
+
+    server_factory = None
+    extra_env = ''
+    # Async tests build their own clients from self.profile_manager
+    sync_client = True
+
+    def make_server(self):
+        return self.server_factory()
+
+    def env_lines(self):
+        return f"REDIS_URL={self.server.url}\nREDIS_TOKEN=tok\n"
+
+    def setUp(self):
+        """Start a stand-in and point a profile at it."""
+        self.server = self.make_server()
+        self.temp_dir = tempfile.mkdtemp()
+        self.env_file = os.path.join(self.temp_dir, '.env')
+        with open(self.env_file, 'w') as f:
+            f.write(self.env_lines() + self.extra_env)
+        self.profile_manager = ProfileManager(self.env_file)
+        if self.sync_client:
+            self.client = RedisClient(self.profile_manager)
+            self.operations = RedisOperations(self.client)
+
+    def tearDown(self):
+        """Stop stand-in and clean up."""
+        if self.sync_client:
+            self.client.close()
+        self.server.stop()
+        shutil.rmtree(self.temp_dir)
@@ -0,0 +1,198 @@
+"""
+Asyncio Client Tests
+🧵 Synth: Concurrent in-flight requests over pooled async connections
+"""
+
+import asyncio
+import unittest
+import json
+import os
+import time
+from functools import partial
+from pathlib import Path
+from unittest import mock
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from nyro.core.profiles import ProfileManager
+from nyro.core.client import RedisClient, RedisConnectionError
+from nyro.core.operations import RedisOperations
+from nyro.core.aio import AsyncRedisClient, AsyncRedisOperations
+from testing.standins import RestStandIn, RespStandIn, StandInContractMixin
+
+
+class AsyncContractMixin(StandInContractMixin):
+    """Shared async client expectations for every transport."""
+
+    extra_env = 'NYRO_POOL_SIZE=3\n'
+    sync_client = False
+
+    def run_async(self, coroutine):
+        return asyncio.run(coroutine)
+
+    def test_concurrent_requests_share_bounded_pool(self):
+        """🧵 Many in-flight commands are served by at most pool_size connections."""
+        async def scenario():
+            client = AsyncRedisClient(self.profile_manager)
+            try:
+                self.assertTrue(await client.test_connection())
+                writes = await asyncio.gather(*(client.set_key(f'k{i}', f'v{i}') for i in range(30)))
+                reads = await asyncio.gather(*(client.get_key(f'k{i}') for i in range(30)))
+                return writes, reads, client.get_pool_stats()
+            finally:
+                await client.close()
+
+        writes, reads, stats = self.run_async(scenario())
+        self.assertTrue(all(writes))
+        self.assertEqual(reads, [f'v{i}' for i in range(30)])
+        self.assertLessEqual(stats['misses'], 3)
+        self.assertEqual(stats['hits'] + stats['misses'], stats['requests'])
+
+    def test_operations_surface(self):
+        """🧵 Streams, scans and massive payloads mirror the blocking API."""
+        async def scenario():
+            client = AsyncRedisClient(self.profile_manager)
+            operations = AsyncRedisOperations(client)
+            try:
+                entry_id = await operations.stream_add('garden.diary', {'event': 'sprout'})
+                entries = await operations.stream_read('garden.diary')
+                payload = {'type': 'walking_payload', 'blob': 'y' * 4000}
+                stored = await operations.store_massive_payload('walk', payload, chunk_size=1000)
+                loaded = await operations.load_massive_payload('walk')
+                keys = await client.scan_keys('walk:*')
+                return entry_id, entries, stored, loaded, payload, keys
+            finally:
+                await client.close()
+
+        entry_id, entries, stored, loaded, payload, keys = self.run_async(scenario())
+        self.assertEqual(entries[0]['id'], entry_id)
+        self.assertEqual(entries[0]['fields']['event'], 'sprout')
+        self.assertTrue(stored)
+        self.assertEqual(loaded, payload)
+        self.assertIn('walk:metadata', keys)
+
+    def test_reads_values_compressed_by_blocking_client(self):
+        """🧵 Values and chunked payloads written compressed load back through the async client."""
+        env_file = os.path.join(self.temp_dir, 'compressed.env')
+        with open(env_file, 'w') as f:
+            f.write(self.env_lines() + "NYRO_COMPRESSION=zlib\nNYRO_COMPRESSION_THRESHOLD=100\n")
+        writer = RedisClient(ProfileManager(env_file))
+        try:
+            value = 'moss ' * 400
+            self.assertTrue(writer.set_key('mossy', value))
+            payload = {'type': 'walking_payload', 'data': [f'fern {i}' for i in range(3000)]}
+            self.assertTrue(RedisOperations(writer).store_massive_payload('walk', payload, chunk_size=1000))
+            self.assertEqual(json.loads(writer.get_key('walk:metadata'))['compression'], 'zlib')
+            self.assertTrue(RedisOperations(writer).store_massive_payload('walk:cas', payload, dedup=True))
+        finally:
+            writer.close()
+
+        async def scenario():
+            client = AsyncRedisClient(self.profile_manager)
+            operations = AsyncRedisOperations(client)
+            try:
+                return (await client.get_key('mossy'), await operations.load_massive_payload('walk'),
+                        await operations.load_massive_payload('walk:cas'))
+            finally:
+                await client.close()
+
+        self.assertEqual(self.run_async(scenario()), (value, payload, payload))
+
+    def test_chunks_are_verified_against_checksums(self):
+        """🧵 Damaged reads are fetched again; damaged chunks fail the load."""
+        writer = RedisClient(ProfileManager(self.env_file))
+        try:
+            payload = {'type': 'walking_payload', 'data': [f'fern {i}' for i in range(3000)]}
+            self.assertTrue(RedisOperations(writer).store_massive_payload('walk', payload, chunk_size=1000))
+            version = json.loads(writer.get_key('walk:metadata'))['version']
+        finally:
+            writer.close()
+
+        async def scenario():
+            client = AsyncRedisClient(self.profile_manager)
+            operations = AsyncRedisOperations(client)
+            original = client.execute_command
+
+            async def flaky(*args, **kwargs):
+                reply = await original(*args, **kwargs)
+                if args[0] == 'MGET' and not damaged:
+                    damaged.append(args[1])
+                    reply = [reply[0][::-1]] + list(reply[1:])
+                return reply
+
+            damaged = []
+            client.execute_command = flaky
+            try:
+                recovered = await operations.load_massive_payload('walk')
+                # Same length, still valid JSON: only the checksum catches it
+                name = f'walk:v:{version}:chunk:1'
+                chunk = await original('GET', name)
+                await original('SET', name, chunk.replace('fern', 'fenn'))
+                return damaged, recovered, await operations.load_massive_payload('walk')
+            finally:
+                await client.close()
+
+        damaged, recovered, corrupt = self.run_async(scenario())
+        self.assertEqual(len(damaged), 1)
+        self.assertEqual(recovered, payload)
+        self.assertIsNone(corrupt)
+
+
+class AsyncRestTests(AsyncContractMixin, unittest.TestCase):
+    """🧵 Async client over the REST stand-in."""
+
+    server_factory = partial(RestStandIn, token='tok')
+
+    def env_lines(self):
+        return f"KV_REST_API_URL={self.server.url}\nKV_REST_API_TOKEN=tok\n"
+
+
+class AsyncRespTests(AsyncContractMixin, unittest.TestCase):
+    """🧵 Async client over the RESP stand-in."""
+
+    server_factory = partial(RespStandIn, password='pw')
+
+    def env_lines(self):
+        return f"REDIS_URL={self.server.url}\nREDIS_TOKEN=unused\n"
+
+
+
+class AsyncRespTimeoutTests(StandInContractMixin, unittest.TestCase):
+    """🧵 Profile timeouts on pooled async RESP connections."""
+
+    server_factory = RespStandIn
+    extra_env = 'NYRO_TIMEOUT=0.2\n'
+    sync_client = False
+
+    def test_timeout_on_reused_connection_is_not_resent(self):
+        """🧵 A stalled reply times out at NYRO_TIMEOUT and is never sent twice."""
+        execute = self.server.store.execute
+        stalled = []
+
+        def slow(args):
+            if args[0].upper() == b'RPUSH' and not stalled:
+                stalled.append(args)
+                time.sleep(0.6)
+            return execute(args)
+
+        async def scenario():
+            client = AsyncRedisClient(self.profile_manager)
+            try:
+                self.assertTrue(await client.test_connection())
+                started = time.monotonic()
+                with self.assertRaises(RedisConnectionError):
+                    await client.execute_command('RPUSH', 'l', 'x')
+                return time.monotonic() - started
+            finally:
+                await client.close()
+
+        with mock.patch.object(self.server.store, 'execute', side_effect=slow):
+            elapsed = asyncio.run(scenario())
+            time.sleep(0.8)
+        self.assertLess(elapsed, 0.6)
+        self.assertEqual(execute([b'LRANGE', b'l', b'0', b'-1']), [b'x'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+"""
+Read Cache Tests
+🧵 Synth: get_key caching, eviction and invalidation
+"""
+
+import unittest
+import tempfile
+import time
+import os
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from nyro.core.profiles import ProfileManager
+from nyro.core.client import RedisClient
+from nyro.core.cache import KeyCache
+from testing.standins import RestStandIn, RespStandIn
+
+
+class KeyCacheTests(unittest.TestCase):
+    """🧵 LRU and TTL bookkeeping."""
+
+    def test_lru_eviction_and_stats(self):
+        """🧵 Least recently used entries are evicted first."""
+        cache = KeyCache(max_entries=2, ttl=0)
+        cache.set('a', '1')
+        cache.set('b', '2')
+        self.assertEqual(cache.get('a'), (True, '1'))
+        cache.set('c', '3')
+        self.assertEqual(cache.get('b'), (False, None))
+        self.assertEqual(cache.get('c'), (True, '3'))
+
+        stats = cache.get_stats()
+        self.assertEqual(stats['evictions'], 1)
+        self.assertEqual(stats['size'], 2)
+        self.assertAlmostEqual(stats['hit_rate'], 2 / 3)
+
+    def test_ttl_expiry_and_stale_write_guard(self):
+        """🧵 Expired entries miss; a value fetched before an invalidation is not stored."""
+        cache = KeyCache(max_entries=10, ttl=0.05)
+        cache.set('k', 'v')
+        time.sleep(0.06)
+        self.assertEqual(cache.get('k'), (False, None))
+        self.assertEqual(cache.get_stats()['expirations'], 1)
+
+        version = cache.version
+        cache.invalidate('k')
+        cache.set('k', 'stale', version)
+        self.assertEqual(cache.get('k'), (False, None))
+
+
+class ClientCacheTests(unittest.TestCase):
+    """🧵 RedisClient.get_key served from the cache."""
+
+    def _client(self, url: str, extra: str = '') -> RedisClient:
+        env_file = os.path.join(self.temp_dir, f'{len(os.listdir(self.temp_dir))}.env')
+        with open(env_file, 'w') as f:
+            f.write(f"REDIS_URL={url}\nREDIS_TOKEN=rest_token\nNYRO_CACHE_SIZE=100\n{extra}")
+        client = RedisClient(ProfileManager(env_file))
+        self.clients.append(client)
+        return client
+
+    def setUp(self):
+        """Prepare temp dir for .env files."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.clients = []
+        self.servers = []
+
+    def test_repeated_reads_skip_round_trip(self):
+        """🧵 Cached reads stay local; own writes invalidate."""
+        server = RestStandIn(token='rest_token')
+        self.servers.append(server)
+        client = self._client(server.url)
+
+        client.set_key('config:theme', 'forest')
+        self.assertEqual(client.get_key('config:theme'), 'forest')
+        seen = server.requests_seen
+        for _ in range(5):
+            self.assertEqual(client.get_key('config:theme'), 'forest')
+        self.assertEqual(server.requests_seen, seen)
+
+        self.assertTrue(client.set_key('config:theme', 'desert'))
+        self.assertEqual(client.get_key('config:theme'), 'desert')
+        self.assertTrue(client.delete_key('config:theme'))
+        self.assertIsNone(client.get_key('config:theme'))
+
+        stats = client.get_cache_stats()
+        self.assertEqual(stats['hits'], 5)
+        self.assertEqual(stats['misses'], 3)
+
+    def test_cache_disabled_by_default(self):
+        """🧵 Without NYRO_CACHE_SIZE there is no cache."""
+        server = RestStandIn(token='rest_token')
+        self.servers.append(server)
+        env_file = os.path.join(self.temp_dir, 'plain.env')
+        with open(env_file, 'w') as f:
+            f.write(f"KV_REST_API_URL={server.url}\nKV_REST_API_TOKEN=rest_token\n")
+        client = RedisClient(ProfileManager(env_file))
+        self.clients.append(client)
+        self.assertEqual(client.get_cache_stats(), {})
+
+    def test_tracking_invalidates_other_clients_writes(self):
+        """🧵 CLIENT TRACKING drops values another client changed."""
+        server = RespStandIn()
+        self.servers.append(server)
+        reader = self._client(server.url, "NYRO_CACHE_TTL=0\nNYRO_CACHE_TRACKING=true\nNYRO_RESP_PROTOCOL=3\n")
+        writer = RedisClient(ProfileManager(self._env_without_cache(server.url)))
+        self.clients.append(writer)
+
+        writer.set_key('config:mode', 'calm')
+        self.assertEqual(reader.get_key('config:mode'), 'calm')
+        self.assertEqual(reader.get_key('config:mode'), 'calm')
+        writer.set_key('config:mode', 'storm')
+
+        deadline = time.monotonic() + 2
+        while reader.get_key('config:mode') != 'storm' and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(reader.get_key('config:mode'), 'storm')
+        self.assertGreaterEqual(reader.get_cache_stats()['invalidations'], 1)
+
+    def _env_without_cache(self, url: str) -> str:
+        env_file = os.path.join(self.temp_dir, 'writer.env')
+        with open(env_file, 'w') as f:
+            f.write(f"REDIS_URL={url}\nREDIS_TOKEN=unused\n")
+        return env_file
+
+    def tearDown(self):
+        """Stop stand-ins and clean up."""
+        import shutil
+        for client in self.clients:
+            client.close()
+        for server in self.servers:
+            server.stop()
+        shutil.rmtree(self.temp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+"""
+Value Compression Tests
+🧵 Synth: Compressed set_key/get_key values and payload chunks
+"""
+
+import unittest
+import tempfile
+import os
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from nyro.core.profiles import ProfileManager
+from nyro.core.client import RedisClient
+from nyro.core.operations import RedisOperations, build_payload_chunks, assemble_payload_chunks
+from nyro.core.codec import ValueCodec, is_compressed, MAGIC
+from testing.standins import RestStandIn, RespStandIn
+
+
+class ValueCodecTests(unittest.TestCase):
+    """🧵 Header, threshold and stats bookkeeping."""
+
+    def test_threshold_and_round_trip(self):
+        """🧵 Small values stay raw; large ones get the header and round-trip."""
+        codec = ValueCodec('zlib', threshold=64)
+        self.assertEqual(codec.encode(b'short'), b'short')
+
+        value = b'forest ' * 200
+        packed = codec.encode(value)
+        self.assertTrue(packed.startswith(MAGIC))
+        self.assertLess(len(packed), len(value))
+        self.assertEqual(ValueCodec().decode(packed), value)
+        self.assertEqual(ValueCodec().decode(b'plain'), b'plain')
+
+        stats = codec.get_stats()
+        self.assertEqual(stats['compressed'], 1)
+        self.assertGreater(stats['ratio'], 1.0)
+
+    def test_incompressible_values_stay_raw(self):
+        """🧵 Compression that does not shrink the value is skipped."""
+        codec = ValueCodec('zlib', threshold=0)
+        value = os.urandom(512)
+        self.assertEqual(codec.encode(value), value)
+        self.assertEqual(codec.get_stats()['skipped'], 1)
+
+    def test_unknown_codec_rejected(self):
+        """🧵 Unsupported codec names fail loudly."""
+        with self.assertRaises(ValueError):
+            ValueCodec('brotli')
+
+    def test_chunks_base64_without_binary_batches(self):
+        """🧵 Compressed chunks become base64 text when batches must be text."""
+        payload = {'files': ['garden'] * 2000}
+        codec = ValueCodec('zlib', threshold=0)
+        _, chunks, metadata = build_payload_chunks(payload, 256, codec, binary=False)
+        self.assertEqual(metadata['encoding'], 'base64')
+        self.assertEqual(metadata['compression'], 'zlib')
+        self.assertTrue(all(isinstance(chunk, str) for chunk in chunks))
+        self.assertEqual(assemble_payload_chunks(chunks, metadata), payload)
+
+
+class ClientCompressionTests(unittest.TestCase):
+    """🧵 RedisClient compressing large values on REST and RESP profiles."""
+
+    def setUp(self):
+        """Prepare temp dir for .env files."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.clients = []
+        self.servers = []
+
+    def _client(self, url: str, extra: str = '') -> RedisClient:
+        env_file = os.path.join(self.temp_dir, f'{len(os.listdir(self.temp_dir))}.env')
+        with open(env_file, 'w') as f:
+            f.write(f"REDIS_URL={url}\nREDIS_TOKEN=rest_token\n{extra}")
+        client = RedisClient(ProfileManager(env_file))
+        self.clients.append(client)
+        return client
+
+    def _check_round_trip(self, server):
+        writer = self._client(server.url, "NYRO_COMPRESSION=zlib\nNYRO_COMPRESSION_THRESHOLD=100\n")
+        reader = self._client(server.url)
+        value = 'moss and fern ' * 500
+
+        self.assertTrue(writer.set_key('garden:notes', value))
+        self.assertTrue(writer.set_key('garden:tiny', 'leaf'))
+        stored = writer.execute_command('GET', 'garden:notes', raw=True)
+        self.assertTrue(is_compressed(stored))
+        self.assertLess(len(stored), len(value))
+
+        # Readers auto-detect the header without compression configured
+        self.assertEqual(reader.get_key('garden:notes'), value)
+        self.assertEqual(reader.get_key('garden:tiny'), 'leaf')
+        self.assertEqual(writer.get_compression_stats()['compressed'], 1)
+
+    def test_rest_round_trip(self):
+        """🧵 REST profiles store compressed values via the raw-body path."""
+        server = RestStandIn(token='rest_token')
+        self.servers.append(server)
+        self._check_round_trip(server)
+
+    def test_resp_round_trip(self):
+        """🧵 RESP profiles store compressed values as binary bulk strings."""
+        server = RespStandIn()
+        self.servers.append(server)
+        self._check_round_trip(server)
+
+    def test_compressed_massive_payload(self):
+        """🧵 Chunked payloads are compressed before chunking and load back."""
+        payload = {'entries': [{'path': f'garden/{i}.md', 'content': 'seed ' * 40} for i in range(200)]}
+        for server in (RestStandIn(token='rest_token'), RespStandIn()):
+            self.servers.append(server)
+            client = self._client(server.url, "NYRO_COMPRESSION=zlib\n")
+            operations = RedisOperations(client)
+
+            self.assertTrue(operations.store_massive_payload('walk', payload, chunk_size=1024))
+            self.assertEqual(operations.load_massive_payload('walk'), payload)
+            stored_metadata = client.get_key('walk:metadata')
+            self.assertIn('"compression": "zlib"', stored_metadata)
+
+            stored = RedisOperations(self._client(server.url)).load_massive_payload('walk')
+            self.assertEqual(stored, payload)
+
+    def tearDown(self):
+        """Stop stand-ins and clean up."""
+        import shutil
+        for client in self.clients:
+            client.close()
+        for server in self.servers:
+            server.stop()
+        shutil.rmtree(self.temp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+"""
+Deadline and Hedging Tests
+🧵 Synth: Bounding slow calls and multi-call operations in time
+"""
+
+import unittest
+import tempfile
+import socket
+import time
+import os
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from nyro.core.profiles import ProfileManager
+from nyro.core.client import RedisClient, RedisTransientError, DeadlineExceededError
+from nyro.core.operations import RedisOperations
+from nyro.core.resp import RespConnection, RespConnectionPool
+from testing.standins import RestStandIn, RespStandIn
+
+
+class DeadlineTests(unittest.TestCase):
+    """🧵 Per-command timeouts, shared deadlines and hedged reads over REST."""
+
+    def setUp(self):
+        """Start REST stand-in with short timeouts and no retries."""
+        self.server = RestStandIn(token='rest_token')
+        self.temp_dir = tempfile.mkdtemp()
+        self.env_file = os.path.join(self.temp_dir, '.env')
+        self._write_env("NYRO_TIMEOUT=0.2\nNYRO_RETRIES=0\nNYRO_BREAKER_THRESHOLD=0\n")
+
+    def _write_env(self, extra: str) -> None:
+        with open(self.env_file, 'w') as f:
+            f.write(f"KV_REST_API_URL={self.server.url}\nKV_REST_API_TOKEN=rest_token\n{extra}")
+        self.client = RedisClient(ProfileManager(self.env_file))
+        self.operations = RedisOperations(self.client)
+
+    def test_per_command_timeout(self):
+        """🧵 NYRO_TIMEOUT bounds a single slow call; timeout= overrides it."""
+        self.client.set_key('slow', 'value')
+        self.server.slow_requests(1, 0.5)
+        started = time.monotonic()
+        self.assertIsNone(self.client.get_key('slow'))
+        self.assertLess(time.monotonic() - started, 0.45)
+        self.assertIsInstance(self.client.last_error, RedisTransientError)
+
+        self.server.slow_requests(1, 0.3)
+        self.assertEqual(self.client.execute_command('GET', 'slow', timeout=1.0), 'value')
+
+    def test_deadline_spans_chunked_load(self):
+        """🧵 One budget covers every chunk fetch of a payload load."""
+        payload = {'notes': ['leaf'] * 200}
+        self.assertTrue(self.operations.store_massive_payload('big', payload, chunk_size=200))
+        self.assertEqual(self.operations.load_massive_payload('big'), payload)
+
+        self.server.slow_requests(100, 0.05)
+        started = time.monotonic()
+        # One chunk per request; the deadline also bounds the worker threads
+        self.assertIsNone(self.operations.load_massive_payload('big', timeout=0.25, concurrency=2, batch_bytes=200))
+        self.assertLess(time.monotonic() - started, 0.5)
+
+        with self.assertRaises(DeadlineExceededError):
+            with self.client.deadline(0.05):
+                time.sleep(0.06)
+                self.client.execute_command('GET', 'big')
+
+    def test_garden_scan_returns_partial_on_deadline(self):
+        """🧵 A timed-out scan keeps the keys it already found."""
+        with self.client.pipeline() as pipe:
+            for i in range(30):
+                pipe.set_key(f'plot:{i}', 'soil')
+        self.server.slow_requests(100, 0.05)
+        result = self.operations.scan_garden('plot:*', count=5, timeout=0.12)
+        self.assertFalse(result['complete'])
+        self.assertLess(result['total_keys'], 30)
+
+    def test_hedged_read_beats_slow_node(self):
+        """🧵 A duplicate read answers while the first request is stuck."""
+        self._write_env("NYRO_TIMEOUT=2\nNYRO_HEDGE_AFTER=0.05\n")
+        self.client.set_key('hedge', 'fast answer')
+        self.server.slow_requests(1, 1.0)
+        started = time.monotonic()
+        self.assertEqual(self.client.get_key('hedge'), 'fast answer')
+        self.assertLess(time.monotonic() - started, 0.5)
+        stats = self.client.get_retry_stats()
+        self.assertEqual(stats['hedged'], 1)
+        self.assertEqual(stats['backup_wins'], 1)
+
+    def tearDown(self):
+        """Stop stand-in and clean up."""
+        import shutil
+        self.client.close()
+        self.server.stop()
+        shutil.rmtree(self.temp_dir)
+
+
+class RespTimeoutTests(unittest.TestCase):
+    """🧵 Timeouts on pooled RESP connections."""
+
+    def test_timeout_on_reused_connection_is_not_resent(self):
+        """🧵 A stalled reply is not mistaken for a stale connection and sent twice."""
+        from unittest.mock import patch
+        server = RespStandIn()
+        pool = RespConnectionPool(server.url)
+        try:
+            pool.execute('PING')
+            sent = []
+
+            def stalled(connection, *args, **kwargs):
+                sent.append(args)
+                raise socket.timeout('timed out')
+
+            with patch.object(RespConnection, 'execute', stalled):
+                with self.assertRaises(socket.timeout):
+                    pool.execute('INCR', 'counter', timeout=0.1)
+            self.assertEqual(sent, [('INCR', 'counter')])
+        finally:
+            pool.disconnect()
+            server.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
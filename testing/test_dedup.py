@@ -0,0 +1,117 @@
+"""
+Chunk Deduplication Tests
+🧵 Synth: Content-defined chunks, manifests and reference-counted GC
+"""
+
+import unittest
+import random
+import os
+from functools import partial
+from pathlib import Path
+from unittest import mock
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from nyro.core.client import RedisConnectionError
+from nyro.core.dedup import split_chunks, chunk_digest, CHUNK_PREFIX
+from testing.standins import RestStandIn, RespStandIn, StandInContractMixin
+
+
+def _walk(seed: int, files: int = 300) -> dict:
+    rng = random.Random(seed)
+    return {'files': [{'path': f'src/{i}.py', 'content': ''.join(rng.choices('abcdef \n', k=600))}
+                      for i in range(files)]}
+
+
+class ChunkBoundaryTests(unittest.TestCase):
+    """🧵 Boundaries follow content, not offsets."""
+
+    def test_insert_only_changes_nearby_chunks(self):
+        """🧵 Inserting bytes early leaves later chunks identical."""
+        data = os.urandom(400_000)
+        edited = data[:1000] + b'inserted' + data[1000:]
+        before = {chunk_digest(chunk) for chunk in split_chunks(data, 2048, 8192, 32768)}
+        after = [chunk_digest(chunk) for chunk in split_chunks(edited, 2048, 8192, 32768)]
+        self.assertLessEqual(sum(1 for digest in after if digest not in before), 2)
+        self.assertEqual(b''.join(split_chunks(edited, 2048, 8192, 32768)), edited)
+
+
+class DedupPayloadContractMixin(StandInContractMixin):
+    """Shared content-addressed storage expectations for every transport."""
+
+    def test_incremental_snapshot_uploads_only_changes(self):
+        """🧵 A second, slightly edited snapshot reuses almost every chunk."""
+        first = _walk(1, files=2000)
+        self.assertTrue(self.operations.store_massive_payload('walk:mon', first, dedup=True))
+        initial = self.operations.get_transfer_stats()
+        self.assertEqual(initial['reused_chunks'], 0)
+
+        second = _walk(1, files=2000)
+        second['files'][1500]['content'] += 'print("changed")'
+        self.assertTrue(self.operations.store_massive_payload('walk:tue', second, dedup=True))
+        stats = self.operations.get_transfer_stats()
+        self.assertLessEqual(stats['new_chunks'], 2)
+        self.assertLess(stats['bytes'] * 5, initial['bytes'])
+        self.assertGreater(stats['total_chunks'], 10)
+
+        self.assertEqual(self.operations.load_massive_payload('walk:mon'), first)
+        self.assertEqual(self.operations.load_massive_payload('walk:tue'), second)
+
+    def test_garbage_collection_keeps_referenced_chunks(self):
+        """🧵 Only chunks no manifest references are collected."""
+        self.operations.store_massive_payload('walk:a', _walk(2), dedup=True)
+        self.operations.store_massive_payload('walk:b', _walk(2), dedup=True)
+        self.operations.store_massive_payload('walk:c', _walk(3), dedup=True)
+        self.assertEqual(self.operations.collect_chunks()['deleted'], 0)
+
+        self.assertTrue(self.operations.delete_massive_payload('walk:a'))
+        self.assertEqual(self.operations.collect_chunks()['deleted'], 0)
+        self.assertEqual(self.operations.load_massive_payload('walk:b'), _walk(2))
+
+        # Replacing a manifest releases its old chunks
+        self.operations.store_massive_payload('walk:b', _walk(3), dedup=True)
+        self.assertGreater(self.operations.collect_chunks()['deleted'], 0)
+        self.assertEqual(self.operations.load_massive_payload('walk:b'), _walk(3))
+        self.assertEqual(self.operations.load_massive_payload('walk:c'), _walk(3))
+
+        # Interrupted uploads leave unreferenced chunks that are collected too
+        self.client.set_key(f'{CHUNK_PREFIX}orphan', 'x')
+        self.assertEqual(self.operations.collect_chunks()['deleted'], 1)
+
+    def test_failed_release_keeps_the_new_manifest(self):
+        """🧵 Failing to release the replaced manifest never drops the live one's chunks."""
+        self.operations.store_massive_payload('walk', _walk(2), dedup=True)
+        execute_pipeline = self.client._execute_pipeline
+        failures = []
+
+        def flaky(commands, **kwargs):
+            if not failures and commands[0][0] == 'HINCRBY' and commands[0][-1] == -1:
+                failures.append(commands)
+                raise RedisConnectionError('connection reset')
+            return execute_pipeline(commands, **kwargs)
+
+        with mock.patch.object(self.client, '_execute_pipeline', side_effect=flaky):
+            self.assertTrue(self.operations.store_massive_payload('walk', _walk(3), dedup=True))
+        self.assertEqual(len(failures), 1)
+
+        self.operations.collect_chunks()
+        self.assertEqual(self.operations.load_massive_payload('walk'), _walk(3))
+
+
+class RestDedupTests(DedupPayloadContractMixin, unittest.TestCase):
+    """🧵 Content-addressed payloads over REST (compressed chunks sent one per request)."""
+
+    extra_env = 'NYRO_COMPRESSION=zlib\n'
+
+    server_factory = partial(RestStandIn, token='tok')
+
+
+class RespDedupTests(DedupPayloadContractMixin, unittest.TestCase):
+    """🧵 Content-addressed payloads over RESP."""
+
+    server_factory = RespStandIn
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,230 @@
+"""
+Pipeline Tests
+🧵 Synth: Batched commands return ordered results on both transports
+"""
+
+import unittest
+import os
+import json
+from functools import partial
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from nyro.core.client import RedisCommandError
+from nyro.core.operations import RedisOperations
+from testing.standins import RestStandIn, RespStandIn, StandInContractMixin
+
+
+class PipelineContractMixin(StandInContractMixin):
+    """Shared pipeline expectations for every transport."""
+
+    def test_results_come_back_in_order(self):
+        """🧵 Each queued command gets its own result, in order."""
+        with self.client.pipeline() as pipe:
+            pipe.set_key('a', '1').set_key('b', '2')
+            pipe.get_key('a').get_key('missing')
+            pipe.command('RPUSH', 'queue', 'x', 'y')
+        self.assertEqual(pipe.results, ['OK', 'OK', '1', None, 2])
+
+    def test_errors_are_reported_per_command(self):
+        """🧵 A failing command does not hide the others' results."""
+        pipe = self.client.pipeline()
+        pipe.command('RPUSH', 'listy', 'x').get_key('listy').set_key('c', '3')
+        results = pipe.execute()
+        self.assertEqual(results[0], 1)
+        self.assertIsInstance(results[1], RedisCommandError)
+        self.assertIn('WRONGTYPE', str(results[1]))
+        self.assertEqual(results[2], 'OK')
+
+        with self.assertRaises(RedisCommandError):
+            self.client.pipeline().get_key('listy').execute(raise_on_error=True)
+
+    def test_exception_discards_batch(self):
+        """🧵 Leaving the block with an exception sends nothing."""
+        with self.assertRaises(KeyError):
+            with self.client.pipeline() as pipe:
+                pipe.set_key('ghost', 'boo')
+                raise KeyError('abort')
+        self.assertIsNone(self.client.get_key('ghost'))
+
+    def test_transaction_commits_all_writes(self):
+        """🧵 A transaction applies every write and returns per-command results."""
+        with self.client.transaction() as tx:
+            tx.set_key('t1', 'one').set_key('t2', 'two').get_key('t1')
+        self.assertEqual(tx.results, ['OK', 'OK', 'one'])
+
+    def test_rejected_transaction_applies_nothing(self):
+        """🧵 A batch the server refuses leaves no partial writes behind."""
+        tx = self.client.transaction()
+        tx.set_key('half', 'written').command('NOSUCHCMD', 'x')
+        with self.assertRaises(RedisCommandError):
+            tx.execute()
+        self.assertIsNone(self.client.get_key('half'))
+
+    def test_chunked_payload_is_one_atomic_write(self):
+        """🧵 Chunked payloads commit metadata and chunks together."""
+        operations = RedisOperations(self.client)
+        payload = {'type': 'walking_payload', 'data': 'x' * 5000}
+        before = len(self.server.store.commands)
+        self.assertTrue(operations.store_massive_payload('walk', payload, chunk_size=1024))
+        written = [c for c in self.server.store.commands[before:] if c[0].upper() in (b'SET', b'EVAL')]
+        # The pointer swap comes last, inside the same transaction as the chunks
+        self.assertEqual((written[-1][0].upper(), written[-1][3]), (b'EVAL', b'walk:metadata'))
+        self.assertEqual(operations.load_massive_payload('walk'), payload)
+
+    def _chunk_name(self, key, index):
+        version = json.loads(self.client.get_key(f'{key}:metadata'))['version']
+        return f'{key}:v:{version}:chunk:{index}'
+
+    def test_parallel_batched_payload_transfer(self):
+        """🧵 Large payloads move in bounded MSET/MGET batches with progress reports."""
+        operations = RedisOperations(self.client)
+        payload = {'type': 'walking_payload', 'data': [f'line {i}' for i in range(3000)]}
+        reports = []
+        before = len(self.server.store.commands)
+        self.assertTrue(operations.store_massive_payload('walk', payload, chunk_size=1000, concurrency=3,
+                                                         batch_bytes=4000, progress=lambda d, t: reports.append((d, t))))
+        sent = [c for c in self.server.store.commands[before:] if c[0].upper() == b'MSET']
+        chunks = operations.get_transfer_stats()['chunks']
+        self.assertEqual(len(sent), -(-chunks // 4))
+        self.assertEqual(self.server.store.commands[-1][3], b'walk:metadata')
+        self.assertEqual(max(reports)[0], max(reports)[1])
+
+        before = len(self.server.store.commands)
+        self.assertEqual(operations.load_massive_payload('walk', concurrency=3, batch_bytes=4000), payload)
+        fetched = [c for c in self.server.store.commands[before:] if c[0].upper() == b'MGET']
+        self.assertEqual(len(fetched), len(sent))
+        stats = operations.get_transfer_stats()
+        self.assertEqual(stats['chunks'], chunks)
+        self.assertEqual(stats['requests'], len(fetched))
+
+        # A missing chunk fails the load instead of returning a corrupt payload
+        self.client.delete_key(self._chunk_name('walk', 1))
+        self.assertIsNone(operations.load_massive_payload('walk'))
+
+    def test_resumed_upload_and_verified_load(self):
+        """🧵 Resumes send only missing chunks; loads re-read only corrupt ones."""
+        operations = RedisOperations(self.client)
+        payload = {'type': 'walking_payload', 'data': [f'line {i}' for i in range(3000)]}
+        self.assertTrue(operations.store_massive_payload('walk', payload, chunk_size=1000, batch_bytes=4000))
+        total = operations.get_transfer_stats()['chunks']
+
+        # An interrupted upload: no metadata yet, one chunk lost and one damaged
+        chunk_5, chunk_7 = self._chunk_name('walk', 5), self._chunk_name('walk', 7)
+        self.client.delete_key('walk:metadata')
+        self.client.delete_key(chunk_5)
+        self.client.execute_command('SET', chunk_7, 'garbage')
+        self.assertTrue(operations.store_massive_payload('walk', payload, chunk_size=1000, batch_bytes=4000,
+                                                         resume=True))
+        stats = operations.get_transfer_stats()
+        self.assertEqual((stats['chunks'], stats['skipped_chunks']), (2, total - 2))
+        self.assertEqual(operations.load_massive_payload('walk'), payload)
+
+        # A bad read is fetched again on its own
+        original = self.client.execute_command
+        damaged = []
+
+        def flaky(*args, **kwargs):
+            reply = original(*args, **kwargs)
+            if args[0] == 'MGET' and not damaged:
+                damaged.append(args[1])
+                reply = [reply[0][::-1]] + list(reply[1:])
+            return reply
+
+        self.client.execute_command = flaky
+        try:
+            self.assertEqual(operations.load_massive_payload('walk'), payload)
+        finally:
+            self.client.execute_command = original
+        self.assertEqual(operations.get_transfer_stats()['refetched_chunks'], 1)
+
+        # Corruption that persists fails the load
+        self.client.execute_command('SET', self._chunk_name('walk', 2), 'garbage')
+        self.assertIsNone(operations.load_massive_payload('walk'))
+
+    def test_stream_round_trip_with_bounded_chunks(self):
+        """🧵 store_stream/load_stream move files and pipes chunk by chunk."""
+        import io
+        operations = RedisOperations(self.client)
+        blob = bytes(range(256)) * 40
+        path = os.path.join(self.temp_dir, 'blob.bin')
+        with open(path, 'wb') as f:
+            f.write(blob)
+        with open(path, 'rb') as f:
+            self.assertEqual(operations.store_stream('blob', f, chunk_size=1000), len(blob))
+        self.assertEqual(operations.get_transfer_stats()['chunks'], 11)
+        out = io.BytesIO()
+        self.assertEqual(operations.load_stream('blob', out), len(blob))
+        self.assertEqual(out.getvalue(), blob)
+
+        # Pipe-like input; JSON streams stay readable by load_massive_payload
+        payload = {'notes': ['fern'] * 500}
+        source = io.BufferedReader(io.BytesIO(json.dumps(payload).encode()), buffer_size=7)
+        operations.store_stream('walk', source, chunk_size=512)
+        self.assertEqual(operations.load_massive_payload('walk'), payload)
+        self.assertIsNone(operations.load_stream('absent', io.BytesIO()))
+
+    def test_load_stream_reads_compressed_payloads(self):
+        """🧵 Compressed chunked payloads are decompressed incrementally."""
+        import io
+        from nyro.core.codec import ValueCodec
+        operations = RedisOperations(self.client)
+        payload = {'entries': [f'seed {i}' for i in range(2000)]}
+        self.client._transport().codec = ValueCodec('zlib')
+        self.assertTrue(operations.store_massive_payload('walk', payload, chunk_size=512))
+        out = io.BytesIO()
+        operations.load_stream('walk', out)
+        self.assertEqual(json.loads(out.getvalue()), payload)
+
+    def test_preview_pages_fetch_only_prefixes(self):
+        """🧵 Pattern previews pipeline TYPE/STRLEN/GETRANGE instead of full GETs."""
+        self.client.set_key('seed:long', 'g' * 5000)
+        self.client.set_key('seed:short', 'sprout')
+        self.client.execute_command('RPUSH', 'seed:list', 'x')
+        operations = RedisOperations(self.client)
+
+        before = len(self.server.store.commands)
+        pages = list(operations.preview_pages('seed:*', page_size=2, preview_length=10))
+        entries = {entry['key']: entry for page in pages for entry in page}
+        self.assertEqual(sorted(entries), ['seed:list', 'seed:long', 'seed:short'])
+        self.assertEqual([len(page) for page in pages], [2, 1])
+        self.assertEqual(entries['seed:long']['preview'], 'g' * 10)
+        self.assertEqual(entries['seed:long']['size'], 5000)
+        self.assertTrue(entries['seed:long']['truncated'])
+        self.assertEqual(entries['seed:short']['preview'], 'sprout')
+        self.assertEqual(entries['seed:list']['type'], 'list')
+        self.assertIsNone(entries['seed:list']['preview'])
+        names = {c[0].upper() for c in self.server.store.commands[before:]}
+        self.assertNotIn(b'GET', names)
+
+
+class RestPipelineTests(PipelineContractMixin, unittest.TestCase):
+    """🧵 Pipelines over Upstash /pipeline."""
+
+    server_factory = partial(RestStandIn, token='tok')
+
+    def env_lines(self):
+        return f"KV_REST_API_URL={self.server.url}\nKV_REST_API_TOKEN=tok\n"
+
+    def test_single_round_trip(self):
+        """🧵 A whole batch costs one HTTP request."""
+        before = self.server.requests_seen
+        with self.client.pipeline() as pipe:
+            for i in range(50):
+                pipe.set_key(f'k{i}', str(i))
+        self.assertEqual(self.server.requests_seen - before, 1)
+
+
+class RespPipelineTests(PipelineContractMixin, unittest.TestCase):
+    """🧵 Pipelines as one socket write over RESP."""
+
+    server_factory = RespStandIn
+
+    def env_lines(self):
+        return f"REDIS_URL={self.server.url}\nREDIS_TOKEN=unused\n"
+
+
+if __name__ == "__main__":
+    unittest.main()
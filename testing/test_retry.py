@@ -0,0 +1,125 @@
+"""
+Retry and Circuit Breaker Tests
+🧵 Synth: Transient failures, backoff and fail-fast behaviour
+"""
+
+import unittest
+import tempfile
+import time
+import os
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from nyro.core.profiles import ProfileManager
+from nyro.core.client import RedisClient, RedisTransientError, CircuitOpenError
+from nyro.core.operations import RedisOperations
+from nyro.core.retry import CircuitBreaker, RetryPolicy, is_idempotent
+from testing.standins import RestStandIn
+
+
+class CircuitBreakerTests(unittest.TestCase):
+    """🧵 Breaker state machine."""
+
+    def test_opens_then_probes_then_closes(self):
+        """🧵 Threshold failures open the circuit; one probe after the cool-down."""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+        breaker.record_failure()
+        breaker.before_call()
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_call()
+
+        time.sleep(0.06)
+        breaker.before_call()
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_call()
+        breaker.record_success()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    def test_backoff_grows_with_jitter_and_cap(self):
+        """🧵 Delays double per attempt, stay within [ceiling/2, ceiling]."""
+        policy = RetryPolicy(retries=5, backoff=0.1, max_backoff=0.3)
+        for attempt, ceiling in ((1, 0.1), (2, 0.2), (3, 0.3), (5, 0.3)):
+            delay = policy.delay(attempt)
+            self.assertGreaterEqual(delay, ceiling / 2)
+            self.assertLessEqual(delay, ceiling)
+
+    def test_idempotency_classification(self):
+        """🧵 Reads and absolute writes retry; counters and appends do not."""
+        self.assertTrue(is_idempotent(['GET', 'k']))
+        self.assertTrue(is_idempotent([b'set', 'k', 'v']))
+        self.assertFalse(is_idempotent(['LPUSH', 'l', 'x']))
+        self.assertFalse(is_idempotent(['INCR', 'n']))
+
+        # Replies that depend on what the first attempt already changed
+        self.assertTrue(is_idempotent(['SET', 'k', 'nx', 'EX', '10']))
+        self.assertFalse(is_idempotent(['SET', 'k', 'v', 'NX']))
+        self.assertFalse(is_idempotent(['SET', 'k', 'v', b'get']))
+        self.assertTrue(is_idempotent(['EXPIRE', 'k', '10']))
+        self.assertFalse(is_idempotent(['EXPIRE', 'k', '10', 'NX']))
+
+        # Writes that reply with how much they changed report 0 on a retry
+        for command in (['DEL', 'k'], ['ZADD', 'z', '1', 'm'], ['SADD', 's', 'm'],
+                        ['HSET', 'h', 'f', 'v'], ['ZREM', 'z', 'm'], ['PERSIST', 'k']):
+            self.assertFalse(is_idempotent(command), command)
+
+
+class RestRetryTests(unittest.TestCase):
+    """🧵 Retry policy and breaker against a flaky REST stand-in."""
+
+    def setUp(self):
+        """Start REST stand-in with fast backoff settings."""
+        self.server = RestStandIn(token='rest_token')
+        self.temp_dir = tempfile.mkdtemp()
+        self.env_file = os.path.join(self.temp_dir, '.env')
+        with open(self.env_file, 'w') as f:
+            f.write(f"KV_REST_API_URL={self.server.url}\n"
+                    f"KV_REST_API_TOKEN=rest_token\n"
+                    f"NYRO_RETRIES=2\nNYRO_RETRY_BACKOFF=0.001\n"
+                    f"NYRO_BREAKER_THRESHOLD=4\nNYRO_BREAKER_RESET=60\n")
+        self.client = RedisClient(ProfileManager(self.env_file))
+        self.operations = RedisOperations(self.client)
+
+    def test_idempotent_commands_ride_out_5xx(self):
+        """🧵 Two 503s are absorbed by retries."""
+        self.server.fail_requests(2)
+        self.assertTrue(self.client.set_key('calm', 'after the storm'))
+        self.server.fail_requests(2)
+        self.assertEqual(self.client.get_key('calm'), 'after the storm')
+        self.assertEqual(self.client.get_retry_stats()['retries'], 4)
+
+    def test_non_idempotent_commands_are_not_retried(self):
+        """🧵 LPUSH fails once rather than risk a double push."""
+        self.server.fail_requests(1)
+        self.assertFalse(self.operations.push_list('once', 'x'))
+        self.assertEqual(self.operations.read_list('once'), [])
+
+    def test_breaker_fails_fast_and_reports_error(self):
+        """🧵 An outage opens the circuit; callers can tell it from a missing key."""
+        self.server.fail_requests(100)
+        with self.assertRaises(RedisTransientError):
+            self.client.execute_command('GET', 'k')
+        seen = self.server.requests_seen
+        self.assertIsNone(self.client.get_key('k'))
+        self.assertIsInstance(self.client.last_error, CircuitOpenError)
+        self.assertEqual(self.server.requests_seen, seen + 1)
+        self.assertEqual(self.client.get_retry_stats()['circuit'], 'open')
+
+        self.server.fail_requests(0)
+        self.assertIsNone(self.client.get_key('missing'))
+        self.assertIsInstance(self.client.last_error, CircuitOpenError)
+
+    def tearDown(self):
+        """Stop stand-in and clean up."""
+        import shutil
+        self.client.close()
+        self.server.stop()
+        shutil.rmtree(self.temp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
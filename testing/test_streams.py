@@ -0,0 +1,169 @@
+"""
+Stream Tests
+🧵 Synth: Paging through streams entry by entry on every transport
+"""
+
+import unittest
+import threading
+import time
+from functools import partial
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from nyro.core.client import RedisCommandError
+from testing.standins import RestStandIn, RespStandIn, StandInContractMixin
+
+
+class StreamContractMixin(StandInContractMixin):
+    """Shared stream expectations for every transport."""
+
+    def _fill(self, stream: str, count: int) -> list:
+        with self.client.pipeline() as pipe:
+            for i in range(count):
+                pipe.command('XADD', stream, f'{1000 + i}-0', 'note', f'entry {i}\nwith  spaces', 'n', str(i))
+        return pipe.results
+
+    def test_stream_iter_pages_through_range(self):
+        """🧵 Every entry comes back once, in order, a page per XRANGE."""
+        ids = self._fill('garden.diary', 250)
+        before = len(self.server.store.commands)
+        entries = list(self.operations.stream_iter('garden.diary', page_size=40))
+        self.assertEqual([entry['id'] for entry in entries], ids)
+        self.assertEqual(entries[7]['fields']['note'], 'entry 7\nwith  spaces')
+        calls = [c for c in self.server.store.commands[before:] if c[0].upper() == b'XRANGE']
+        self.assertEqual(len(calls), 7)
+
+        # Bounds are inclusive; a full last page costs one empty fetch
+        middle = list(self.operations.stream_iter('garden.diary', ids[10], ids[49], page_size=20))
+        self.assertEqual([entry['id'] for entry in middle], ids[10:50])
+        self.assertEqual(list(self.operations.stream_iter('absent.stream')), [])
+
+    def _xreads(self, before: int) -> list:
+        return [c for c in self.server.store.commands[before:] if c[0].upper() == b'XREAD']
+
+    def test_tail_follows_several_streams(self):
+        """🧵 tail yields new entries from every stream as they arrive, none from before."""
+        self._fill('garden.diary', 3)
+
+        def write_later():
+            time.sleep(0.3)
+            self.client.execute_command('XADD', 'garden.diary', '*', 'note', 'sprouted')
+            self.client.execute_command('XADD', 'garden.weather', '*', 'note', 'rain')
+            self.client.execute_command('XADD', 'garden.diary', '*', 'note', 'bloomed')
+
+        writer = threading.Thread(target=write_later)
+        writer.start()
+        seen = []
+        for entry in self.operations.tail(['garden.diary', 'garden.weather'], block=1.0, duration=10):
+            seen.append((entry['stream'], entry['fields']['note']))
+            if len(seen) == 3:
+                break
+        writer.join()
+        self.assertEqual([note for stream, note in seen if stream == 'garden.diary'], ['sprouted', 'bloomed'])
+        self.assertEqual([note for stream, note in seen if stream == 'garden.weather'], ['rain'])
+
+        # Explicit ids replay from there; the tail ends once duration runs out
+        started = time.monotonic()
+        replay = list(self.operations.tail('garden.diary', last_ids={'garden.diary': '1001-0'},
+                                           block=0.2, duration=0.6))
+        self.assertEqual([entry['fields']['note'] for entry in replay[1:]], ['sprouted', 'bloomed'])
+        self.assertEqual(replay[0]['id'], '1002-0')
+        self.assertLess(time.monotonic() - started, 3)
+
+    def test_consumer_group_delivery_and_ack(self):
+        """🧵 Group consumers split new entries; batched acks clear them from the pending list."""
+        ids = self._fill('musician:guitar1', 10)
+        self.assertTrue(self.operations.create_group('musician:guitar1', 'monitor_group', '0'))
+        self.assertFalse(self.operations.create_group('musician:guitar1', 'monitor_group'))
+
+        first = self.operations.read_group('monitor_group', 'guitar1-client', 'musician:guitar1', count=6)
+        second = self.operations.read_group('monitor_group', 'sax-client', 'musician:guitar1', count=6)
+        self.assertEqual([entry['id'] for entry in first], ids[:6])
+        self.assertEqual([entry['id'] for entry in second], ids[6:])
+        self.assertEqual((first[2]['stream'], first[2]['fields']['n']), ('musician:guitar1', '2'))
+        self.assertEqual(self.operations.read_group('monitor_group', 'sax-client', 'musician:guitar1'), [])
+
+        summary = self.operations.pending_summary('musician:guitar1', 'monitor_group')
+        self.assertEqual((summary['count'], summary['min_id'], summary['max_id']), (10, ids[0], ids[-1]))
+        self.assertEqual(summary['consumers'], {'guitar1-client': 6, 'sax-client': 4})
+
+        # Already-acked ids count once; six ids at four per XACK cost two commands
+        before = len(self.server.store.commands)
+        acked = self.operations.ack('musician:guitar1', 'monitor_group',
+                                    [entry['id'] for entry in first[1:]] + [ids[0]] * 2, batch_size=4)
+        self.assertEqual(acked, 6)
+        self.assertEqual(len([c for c in self.server.store.commands[before:] if c[0].upper() == b'XACK']), 2)
+        pending = self.operations.pending('musician:guitar1', 'monitor_group')
+        self.assertEqual([entry['id'] for entry in pending], ids[6:])
+        self.assertEqual({(entry['consumer'], entry['deliveries']) for entry in pending}, {('sax-client', 1)})
+
+        # Re-reading history returns the consumer's own unacked entries
+        again = self.operations.read_group('monitor_group', 'sax-client', 'musician:guitar1',
+                                           last_ids={'musician:guitar1': '0'})
+        self.assertEqual([entry['id'] for entry in again], ids[6:])
+
+        self.assertTrue(self.operations.destroy_group('musician:guitar1', 'monitor_group'))
+        with self.assertRaises(RedisCommandError):
+            self.operations.read_group('monitor_group', 'sax-client', 'musician:guitar1')
+
+    def test_claim_stuck_and_blocking_group_reads(self):
+        """🧵 Entries a crashed consumer never acked move to a live one; reads can wait for new ones."""
+        ids = self._fill('musician:vocalist', 5)
+        self.operations.create_group('musician:vocalist', 'monitor_group', '0')
+        self.operations.read_group('monitor_group', 'crashed-client', 'musician:vocalist')
+        self.assertEqual(list(self.operations.claim_stuck('musician:vocalist', 'monitor_group',
+                                                          'singer-client', min_idle=60)), [])
+
+        time.sleep(0.1)
+        claimed = list(self.operations.claim_stuck('musician:vocalist', 'monitor_group', 'singer-client',
+                                                   min_idle=0.05, count=2))
+        self.assertEqual([entry['id'] for entry in claimed], ids)
+        self.assertEqual(claimed[0]['stream'], 'musician:vocalist')
+        pending = self.operations.pending('musician:vocalist', 'monitor_group', consumer='singer-client')
+        self.assertEqual([(entry['id'], entry['deliveries']) for entry in pending], [(i, 2) for i in ids])
+        self.assertEqual(self.operations.pending('musician:vocalist', 'monitor_group', min_idle=60), [])
+
+        writer = threading.Timer(0.3, self.client.execute_command, ['XADD', 'musician:vocalist', '*', 'note', 'hum'])
+        writer.start()
+        waited = self.operations.read_group('monitor_group', 'singer-client', 'musician:vocalist', block=5.0)
+        writer.join()
+        self.assertEqual([entry['fields']['note'] for entry in waited], ['hum'])
+        started = time.monotonic()
+        self.assertEqual(self.operations.read_group('monitor_group', 'singer-client', 'musician:vocalist',
+                                                    block=0.3), [])
+        self.assertLess(time.monotonic() - started, 3)
+
+
+class RestStreamTests(StreamContractMixin, unittest.TestCase):
+    """🧵 Streams over REST."""
+
+    server_factory = partial(RestStandIn, token='tok')
+
+    def test_tail_polls_without_blocking(self):
+        """🧵 REST never holds a request open; idle polls back off."""
+        before = len(self.server.store.commands)
+        self.assertEqual(list(self.operations.tail('garden.quiet', block=5.0, duration=1.6)), [])
+        calls = self._xreads(before)
+        self.assertNotIn(b'BLOCK', [part.upper() for call in calls for part in call])
+        # 0.1 + 0.2 + 0.4 + 0.8 s of sleep: a handful of requests, not one per 100 ms
+        self.assertLessEqual(len(calls), 6)
+
+
+class RespStreamTests(StreamContractMixin, unittest.TestCase):
+    """🧵 Streams over RESP."""
+
+    server_factory = RespStandIn
+
+    def test_tail_blocks_server_side(self):
+        """🧵 RESP waits inside one XREAD BLOCK instead of polling."""
+        before = len(self.server.store.commands)
+        self.assertEqual(list(self.operations.tail('garden.quiet', block=5.0, duration=0.5)), [])
+        calls = self._xreads(before)
+        self.assertLessEqual(len(calls), 2)
+        self.assertIn(b'BLOCK', calls[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,219 @@
+"""
+Transport Tests
+🧵 Synth: Exercising the REST and RESP transports against local stand-ins
+"""
+
+import unittest
+import tempfile
+import os
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from nyro.core.profiles import ProfileManager
+from nyro.core.client import RedisClient, RedisCommandError
+from nyro.core.operations import RedisOperations
+from nyro.core.resp import RespReader, encode_command
+from testing.standins import RestStandIn, RespStandIn
+
+
+class RestTransportTests(unittest.TestCase):
+    """🧵 REST transport against an Upstash-style stand-in."""
+
+    def setUp(self):
+        """Start REST stand-in and point a profile at it."""
+        self.server = RestStandIn(token='rest_token')
+        self.temp_dir = tempfile.mkdtemp()
+        self.env_file = os.path.join(self.temp_dir, '.env')
+        with open(self.env_file, 'w') as f:
+            f.write(f"KV_REST_API_URL={self.server.url}\n"
+                    f"KV_REST_API_TOKEN=rest_token\n"
+                    f"NYRO_POOL_SIZE=4\n")
+        self.client = RedisClient(ProfileManager(self.env_file))
+        self.operations = RedisOperations(self.client)
+
+    def test_pool_size_from_env(self):
+        """🧵 NYRO_POOL_SIZE configures the per-profile pool."""
+        self.assertEqual(self.client._get_current_config().pool_size, 4)
+
+    def test_keep_alive_reuses_connection(self):
+        """🧵 Repeated commands reuse one pooled connection."""
+        self.assertTrue(self.client.set_key('greeting', 'hello'))
+        self.assertEqual(self.client.get_key('greeting'), 'hello')
+        self.operations.push_list('notes', 'one')
+        self.assertEqual(self.operations.read_list('notes'), ['one'])
+
+        stats = self.client.get_pool_stats()
+        self.assertEqual(stats['requests'], 4)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['hits'], 3)
+        self.assertEqual(stats['pool_size'], 4)
+
+    def test_execute_command_is_binary_safe(self):
+        """🧵 Binary values travel as raw bodies and return via base64 decoding."""
+        blob = bytes(range(256)) * 4
+        self.assertEqual(self.client.execute_command('SET', 'blob', memoryview(blob)), 'OK')
+        self.assertEqual(self.client.execute_command('GET', 'blob', raw=True), blob)
+        self.assertEqual(self.client.execute_command('RPUSH', 'mixed', 'text', 42), 2)
+        self.assertEqual(self.client.execute_command('LRANGE', 'mixed', 0, -1), ['text', '42'])
+        with self.assertRaises(RedisCommandError):
+            self.client.execute_command('GET', 'mixed')
+
+    def test_transport_resolved_once_per_profile(self):
+        """🧵 Calls reuse the resolved transport without re-reading the profile."""
+        from unittest.mock import patch
+        transport = self.client._transport()
+        self.assertEqual(transport.name, 'rest')
+        self.assertEqual(transport.json_headers['Authorization'], 'Bearer rest_token')
+        with patch.object(self.client.profile_manager, 'get_current_profile',
+                          side_effect=AssertionError("profile looked up per call")):
+            self.assertTrue(self.client.set_key('fast', 'path'))
+            self.assertEqual(self.operations.read_list('nothing'), [])
+        self.assertIs(self.client._transport(), transport)
+
+    def test_get_many_set_many_batches(self):
+        """🧵 MGET/MSET keep key order and send one request per bounded batch."""
+        mapping = {f'herb:{i}': f'leaf {i}' for i in range(7)}
+        seen = self.server.requests_seen
+        self.assertTrue(self.client.set_many(mapping, batch_size=3))
+        self.assertEqual(self.server.requests_seen - seen, 3)
+
+        keys = ['herb:6', 'missing', 'herb:0', 'herb:3']
+        seen = self.server.requests_seen
+        self.assertEqual(self.client.get_many(keys, batch_size=2), ['leaf 6', None, 'leaf 0', 'leaf 3'])
+        self.assertEqual(self.server.requests_seen - seen, 2)
+
+        # A byte budget splits batches too
+        seen = self.server.requests_seen
+        self.assertTrue(self.client.set_many({'a': 'x' * 60, 'b': 'y' * 60}, batch_bytes=100))
+        self.assertEqual(self.server.requests_seen - seen, 2)
+
+    def test_scan_iter_follows_cursor(self):
+        """🧵 scan_iter walks every page, scan_keys returns just the first."""
+        with self.client.pipeline() as pipe:
+            for i in range(250):
+                pipe.set_key(f'leaf:{i}', 'green')
+            pipe.command('RPUSH', 'leaf:list', 'x')
+        keys = list(self.client.scan_iter('leaf:*', count=40))
+        self.assertEqual(len(keys), 251)
+        self.assertLessEqual(len(self.client.scan_keys('leaf:*', 40)), 40)
+        self.assertEqual(self.operations.scan_garden('leaf:*', 40)['total_keys'], 251)
+
+    def tearDown(self):
+        """Stop stand-in and clean up."""
+        import shutil
+        self.client.close()
+        self.server.stop()
+        shutil.rmtree(self.temp_dir)
+
+
+class RespTransportTests(unittest.TestCase):
+    """🧵 Native RESP transport against a socket stand-in."""
+
+    def setUp(self):
+        """Start RESP stand-in and point a profile at it."""
+        self.server = RespStandIn(password='secret')
+        self.temp_dir = tempfile.mkdtemp()
+        self.env_file = os.path.join(self.temp_dir, '.env')
+        with open(self.env_file, 'w') as f:
+            f.write(f"REDIS_URL={self.server.url}\n"
+                    f"REDIS_TOKEN=unused\n"
+                    f"NYRO_RESP_PROTOCOL=3\n")
+        self.client = RedisClient(ProfileManager(self.env_file))
+        self.operations = RedisOperations(self.client)
+
+    def test_wire_encoding_roundtrip(self):
+        """🧵 Encoder and reader agree on RESP framing."""
+        import io
+        self.assertEqual(encode_command(('SET', 'k', b'v\r\n')), b'*3\r\n$3\r\nSET\r\n$1\r\nk\r\n$3\r\nv\r\n\r\n')
+        reader = RespReader(io.BytesIO(b'*3\r\n:1\r\n$-1\r\n%1\r\n+a\r\n#t\r\n'))
+        self.assertEqual(reader.read_reply(), [1, None, {'a': True}])
+
+    def test_values_with_newlines_survive(self):
+        """🧵 Multi-line values round-trip without redis-cli text scraping."""
+        value = "line one\nline two\r\n  indented"
+        self.assertTrue(self.client.test_connection())
+        self.assertTrue(self.client.set_key('poem', value))
+        self.assertEqual(self.client.get_key('poem'), value)
+        self.assertIn('poem', self.client.scan_keys('po*'))
+        self.assertTrue(self.client.delete_key('poem'))
+        self.assertIsNone(self.client.get_key('poem'))
+
+    def test_operations_and_connection_reuse(self):
+        """🧵 Operations share one pooled connection."""
+        self.assertTrue(self.operations.push_list('tasks', 'a b c', 'right'))
+        self.assertEqual(self.operations.read_list('tasks'), ['a b c'])
+        self.assertEqual(self.operations.get_list_length('tasks'), 1)
+        entry_id = self.operations.stream_add('garden.diary', {'event': 'rain fell', 'mood': 'calm'})
+        entries = self.operations.stream_read('garden.diary')
+        self.assertEqual(entries[0]['id'], entry_id)
+        self.assertEqual(entries[0]['fields']['event'], 'rain fell')
+
+        self.assertEqual(self.server.connections_opened, 1)
+        stats = self.client.get_pool_stats()
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['hits'], stats['requests'] - 1)
+
+    def test_execute_command_binary_over_resp(self):
+        """🧵 RESP carries bytes in both directions untouched."""
+        blob = b'\x00\xff\r\n' * 100
+        self.assertEqual(self.client.execute_command('SET', 'blob', blob), 'OK')
+        self.assertEqual(self.client.execute_command('GET', 'blob', raw=True), blob)
+
+    def test_legacy_base64_payload_still_loads(self):
+        """🧵 Chunked payloads written in the old base64 layout remain readable."""
+        import base64, json
+        data = json.dumps({'legacy': True}).encode('utf-8')
+        self.client.set_key('old:chunk:0', base64.b64encode(data[:5]).decode())
+        self.client.set_key('old:chunk:1', base64.b64encode(data[5:]).decode())
+        self.client.set_key('old:metadata', json.dumps({'type': 'chunked_payload', 'total_chunks': 2}))
+        self.assertEqual(self.operations.load_massive_payload('old'), {'legacy': True})
+
+    def test_get_many_over_resp(self):
+        """🧵 MGET over RESP returns values in key order."""
+        self.assertTrue(self.client.set_many({'moss': 'green', 'fern': 'tall'}))
+        self.assertEqual(self.client.get_many(['fern', 'nope', 'moss']), ['tall', None, 'green'])
+        self.assertEqual(self.client.get_many([]), [])
+
+    def test_scan_iter_type_filter(self):
+        """🧵 TYPE filtering is passed through to SCAN."""
+        self.client.set_key('seed:a', '1')
+        self.operations.push_list('seed:b', 'x')
+        self.assertEqual(sorted(self.client.scan_iter('seed:*', count=1)), ['seed:a', 'seed:b'])
+        self.assertEqual(list(self.client.scan_iter('seed:*', type='list')), ['seed:b'])
+
+    def test_cli_fallback_selected_by_profile(self):
+        """🧵 transport=cli keeps the redis-cli subprocess path."""
+        from unittest.mock import patch, Mock
+        config = self.client._get_current_config()
+        self.assertEqual(self.client._transport().name, 'resp')
+        config.transport = 'cli'
+
+        # Switching re-resolves the transport; redis-cli text is parsed into reply shapes
+        self.assertTrue(self.client.switch_profile('default'))
+        self.assertEqual(self.client._transport().name, 'cli')
+        self.assertFalse(self.client.supports_transactions())
+        with patch('subprocess.run', return_value=Mock(stdout='0\nseed:a\nseed:b\n')) as run:
+            self.assertEqual(self.client.scan_keys('seed:*'), ['seed:a', 'seed:b'])
+            self.assertIn('--no-auth-warning', run.call_args[0][0])
+        with patch('subprocess.run', return_value=Mock(stdout='3\n')):
+            self.assertEqual(self.operations.get_list_length('tasks'), 3)
+        with patch('subprocess.run', return_value=Mock(stdout='\nb\n\n')):
+            self.assertEqual(self.client.get_many(['x', 'y', 'z']), [None, 'b', None])
+        # Stream entries come back as JSON, so values keep their spaces and newlines
+        with patch('subprocess.run', return_value=Mock(stdout='[["1-0",["note","two words\\nand a line"]]]\n')) as run:
+            entries = list(self.operations.stream_iter('garden.diary'))
+            self.assertIn('--json', run.call_args[0][0])
+        self.assertEqual(entries, [{'id': '1-0', 'fields': {'note': 'two words\nand a line'}}])
+
+    def tearDown(self):
+        """Stop stand-in and clean up."""
+        import shutil
+        self.client.close()
+        self.server.stop()
+        shutil.rmtree(self.temp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
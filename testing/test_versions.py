@@ -0,0 +1,114 @@
+"""
+Payload Version Tests
+🧵 Synth: Atomic pointer swaps and the sweeper that clears replaced versions
+"""
+
+import unittest
+import time
+import json
+from functools import partial
+from pathlib import Path
+from unittest import mock
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from nyro.core.versions import VersionSweeper, chunk_prefix
+from testing.standins import RestStandIn, RespStandIn, StandInContractMixin
+
+
+def _payload(lines: int, word: str = 'line') -> dict:
+    return {'type': 'walking_payload', 'data': [f'{word} {i}' for i in range(lines)]}
+
+
+class VersionedPayloadContractMixin(StandInContractMixin):
+    """Shared version swap and sweep expectations for every transport."""
+
+    def _store(self, key: str, payload: dict) -> dict:
+        self.assertTrue(self.operations.store_massive_payload(key, payload, chunk_size=1000, batch_bytes=4000))
+        return json.loads(self.client.get_key(f'{key}:metadata'))
+
+    def _chunk_keys(self, key: str) -> list:
+        return sorted(name for name in self.client.scan_iter(f'{key}:*') if ':chunk:' in name)
+
+    def test_rewrite_keeps_old_version_until_swept(self):
+        """🧵 Readers holding the old pointer still find its chunks during the grace period."""
+        old = self._store('walk', _payload(3000))
+        new = self._store('walk', _payload(500, 'moss'))
+        self.assertNotEqual(old['version'], new['version'])
+        self.assertEqual(self.operations.load_massive_payload('walk'), _payload(500, 'moss'))
+
+        old_first_chunk = f"{chunk_prefix('walk', old['version'])}0"
+        self.assertIsNotNone(self.client.execute_command('GET', old_first_chunk))
+        self.assertEqual(self.operations.sweep_versions(grace_seconds=3600)['deleted'], 0)
+
+        # The shrunken payload leaves nothing behind once swept
+        self.assertEqual(self.operations.sweep_versions(grace_seconds=0), {'candidates': 1, 'deleted': 1})
+        self.assertEqual(len(self._chunk_keys('walk')), new['total_chunks'])
+        self.assertEqual(self.operations.load_massive_payload('walk'), _payload(500, 'moss'))
+
+    def test_pointer_moved_back_is_not_swept(self):
+        """🧵 Rewriting a retired version revives it; only the replaced one goes."""
+        first = self._store('walk', _payload(2000))
+        self._store('walk', _payload(2000, 'fern'))
+        self.assertEqual(self._store('walk', _payload(2000))['version'], first['version'])
+
+        self.assertEqual(self.operations.sweep_versions(grace_seconds=0)['deleted'], 1)
+        self.assertEqual(self.operations.load_massive_payload('walk'), _payload(2000))
+        self.assertEqual(len(self._chunk_keys('walk')), first['total_chunks'])
+
+    def test_failed_upload_is_retired(self):
+        """🧵 Chunks left by an upload that fails partway are cleared by the sweeper."""
+        execute = self.client.execute_command
+        batches = []
+
+        def flaky(*args, **kwargs):
+            if args[0] == 'MSET':
+                batches.append(args)
+                if len(batches) == 2:
+                    return None
+            return execute(*args, **kwargs)
+
+        with mock.patch.object(self.client, 'execute_command', side_effect=flaky):
+            self.assertFalse(self.operations.store_massive_payload('walk', _payload(3000), chunk_size=1000,
+                                                                   batch_bytes=4000, concurrency=1))
+        self.assertIsNone(self.client.get_key('walk:metadata'))
+        self.assertTrue(self._chunk_keys('walk'))
+        self.assertEqual(len(self.client.execute_command('ZRANGEBYSCORE', 'nyro:retired', '-inf', '+inf')), 1)
+
+        self.assertEqual(self.operations.sweep_versions(grace_seconds=0)['deleted'], 1)
+        self.assertEqual(self._chunk_keys('walk'), [])
+
+    def test_delete_and_background_sweeper(self):
+        """🧵 Deleted payloads are retired, then cleared by the sweeper thread."""
+        for i in range(3):
+            self._store(f'walk:{i}', _payload(1500, f'seed{i}'))
+            self.assertTrue(self.operations.delete_massive_payload(f'walk:{i}'))
+        self.assertIsNone(self.operations.load_massive_payload('walk:0'))
+
+        sweeper = VersionSweeper(self.operations, interval=0.05, grace_seconds=0, batch_size=2).start()
+        try:
+            deadline = time.time() + 5
+            while sweeper.deleted < 3 and time.time() < deadline:
+                time.sleep(0.02)
+        finally:
+            sweeper.stop()
+        self.assertIsNone(sweeper.error)
+        self.assertEqual(sweeper.deleted, 3)
+        self.assertEqual(self._chunk_keys('walk'), [])
+
+
+class RestVersionTests(VersionedPayloadContractMixin, unittest.TestCase):
+    """🧵 Versioned payloads over REST."""
+
+    server_factory = partial(RestStandIn, token='tok')
+
+
+class RespVersionTests(VersionedPayloadContractMixin, unittest.TestCase):
+    """🧵 Versioned payloads over RESP."""
+
+    server_factory = RespStandIn
+
+
+if __name__ == "__main__":
+    unittest.main()
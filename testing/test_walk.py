@@ -0,0 +1,224 @@
+"""
+Walking Payload Tests
+🧵 Synth: Incremental directory walks against a local manifest
+"""
+
+import unittest
+import tempfile
+import shutil
+import time
+import json
+import os
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from nyro.core.profiles import ProfileManager
+from nyro.core.client import RedisClient
+from nyro.core.operations import RedisOperations
+from nyro.core.walk import WalkManifest, IgnoreRules, IterableReader, apply_walking_delta
+from testing.standins import RestStandIn, RespStandIn
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    # Push mtimes out of the racy window so the manifest trusts them
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+class IncrementalWalkTests(unittest.TestCase):
+    """🧵 Manifest-driven walks skip unchanged files and emit deltas."""
+
+    def setUp(self):
+        """Create a small tree and a manifest location."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.tree = Path(self.temp_dir) / 'tree'
+        (self.tree / 'src').mkdir(parents=True)
+        for name, text in [('README.md', 'hello'), ('src/a.py', 'a = 1'), ('src/b.py', 'b = 2')]:
+            (self.tree / name).write_text(text)
+            _age(self.tree / name)
+        self.manifest_path = os.path.join(self.temp_dir, 'walk.json')
+        self.operations = RedisOperations(None)
+
+    def test_unchanged_files_are_trusted_from_manifest(self):
+        """🧵 Unchanged size and mtime skip the file in deltas; the manifest keeps no content."""
+        first = self.operations.create_walking_payload(str(self.tree), manifest_path=self.manifest_path)
+        self.assertEqual(first['metadata']['total_files'], 3)
+
+        manifest = WalkManifest.load(self.manifest_path, str(self.tree.absolute()))
+        self.assertEqual(sorted(manifest.entries), ['README.md', 'src/a.py', 'src/b.py'])
+        self.assertEqual(set(manifest.entries['src/a.py']), {'size', 'mtime_ns', 'hash'})
+
+        # Same size and mtime: the delta walk trusts the manifest and does not read the file
+        stat = (self.tree / 'src' / 'a.py').stat()
+        (self.tree / 'src' / 'a.py').write_text('a = 9')
+        os.utime(self.tree / 'src' / 'a.py', ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        delta = self.operations.create_walking_payload(str(self.tree), manifest_path=self.manifest_path, delta=True)
+        self.assertEqual(delta['changed'], [])
+
+        # Full walks still carry current content
+        second = self.operations.create_walking_payload(str(self.tree), manifest_path=self.manifest_path)
+        contents = {entry['path']: entry['content'] for entry in second['files']}
+        self.assertEqual(contents['src/a.py'], 'a = 9')
+
+    def test_delta_lists_added_changed_and_removed(self):
+        """🧵 Delta walks carry only what changed and rebuild the full payload."""
+        base = self.operations.create_walking_payload(str(self.tree), manifest_path=self.manifest_path)
+
+        (self.tree / 'src' / 'a.py').write_text('a = 10')
+        (self.tree / 'src' / 'c.py').write_text('c = 3')
+        (self.tree / 'src' / 'b.py').unlink()
+        # Touched but identical content is not a change
+        os.utime(self.tree / 'README.md')
+
+        delta = self.operations.create_walking_payload(str(self.tree), manifest_path=self.manifest_path, delta=True)
+        self.assertEqual(delta['type'], 'walking_payload_delta')
+        self.assertEqual(delta['base_timestamp'], base['timestamp'])
+        self.assertEqual([entry['path'] for entry in delta['added']], ['src/c.py'])
+        self.assertEqual([entry['path'] for entry in delta['changed']], ['src/a.py'])
+        self.assertEqual(delta['removed'], ['src/b.py'])
+
+        rebuilt = apply_walking_delta(base, delta)
+        full = self.operations.create_walking_payload(str(self.tree))
+        summary = lambda files: sorted((entry['path'], entry['content']) for entry in files)
+        self.assertEqual(summary(rebuilt['files']), summary(full['files']))
+        self.assertEqual(rebuilt['metadata']['total_size'], full['metadata']['total_size'])
+
+        # Nothing changed since the delta was taken
+        empty = self.operations.create_walking_payload(str(self.tree), manifest_path=self.manifest_path, delta=True)
+        self.assertEqual((empty['added'], empty['changed'], empty['removed']), ([], [], []))
+
+    def test_delta_requires_manifest(self):
+        """🧵 Deltas need a manifest to compare against."""
+        with self.assertRaises(ValueError):
+            self.operations.create_walking_payload(str(self.tree), delta=True)
+
+    def tearDown(self):
+        """Clean up the tree and manifest."""
+        shutil.rmtree(self.temp_dir)
+
+
+class TreeScanTests(unittest.TestCase):
+    """🧵 Ignore rules, ordering and the global size budget."""
+
+    def setUp(self):
+        """Create a tree with ignorable directories."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.tree = Path(self.temp_dir)
+        files = {
+            '.gitignore': 'build/\n*.log\n!keep.log\n',
+            'app/main.py': 'x' * 100,
+            'app/debug.log': 'noise',
+            'app/keep.log': 'kept',
+            'app/sub/.gitignore': '/local.txt\n',
+            'app/sub/local.txt': 'ignored here',
+            'app/sub/util.py': 'y' * 100,
+            'local.txt': 'not ignored at the root',
+            'build/out.py': 'generated',
+            'node_modules/pkg/index.js': 'vendored',
+            'env/pyvenv.cfg': 'home = /usr',
+            'env/lib/site.py': 'virtualenv',
+            'zeta.md': 'z' * 100,
+        }
+        for name, text in files.items():
+            (self.tree / name).parent.mkdir(parents=True, exist_ok=True)
+            (self.tree / name).write_text(text)
+        self.operations = RedisOperations(None)
+
+    def _paths(self, payload):
+        return [entry['path'] for entry in payload['files']]
+
+    def test_ignore_rules_and_order(self):
+        """🧵 Excluded paths are skipped and the order is reproducible."""
+        payload = self.operations.create_walking_payload(str(self.tree), excludes=['*.md'])
+        self.assertEqual(self._paths(payload), [
+            '.gitignore', 'app/keep.log', 'app/main.py', 'app/sub/.gitignore', 'app/sub/util.py', 'local.txt',
+        ])
+        serial = self.operations.create_walking_payload(str(self.tree), excludes=['*.md'], workers=1)
+        self.assertEqual(serial['files'], payload['files'])
+
+        everything = self.operations.create_walking_payload(str(self.tree), gitignore=False)
+        self.assertIn('build/out.py', self._paths(everything))
+        self.assertNotIn('node_modules/pkg/index.js', self._paths(everything))
+        self.assertNotIn('env/lib/site.py', self._paths(everything))
+
+    def test_budget_applies_to_whole_walk(self):
+        """🧵 Once the budget is spent no later directory adds files."""
+        (self.tree / 'app' / 'main.py').write_text('x' * (1024 * 1024))
+        payload = self.operations.create_walking_payload(str(self.tree), max_size_mb=1)
+        self.assertTrue(payload['metadata']['truncated'])
+        self.assertEqual(self._paths(payload), ['.gitignore', 'app/keep.log'])
+
+    def test_gitignore_patterns(self):
+        """🧵 Anchoring, directory-only and ** patterns follow gitignore."""
+        rules = IgnoreRules().extend(['/top.txt', 'docs/**/draft.md', 'cache/', '\\#notes'])
+        self.assertTrue(rules.ignored('top.txt', False))
+        self.assertFalse(rules.ignored('a/top.txt', False))
+        self.assertTrue(rules.ignored('docs/draft.md', False))
+        self.assertTrue(rules.ignored('docs/a/b/draft.md', False))
+        self.assertTrue(rules.ignored('x/cache', True))
+        self.assertFalse(rules.ignored('x/cache', False))
+        self.assertTrue(rules.ignored('#notes', False))
+
+    def tearDown(self):
+        """Clean up the tree."""
+        shutil.rmtree(self.temp_dir)
+
+
+class StreamingWalkTests(unittest.TestCase):
+    """🧵 Walking payloads serialized and uploaded entry by entry."""
+
+    def setUp(self):
+        """Create a tree of a few hundred files."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.tree = Path(self.temp_dir) / 'tree'
+        for i in range(300):
+            path = self.tree / f'pkg{i % 7}' / f'mod{i}.py'
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(f'# module {i}\n' + 'value = "é"\n' * (i % 40))
+        self.servers = []
+        self.clients = []
+
+    def _without_timestamp(self, payload):
+        return {name: value for name, value in payload.items() if name != 'timestamp'}
+
+    def test_streamed_json_matches_payload(self):
+        """🧵 The JSON pieces parse to the same payload as the dict builder."""
+        operations = RedisOperations(None)
+        streamed = json.loads(b''.join(operations.iter_walking_json(str(self.tree))))
+        built = operations.create_walking_payload(str(self.tree))
+        self.assertEqual(self._without_timestamp(streamed), self._without_timestamp(built))
+        self.assertEqual(streamed['metadata']['total_files'], 300)
+
+        reader = IterableReader([b'ab', b'', b'cde'])
+        self.assertEqual([reader.read(2), reader.read(2), reader.read(2), reader.read(2)], [b'ab', b'cd', b'e', b''])
+
+    def test_store_walking_payload_round_trip(self):
+        """🧵 Streamed walks load back with load_massive_payload on each transport."""
+        for server in (RestStandIn(token='tok'), RespStandIn()):
+            self.servers.append(server)
+            env_file = os.path.join(self.temp_dir, f'{len(self.servers)}.env')
+            with open(env_file, 'w') as f:
+                f.write(f"REDIS_URL={server.url}\nREDIS_TOKEN=tok\n")
+            client = RedisClient(ProfileManager(env_file))
+            self.clients.append(client)
+            operations = RedisOperations(client)
+
+            stored = operations.store_walking_payload('walk:stream', str(self.tree), chunk_size=4096)
+            self.assertGreater(operations.get_transfer_stats()['chunks'], stored // 4096)
+            loaded = operations.load_massive_payload('walk:stream')
+            built = operations.create_walking_payload(str(self.tree))
+            self.assertEqual(self._without_timestamp(loaded), self._without_timestamp(built))
+
+    def tearDown(self):
+        """Stop stand-ins and clean up."""
+        for client in self.clients:
+            client.close()
+        for server in self.servers:
+            server.stop()
+        shutil.rmtree(self.temp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()